@@ -0,0 +1,83 @@
+"""
+Import-time benchmark for datacmp.
+
+Measures the wall time of ``import datacmp`` and ``datacmp --help`` in fresh
+interpreters and fails if the median exceeds its budget or if heavy optional
+modules (matplotlib, seaborn, tabulate, yaml) are loaded eagerly.
+
+Usage:
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py --runs 20 --import-budget 0.05
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+# Modules that must only load when the feature using them runs
+LAZY_MODULES = ("matplotlib", "seaborn", "tabulate", "yaml", "pandas")
+
+DEFAULT_IMPORT_BUDGET = 0.1
+DEFAULT_HELP_BUDGET = 0.25
+
+
+def _time_command(args, runs):
+    """Median wall time of running a command in fresh interpreters."""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(args, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def _eagerly_loaded(statement):
+    """Heavy modules present in sys.modules after running a statement."""
+    probe = (
+        f"import sys; {statement}; "
+        f"print(','.join(m for m in {LAZY_MODULES!r} if m in sys.modules))"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", probe], check=True, capture_output=True, text=True
+    ).stdout.strip()
+    return [name for name in output.split(",") if name]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=10, help="Runs per measurement (default: 10)")
+    parser.add_argument("--import-budget", type=float, default=DEFAULT_IMPORT_BUDGET,
+                        help=f"Seconds allowed for `import datacmp` (default: {DEFAULT_IMPORT_BUDGET})")
+    parser.add_argument("--help-budget", type=float, default=DEFAULT_HELP_BUDGET,
+                        help=f"Seconds allowed for `datacmp --help` (default: {DEFAULT_HELP_BUDGET})")
+    args = parser.parse_args()
+
+    # Interpreter startup alone, subtracted so budgets measure datacmp itself
+    baseline = _time_command([sys.executable, "-c", "pass"], args.runs)
+
+    checks = [
+        ("import datacmp", [sys.executable, "-c", "import datacmp"], args.import_budget),
+        ("datacmp --help", [sys.executable, "-m", "datacmp.cli.commands", "--help"], args.help_budget),
+    ]
+
+    failed = False
+    print(f"interpreter startup: {baseline * 1000:.1f} ms (subtracted)")
+    for name, command, budget in checks:
+        elapsed = max(0.0, _time_command(command, args.runs) - baseline)
+        ok = elapsed <= budget
+        failed |= not ok
+        print(f"{name:<16} {elapsed * 1000:8.1f} ms  budget {budget * 1000:.0f} ms  {'ok' if ok else 'OVER BUDGET'}")
+
+    for statement in ("import datacmp", "import datacmp.cli.commands"):
+        loaded = _eagerly_loaded(statement)
+        if loaded:
+            failed = True
+            print(f"{statement!r} eagerly imports: {', '.join(loaded)}")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,9 +6,14 @@ GitHub: https://github.com/MoustafaMohamed01/datacmp
 License: MIT
 """
 
-from .core.datacmp import DataCmp
-from .pipeline.runner import run_pipeline
-from .pipeline.config import load_config, save_config
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .core.datacmp import DataCmp
+    from .pipeline.runner import run_pipeline
+    from .pipeline.batch import run_batch
+    from .pipeline.config import load_config, save_config
 
 __version__ = "3.0.0"
 __author__ = "Moustafa Mohamed"
@@ -17,6 +22,29 @@ __email__ = "moustafa.mh.mohamed@gmail.com"
 __all__ = [
     "DataCmp",
     "run_pipeline",
+    "run_batch",
     "load_config",
     "save_config",
-]
\ No newline at end of file
+]
+
+# Public names are imported on first access, so ``import datacmp`` (and the
+# CLI) does not pay for pandas, matplotlib or seaborn until they are used
+_LAZY_ATTRIBUTES = {
+    "DataCmp": ".core.datacmp",
+    "run_pipeline": ".pipeline.runner",
+    "run_batch": ".pipeline.batch",
+    "load_config": ".pipeline.config",
+    "save_config": ".pipeline.config",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
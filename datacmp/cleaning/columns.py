@@ -3,7 +3,7 @@ Column name cleaning utilities.
 """
 
 import logging
-from typing import Tuple, List
+from typing import Tuple, List, Sequence
 import pandas as pd
 
 from ..utils.logger import get_logger
@@ -30,18 +30,13 @@ def clean_column_names(df: pd.DataFrame) -> Tuple[pd.DataFrame, List[str]]:
     Example:
         >>> df, log = clean_column_names(df)
     """
-    df = df.copy()
+    # Shallow copy: renaming only touches the column index, never the data
+    df = df.copy(deep=False)
     original_columns = df.columns.tolist()
     log = []
     
     # Clean column names
-    df.columns = (
-        df.columns
-        .str.strip()
-        .str.lower()
-        .str.replace(' ', '_')
-        .str.replace('[^a-z0-9_]', '', regex=True)
-    )
+    df.columns = standardize_column_names(original_columns)
     
     cleaned_columns = df.columns.tolist()
     
@@ -52,4 +47,29 @@ def clean_column_names(df: pd.DataFrame) -> Tuple[pd.DataFrame, List[str]]:
             logger.info(msg)
             log.append(msg)
     
-    return df, log
\ No newline at end of file
+    return df, log
+
+
+def standardize_column_names(columns: Sequence[str]) -> List[str]:
+    """
+    Apply the column name cleaning rules to a list of names.
+    
+    Args:
+        columns: Original column names
+    
+    Returns:
+        Cleaned column names, in the same order
+    
+    Example:
+        >>> standardize_column_names(["First Name", "Age (years)"])
+        ['first_name', 'age_years']
+    """
+    return (
+        pd.Index(columns, dtype=object)
+        .astype(str)
+        .str.strip()
+        .str.lower()
+        .str.replace(' ', '_')
+        .str.replace('[^a-z0-9_]', '', regex=True)
+        .tolist()
+    )
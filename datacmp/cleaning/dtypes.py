@@ -0,0 +1,148 @@
+"""
+Data type optimization utilities.
+"""
+
+import logging
+from typing import Tuple, List, Dict, Any, Optional
+import pandas as pd
+import numpy as np
+
+from ..utils.logger import get_logger
+from ..utils.parallel import map_column_batches
+
+logger = get_logger(__name__)
+
+# Text columns with at most this share of distinct values become categoricals
+DEFAULT_CATEGORICAL_THRESHOLD = 0.5
+
+_INTEGER_TYPES = (np.int8, np.int16, np.int32)
+
+
+def optimize_dtypes(
+    df: pd.DataFrame,
+    config: Optional[Dict[str, Any]] = None,
+    workers: Optional[int] = 1
+) -> Tuple[pd.DataFrame, List[str]]:
+    """
+    Shrink the memory footprint of a DataFrame without changing its values.
+
+    - integer columns are downcast to the smallest signed type holding their range
+    - float64 columns become float32 when every value converts exactly (or
+      always, with ``float32: true``)
+    - text columns with at most ``categorical_threshold`` distinct values per
+      row become ``category``
+    - with ``pyarrow_strings: true``, the remaining text columns use
+      pyarrow-backed strings (requires pyarrow)
+
+    Args:
+        df: Input DataFrame
+        config: ``cleaning.optimize_dtypes`` configuration
+        workers: Threads used to inspect column batches concurrently
+            (-1 for all cores)
+
+    Returns:
+        Tuple of (optimized DataFrame, list of log messages)
+
+    Example:
+        >>> df, log = optimize_dtypes(df, {"categorical_threshold": 0.1})
+    """
+    config = config or {}
+    log = []
+
+    threshold = config.get("categorical_threshold", DEFAULT_CATEGORICAL_THRESHOLD)
+    force_float32 = config.get("float32", False)
+    pyarrow_strings = config.get("pyarrow_strings", False)
+
+    if pyarrow_strings:
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            logger.warning("pyarrow is not installed; keeping text columns as they are")
+            pyarrow_strings = False
+
+    def batch_dtypes(cols: list) -> Dict[Any, str]:
+        return {
+            col: dtype for col in cols
+            if (dtype := _optimal_dtype(df[col], threshold, force_float32, pyarrow_strings)) is not None
+        }
+
+    targets: Dict[Any, str] = {}
+    for batch in map_column_batches(batch_dtypes, df.columns, workers=workers):
+        targets.update(batch)
+
+    if not targets:
+        return df, log
+
+    memory_before = df.memory_usage(deep=True).sum()
+
+    # Shallow copy: converted columns are replaced, the input is never modified
+    df = df.copy(deep=False)
+    for col, dtype in targets.items():
+        df[col] = df[col].astype(dtype)
+
+    memory_after = df.memory_usage(deep=True).sum()
+
+    kinds = pd.Series([_kind(dtype) for dtype in targets.values()]).value_counts()
+    msg = (
+        f"Optimized dtypes of {len(targets)} columns "
+        f"({', '.join(f'{count} {kind}' for kind, count in kinds.items())}): "
+        f"memory {memory_before / 1024**2:.2f} MB → {memory_after / 1024**2:.2f} MB"
+    )
+    logger.info(msg)
+    log.append(msg)
+
+    return df, log
+
+
+def _optimal_dtype(
+    series: pd.Series,
+    threshold: float,
+    force_float32: bool,
+    pyarrow_strings: bool
+) -> Optional[str]:
+    """Smallest dtype that holds a column's values exactly (None to keep it)."""
+    dtype = series.dtype
+
+    if pd.api.types.is_bool_dtype(dtype) or isinstance(dtype, pd.CategoricalDtype):
+        return None
+
+    if pd.api.types.is_integer_dtype(dtype) and isinstance(dtype, np.dtype):
+        if len(series) == 0:
+            return None
+        low, high = series.min(), series.max()
+        for candidate in _INTEGER_TYPES:
+            info = np.iinfo(candidate)
+            if candidate().itemsize < dtype.itemsize and info.min <= low and high <= info.max:
+                return np.dtype(candidate).name
+        return None
+
+    if dtype == np.float64:
+        if force_float32:
+            return "float32"
+        values = series.to_numpy()
+        with np.errstate(over="ignore"):
+            exact = np.array_equal(values.astype(np.float32), values, equal_nan=True)
+        return "float32" if exact else None
+
+    if pd.api.types.is_object_dtype(dtype) or pd.api.types.is_string_dtype(dtype):
+        try:
+            distinct = series.nunique()
+        except TypeError:
+            # Unhashable values (lists, dicts) cannot be categories
+            return None
+        if len(series) and distinct <= threshold * len(series):
+            return "category"
+        already_arrow = getattr(dtype, "storage", None) == "pyarrow"
+        if pyarrow_strings and not already_arrow and pd.api.types.infer_dtype(series, skipna=True) == "string":
+            return "string[pyarrow]"
+
+    return None
+
+
+def _kind(dtype: str) -> str:
+    """Label of a conversion for the cleaning log."""
+    if dtype == "category":
+        return "categorical"
+    if dtype.startswith("string"):
+        return "string"
+    return "numeric"
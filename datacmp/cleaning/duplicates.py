@@ -0,0 +1,333 @@
+"""
+Duplicate row detection utilities.
+
+Rows are identified by a vectorized 64-bit fingerprint (one hash per row,
+optionally over a subset of key columns). Fingerprints are computed once and
+reused for de-duplication and for duplicate counts in the statistics, and a
+``FingerprintSet`` remembers them across chunks and files.
+"""
+
+import logging
+import shutil
+import tempfile
+import weakref
+from pathlib import Path
+from typing import Tuple, List, Dict, Any, Optional, Sequence, Union
+import pandas as pd
+import numpy as np
+
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Partitions of a FingerprintSet (selected by the top bits of the hash)
+DEFAULT_PARTITIONS = 16
+
+# Sorted runs with at least this many fingerprints are spilled to disk when
+# a spill directory is configured (8 MB per run)
+DEFAULT_SPILL_RUN_SIZE = 1 << 20
+
+# Column hash of a missing value, whatever the column dtype
+_MISSING_HASH = np.uint64(0x9E3779B97F4A7C15)
+
+# Mixed into the hashes of numbers that are not int64 values (fractional
+# floats and unsigned integers of 2^63 or more), so they never share the bit
+# pattern hashed for an int64
+_FLOAT_TAG = np.uint64(0xC2B2AE3D27D4EB4F)
+_HIGH_TAG = np.uint64(0x165667B19E3779F9)
+
+
+def duplicate_settings(config: Dict[str, Any]) -> Tuple[bool, Optional[List[str]]]:
+    """
+    Read the ``drop_duplicates`` setting.
+
+    ``drop_duplicates`` is either a boolean or a mapping such as
+    ``{subset: [customer_id, date]}`` (optionally with ``enabled: false``).
+
+    Args:
+        config: Full DataCmp configuration
+
+    Returns:
+        Tuple of (enabled, key columns or None for whole rows)
+    """
+    setting = config.get("drop_duplicates", True)
+    if isinstance(setting, dict):
+        subset = setting.get("subset")
+        return bool(setting.get("enabled", True)), list(subset) if subset else None
+    return bool(setting), None
+
+
+def row_fingerprints(
+    df: pd.DataFrame,
+    subset: Optional[Sequence] = None
+) -> np.ndarray:
+    """
+    Compute a 64-bit fingerprint of every row.
+
+    Fingerprints depend on the values only, not on the dtypes a chunk or
+    partition happened to be read with: integers are hashed exactly, as are
+    floats holding an integral value (so ``1`` and ``1.0`` are equal), text
+    as Python strings, booleans as Python bools, datetimes at nanosecond
+    resolution and every missing value alike. Equal rows therefore get equal
+    fingerprints across chunks and files; different rows collide with
+    probability about 2^-64 per pair.
+
+    Args:
+        df: Input DataFrame
+        subset: Key columns to fingerprint (default: all columns)
+
+    Returns:
+        uint64 array with one fingerprint per row
+
+    Example:
+        >>> hashes = row_fingerprints(df, subset=["customer_id", "date"])
+    """
+    if subset is not None:
+        missing = [col for col in subset if col not in df.columns]
+        if missing:
+            raise ValueError(f"Duplicate subset columns not found: {missing}")
+        df = df[list(subset)]
+
+    # Combined like pandas' hash_pandas_object, from canonical column hashes
+    fingerprints = np.full(len(df), 0x345678, dtype=np.uint64)
+    multiplier = np.uint64(1000003)
+    for position in range(df.shape[1]):
+        fingerprints ^= _column_hashes(df.iloc[:, position])
+        fingerprints *= multiplier
+        multiplier += np.uint64(82520 + 2 * (df.shape[1] - position))
+    return fingerprints + np.uint64(97531)
+
+
+def _column_hashes(series: pd.Series) -> np.ndarray:
+    """Hash of every value of a column, independent of the column dtype."""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        series = series.astype(series.cat.categories.dtype)
+    if pd.api.types.is_bool_dtype(series):
+        series = series.astype(object)
+    elif pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_complex_dtype(series):
+        hashes = _number_hashes(series)
+        missing = series.isna().to_numpy()
+        hashes[missing] = _MISSING_HASH
+        return hashes
+    elif pd.api.types.is_datetime64_any_dtype(series):
+        series = series.dt.as_unit("ns")
+    # Text is hashed by value for object, str and string columns alike
+    hashes = pd.util.hash_pandas_object(series, index=False).to_numpy()
+    missing = series.isna().to_numpy()
+    if missing.any():
+        hashes = hashes.copy()
+        hashes[missing] = _MISSING_HASH
+    return hashes
+
+
+def _number_hashes(series: pd.Series) -> np.ndarray:
+    """
+    Hash of every number, equal for equal values whatever the dtype.
+
+    Integers and integral floats are hashed as the exact integer; other
+    floats are hashed by their float64 bits. Missing values get arbitrary
+    hashes, to be overwritten by the caller.
+    """
+    if pd.api.types.is_unsigned_integer_dtype(series):
+        unsigned = series.to_numpy(dtype=np.uint64, na_value=0)
+        high = unsigned >= np.uint64(1 << 63)
+        fractional = np.zeros(len(unsigned), dtype=bool)
+        hashes = pd.util.hash_array(unsigned)
+    elif pd.api.types.is_integer_dtype(series):
+        high = fractional = np.zeros(len(series), dtype=bool)
+        hashes = pd.util.hash_array(series.to_numpy(dtype=np.int64, na_value=0))
+    else:
+        values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+        with np.errstate(invalid="ignore"):
+            integral = np.isfinite(values) & (values == np.trunc(values))
+            integral &= (values >= -2.0 ** 63) & (values < 2.0 ** 64)
+        high = integral & (values >= 2.0 ** 63)
+        signed = integral & ~high
+        fractional = ~integral
+        keys = np.zeros(len(values), dtype=np.uint64)
+        # -0.0 becomes 0, like the integer it equals
+        keys[signed] = values[signed].astype(np.int64).view(np.uint64)
+        keys[high] = values[high].astype(np.uint64)
+        keys[fractional] = values[fractional].view(np.uint64)
+        hashes = pd.util.hash_array(keys)
+    # Fractional floats and integers above the int64 range must not share a
+    # hash with the int64 of the same bit pattern
+    for mask, tag in ((fractional, _FLOAT_TAG), (high, _HIGH_TAG)):
+        if mask.any():
+            hashes[mask] = pd.util.hash_array(hashes[mask] ^ tag)
+    return hashes
+
+
+def first_occurrences(fingerprints: np.ndarray) -> np.ndarray:
+    """Mask of the rows whose fingerprint has not appeared earlier."""
+    return ~pd.Series(fingerprints).duplicated().to_numpy()
+
+
+def count_duplicates(fingerprints: np.ndarray) -> int:
+    """Number of rows repeating an earlier row's fingerprint."""
+    return int(len(fingerprints) - first_occurrences(fingerprints).sum())
+
+
+def drop_duplicates(
+    df: pd.DataFrame,
+    subset: Optional[Sequence] = None,
+    fingerprints: Optional[np.ndarray] = None
+) -> Tuple[pd.DataFrame, List[str]]:
+    """
+    Drop repeated rows, keeping the first occurrence.
+
+    Args:
+        df: Input DataFrame
+        subset: Key columns identifying a row (default: all columns)
+        fingerprints: Precomputed ``row_fingerprints(df, subset)`` to reuse
+
+    Returns:
+        Tuple of (de-duplicated DataFrame, list of log messages)
+
+    Example:
+        >>> df, log = drop_duplicates(df, subset=["order_id"])
+    """
+    log = []
+
+    if fingerprints is None:
+        fingerprints = row_fingerprints(df, subset)
+
+    keep = first_occurrences(fingerprints)
+    dropped = int(len(keep) - keep.sum())
+    if dropped > 0:
+        df = df[keep]
+        msg = f"Removed {dropped} duplicate rows"
+        if subset is not None:
+            msg += f" (by {', '.join(map(str, subset))})"
+        logger.info(msg)
+        log.append(msg)
+
+    return df, log
+
+
+class FingerprintSet:
+    """
+    Exact set of 64-bit row fingerprints for de-duplication across chunks.
+
+    Fingerprints are split into partitions by their top bits. Each partition
+    keeps its members in sorted runs of geometrically growing size, so
+    membership is a binary search per run and inserts are amortized
+    O(log n). With ``spill_dir``, runs of ``spill_run_size`` fingerprints or
+    more are written to ``.npy`` files and memory-mapped, so resident memory
+    is bounded by the small in-memory runs and the largest merge (about one
+    partition); spilled files are deleted by ``close()`` (or when the set is
+    garbage-collected).
+
+    Example:
+        >>> with FingerprintSet(spill_dir="/scratch") as seen:
+        ...     for chunk in chunks:
+        ...         chunk = chunk[seen.add(row_fingerprints(chunk))]
+    """
+
+    def __init__(
+        self,
+        partitions: int = DEFAULT_PARTITIONS,
+        spill_dir: Optional[Union[str, Path]] = None,
+        spill_run_size: int = DEFAULT_SPILL_RUN_SIZE
+    ):
+        if partitions < 1 or partitions & (partitions - 1):
+            raise ValueError("partitions must be a power of two")
+        self._shift = np.uint64(64 - (partitions.bit_length() - 1))
+        self._runs: List[List[np.ndarray]] = [[] for _ in range(partitions)]
+        self._size = 0
+        self._spill_run_size = spill_run_size
+        self._spill_dir = None
+        self._spilled = 0
+        if spill_dir:
+            self._spill_dir = Path(tempfile.mkdtemp(prefix="datacmp-fingerprints-", dir=spill_dir))
+            # Spilled runs are removed even if the set is never closed
+            self._cleanup = weakref.finalize(self, shutil.rmtree, self._spill_dir, True)
+
+    def _partition(self, fingerprints: np.ndarray) -> np.ndarray:
+        if len(self._runs) == 1:
+            return np.zeros(len(fingerprints), dtype=np.intp)
+        return (fingerprints >> self._shift).astype(np.intp)
+
+    def _split(self, fingerprints: np.ndarray):
+        """Yield (partition, positions) for every non-empty partition."""
+        partition = self._partition(fingerprints)
+        order = np.argsort(partition, kind="stable")
+        bounds = np.searchsorted(partition[order], np.arange(len(self._runs) + 1))
+        for p in range(len(self._runs)):
+            if bounds[p] < bounds[p + 1]:
+                yield p, order[bounds[p]:bounds[p + 1]]
+
+    @staticmethod
+    def _seen(runs: List[np.ndarray], fingerprints: np.ndarray) -> np.ndarray:
+        seen = np.zeros(len(fingerprints), dtype=bool)
+        for run in runs:
+            positions = np.searchsorted(run, fingerprints).clip(max=len(run) - 1)
+            seen |= run[positions] == fingerprints
+        return seen
+
+    def contains(self, fingerprints: np.ndarray) -> np.ndarray:
+        """Mask of the fingerprints already in the set."""
+        fingerprints = np.asarray(fingerprints, dtype=np.uint64)
+        seen = np.zeros(len(fingerprints), dtype=bool)
+        for p, positions in self._split(fingerprints):
+            seen[positions] = self._seen(self._runs[p], fingerprints[positions])
+        return seen
+
+    def add(self, fingerprints: np.ndarray) -> np.ndarray:
+        """
+        Add fingerprints to the set.
+
+        Returns:
+            Mask of the rows that are new: not in the set before and not
+            repeating an earlier row of the same batch
+        """
+        fingerprints = np.asarray(fingerprints, dtype=np.uint64)
+        new = first_occurrences(fingerprints)
+        for p, positions in self._split(fingerprints):
+            positions = positions[new[positions]]
+            is_new = ~self._seen(self._runs[p], fingerprints[positions])
+            new[positions[~is_new]] = False
+            self._insert(p, np.sort(fingerprints[positions[is_new]]))
+        return new
+
+    def _insert(self, p: int, run: np.ndarray) -> None:
+        if len(run) == 0:
+            return
+        self._size += len(run)
+        runs = self._runs[p]
+        runs.append(run)
+        while len(runs) > 1 and len(runs[-2]) <= 2 * len(runs[-1]):
+            last, previous = runs.pop(), runs[-1]
+            runs[-1] = self._store(np.sort(np.concatenate([previous, last])))
+            for merged in (previous, last):
+                if isinstance(merged, np.memmap):
+                    Path(merged.filename).unlink(missing_ok=True)
+
+    def _store(self, run: np.ndarray) -> np.ndarray:
+        """Spill a large run to disk and return its memory map."""
+        if self._spill_dir is None or len(run) < self._spill_run_size:
+            return run
+        path = self._spill_dir / f"run-{self._spilled}.npy"
+        self._spilled += 1
+        np.save(path, run)
+        return np.load(path, mmap_mode="r")
+
+    def __len__(self) -> int:
+        return self._size
+
+    def close(self) -> None:
+        """Release all fingerprints and delete spilled runs."""
+        self._runs = [[] for _ in self._runs]
+        self._size = 0
+        if self._spill_dir is not None:
+            self._cleanup()
+            self._spill_dir = None
+
+    def __enter__(self) -> "FingerprintSet":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"FingerprintSet(size={self._size}, partitions={len(self._runs)})"
@@ -3,24 +3,33 @@ Missing value handling utilities.
 """
 
 import logging
-from typing import Tuple, List, Dict, Any
+from typing import Tuple, List, Dict, Any, Optional
 import pandas as pd
 
 from ..utils.logger import get_logger
+from ..utils.parallel import map_column_batches
 
 logger = get_logger(__name__)
 
 
 def handle_missing_values(
     df: pd.DataFrame,
-    config: Dict[str, Any]
+    config: Dict[str, Any],
+    workers: Optional[int] = 1
 ) -> Tuple[pd.DataFrame, List[str]]:
     """
     Handle missing values based on configuration.
     
+    The stage runs as a batch: missing ratios are computed once, all
+    over-threshold columns are dropped in one call, fill values are computed
+    with one reduction per column group and applied with a single
+    ``fillna``.
+    
     Args:
         df: Input DataFrame
         config: Cleaning configuration
+        workers: Threads used to compute fill values for column batches
+            concurrently (-1 for all cores)
     
     Returns:
         Tuple of (cleaned DataFrame, list of log messages)
@@ -28,7 +37,30 @@ def handle_missing_values(
     Example:
         >>> df, log = handle_missing_values(df, config)
     """
-    df = df.copy()
+    drop_cols, fill_values, log = compute_fill_values(df, config, workers=workers)
+    return apply_fill_values(df, drop_cols, fill_values), log
+
+
+def compute_fill_values(
+    df: pd.DataFrame,
+    config: Dict[str, Any],
+    workers: Optional[int] = 1
+) -> Tuple[List[str], Dict[str, Any], List[str]]:
+    """
+    Decide which columns to drop and compute fill values for the rest.
+    
+    Args:
+        df: Input DataFrame
+        config: Cleaning configuration
+        workers: Threads used to compute fill values for column batches
+            concurrently (-1 for all cores)
+    
+    Returns:
+        Tuple of (columns to drop, column → fill value, list of log messages)
+    
+    Example:
+        >>> drop_cols, fill_values, log = compute_fill_values(df, config)
+    """
     log = []
     
     threshold_drop = config.get("threshold_drop", 0.45)
@@ -37,68 +69,117 @@ def handle_missing_values(
     # Calculate missing ratios
     missing_info = df.isnull().mean()
     
-    # Drop columns exceeding threshold
-    for col in df.columns:
-        missing_ratio = missing_info[col]
-        
-        if missing_ratio > threshold_drop:
-            df.drop(columns=[col], inplace=True)
-            msg = f"Dropped column '{col}' ({missing_ratio:.1%} missing)"
+    drop_cols = missing_info.index[missing_info > threshold_drop]
+    fill_cols = missing_info.index[(missing_info > 0) & (missing_info <= threshold_drop)]
+    
+    numeric_cols = [col for col in fill_cols if pd.api.types.is_numeric_dtype(df[col])]
+    numeric_set = set(numeric_cols)
+    categorical_cols = [col for col in fill_cols if col not in numeric_set]
+    
+    numeric_strategy = fill_strategy.get("numeric", "median")
+    categorical_strategy = fill_strategy.get("categorical", "mode")
+    
+    fill_values: Dict[str, Any] = {}
+    for batch in map_column_batches(
+        lambda cols: _numeric_fill_values(df, cols, numeric_strategy), numeric_cols, workers
+    ):
+        fill_values.update(batch)
+    for batch in map_column_batches(
+        lambda cols: _categorical_fill_values(df, cols, categorical_strategy), categorical_cols, workers
+    ):
+        fill_values.update(batch)
+    
+    # Log in column order, as the stage reports per column
+    drop_set = set(drop_cols)
+    for col in missing_info.index:
+        if col in drop_set:
+            msg = f"Dropped column '{col}' ({missing_info[col]:.1%} missing)"
             logger.warning(msg)
-            log.append(msg)
-            continue
-        
-        # Fill remaining missing values
-        if missing_ratio > 0:
-            if pd.api.types.is_numeric_dtype(df[col]):
-                strategy = fill_strategy.get("numeric", "median")
-                df, fill_msg = _fill_numeric(df, col, strategy)
-                log.append(fill_msg)
+        elif col in fill_values:
+            if col in numeric_set:
+                msg = f"Filled numeric column '{col}' with {numeric_strategy} ({fill_values[col]:.2f})"
             else:
-                strategy = fill_strategy.get("categorical", "mode")
-                df, fill_msg = _fill_categorical(df, col, strategy)
-                log.append(fill_msg)
+                msg = f"Filled categorical column '{col}' with '{fill_values[col]}'"
+            logger.info(msg)
+        else:
+            continue
+        log.append(msg)
     
-    return df, log
+    return list(drop_cols), fill_values, log
 
 
-def _fill_numeric(
+def apply_fill_values(
     df: pd.DataFrame,
-    col: str,
+    drop_columns: List[str],
+    fill_values: Dict[str, Any]
+) -> pd.DataFrame:
+    """
+    Drop columns and fill missing values with precomputed values.
+    
+    Args:
+        df: Input DataFrame
+        drop_columns: Columns to drop (absent ones are ignored)
+        fill_values: Column → fill value (absent columns are ignored)
+    
+    Returns:
+        Cleaned DataFrame
+    """
+    drop_columns = [col for col in drop_columns if col in df.columns]
+    if drop_columns:
+        df = df.drop(columns=drop_columns)
+    
+    fill_values = {col: value for col, value in fill_values.items() if col in df.columns}
+    if fill_values:
+        # Categorical columns only accept fill values that are categories
+        new_categories = {
+            col: value for col, value in fill_values.items()
+            if isinstance(df[col].dtype, pd.CategoricalDtype) and value not in df[col].cat.categories
+        }
+        if new_categories:
+            df = df.copy(deep=False)
+            for col, value in new_categories.items():
+                df[col] = df[col].cat.add_categories([value])
+        df = df.fillna(fill_values)
+    
+    return df
+
+
+def _numeric_fill_values(
+    df: pd.DataFrame,
+    cols: List[str],
     strategy: str
-) -> Tuple[pd.DataFrame, str]:
-    """Fill missing values in numeric column."""
+) -> Dict[str, Any]:
+    """Compute fill values for numeric columns in one vectorized reduction."""
+    if not cols:
+        return {}
+    
+    block = df[cols]
+    
     if strategy == "mean":
-        fill_value = df[col].mean()
-    elif strategy == "median":
-        fill_value = df[col].median()
+        values = block.mean()
     elif strategy == "mode":
-        mode = df[col].mode()
-        fill_value = mode[0] if not mode.empty else 0
+        values = block.mode().iloc[0].fillna(0) if len(block) else pd.Series(0, index=cols)
     else:
-        fill_value = df[col].median()
+        values = block.median()
     
-    df[col] = df[col].fillna(fill_value)
-    msg = f"Filled numeric column '{col}' with {strategy} ({fill_value:.2f})"
-    logger.info(msg)
-    
-    return df, msg
+    return values.to_dict()
 
 
-def _fill_categorical(
+def _categorical_fill_values(
     df: pd.DataFrame,
-    col: str,
+    cols: List[str],
     strategy: str
-) -> Tuple[pd.DataFrame, str]:
-    """Fill missing values in categorical column."""
-    if strategy == "mode":
-        mode = df[col].mode()
-        fill_value = mode[0] if not mode.empty else "Unknown"
-    else:
-        fill_value = "Unknown"
+) -> Dict[str, Any]:
+    """Compute fill values for categorical columns."""
+    if not cols:
+        return {}
     
-    df[col] = df[col].fillna(fill_value)
-    msg = f"Filled categorical column '{col}' with '{fill_value}'"
-    logger.info(msg)
+    if strategy != "mode":
+        return {col: "Unknown" for col in cols}
+    
+    fill_values = {}
+    for col in cols:
+        mode = df[col].mode()
+        fill_values[col] = mode[0] if not mode.empty else "Unknown"
     
-    return df, msg
\ No newline at end of file
+    return fill_values
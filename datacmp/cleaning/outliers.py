@@ -3,21 +3,33 @@ Outlier detection and handling utilities.
 """
 
 import logging
+import math
 from typing import Tuple, List, Dict, Any
 import pandas as pd
 import numpy as np
 
+from ..profiling.sketches import sketch_quantiles
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+OUTLIER_METHODS = ("iqr", "zscore", "mad")
+
+# Scale factor turning the median absolute deviation into a normal-consistent
+# estimate of the standard deviation
+_MAD_SCALE = 1.4826
+
 
 def handle_outliers(
     df: pd.DataFrame,
     config: Dict[str, Any]
 ) -> Tuple[pd.DataFrame, List[str]]:
     """
-    Detect and handle outliers using IQR method.
+    Detect and handle outliers in all numeric columns.
+    
+    Bounds for every column are computed once on the input (so results do
+    not depend on column order), then the whole numeric block is either
+    clipped to the bounds or filtered with one combined row mask.
     
     Args:
         df: Input DataFrame
@@ -29,73 +41,182 @@ def handle_outliers(
     Example:
         >>> df, log = handle_outliers(df, config)
     """
-    df = df.copy()
-    log = []
-    
-    method = config.get("method", "iqr")
     action = config.get("action", "cap")
-    iqr_multiplier = config.get("iqr_multiplier", 1.5)
     
-    if method != "iqr":
-        logger.warning(f"Unknown outlier method: {method}. Using IQR.")
+    bounds = compute_outlier_bounds(df, config)
+    df, counts = apply_outlier_bounds(df, bounds, action)
     
-    numeric_cols = df.select_dtypes(include=[np.number]).columns
+    return df, outlier_log(counts, action)
+
+
+def outlier_log(counts: pd.Series, action: str) -> List[str]:
+    """
+    Log the number of outliers handled per column.
+    
+    Args:
+        counts: Outliers per column, from ``apply_outlier_bounds``
+        action: 'cap' or 'remove'
     
-    for col in numeric_cols:
-        df, handled_count = _handle_outliers_iqr(
-            df,
-            col,
-            iqr_multiplier,
-            action
-        )
-        
+    Returns:
+        List of log messages (columns without outliers are skipped)
+    """
+    log = []
+    
+    if action not in ("cap", "remove"):
+        action = "cap"
+    
+    for col, handled_count in counts.items():
         if handled_count > 0:
             msg = f"Handled {handled_count} outliers in '{col}' (action: {action})"
             logger.info(msg)
             log.append(msg)
     
-    return df, log
+    return log
 
 
-def _handle_outliers_iqr(
+def compute_outlier_bounds(
     df: pd.DataFrame,
-    col: str,
-    multiplier: float,
-    action: str
-) -> Tuple[pd.DataFrame, int]:
+    config: Dict[str, Any]
+) -> pd.DataFrame:
     """
-    Handle outliers in a single column using IQR method.
+    Compute lower/upper outlier bounds for all numeric columns at once.
+    
+    Methods:
+    - ``iqr``: ``[q1 - k * IQR, q3 + k * IQR]`` with ``k = iqr_multiplier``
+    - ``zscore``: ``mean ± zscore_threshold * std``
+    - ``mad``: ``median ± mad_threshold * 1.4826 * MAD``
+    
+    If ``config["sketch"]`` holds sketch settings (approximate profiling),
+    medians and quartiles come from KLL quantile sketches with rank error
+    ``quantile_error`` instead of exact sorts.
     
     Args:
         df: Input DataFrame
-        col: Column name
-        multiplier: IQR multiplier
+        config: Outlier handling configuration
+    
+    Returns:
+        DataFrame indexed by column with ``lower`` and ``upper`` bounds
+    
+    Example:
+        >>> bounds = compute_outlier_bounds(df, {"method": "mad"})
+    """
+    method = config.get("method", "iqr")
+    
+    if method not in OUTLIER_METHODS:
+        logger.warning(f"Unknown outlier method: {method}. Using IQR.")
+        method = "iqr"
+    
+    block = df.select_dtypes(include=[np.number])
+    sketch = config.get("sketch")
+    
+    def quantiles(frame: pd.DataFrame, qs: List[float]) -> pd.DataFrame:
+        if sketch:
+            return sketch_quantiles(frame, qs, sketch["quantile_error"])
+        return frame.quantile(qs)
+    
+    if method == "zscore":
+        threshold = config.get("zscore_threshold", 3.0)
+        center = block.mean()
+        spread = threshold * block.std()
+        lower, upper = center - spread, center + spread
+    elif method == "mad":
+        threshold = config.get("mad_threshold", 3.5)
+        center = quantiles(block, [0.5]).iloc[0]
+        mad = quantiles((block - center).abs(), [0.5]).iloc[0]
+        spread = threshold * _MAD_SCALE * mad
+        lower, upper = center - spread, center + spread
+    else:
+        multiplier = config.get("iqr_multiplier", 1.5)
+        quartiles = quantiles(block, [0.25, 0.75])
+        q1, q3 = quartiles.iloc[0], quartiles.iloc[1]
+        iqr = q3 - q1
+        lower, upper = q1 - multiplier * iqr, q3 + multiplier * iqr
+    
+    return pd.DataFrame({"lower": lower, "upper": upper}, index=block.columns)
+
+
+def apply_outlier_bounds(
+    df: pd.DataFrame,
+    bounds: pd.DataFrame,
+    action: str = "cap"
+) -> Tuple[pd.DataFrame, pd.Series]:
+    """
+    Cap or remove values outside precomputed bounds.
+    
+    Capped int64 and float64 columns become float64. Other numeric dtypes,
+    such as those chosen by ``optimize_dtypes``, are kept: integer columns
+    are capped to the bounds rounded inward.
+    
+    Args:
+        df: Input DataFrame
+        bounds: Output of ``compute_outlier_bounds``
         action: 'cap' or 'remove'
     
     Returns:
-        Tuple of (DataFrame, number of outliers handled)
+        Tuple of (DataFrame, number of outliers per column)
     """
-    series = df[col]
+    if action not in ("cap", "remove"):
+        logger.warning(f"Unknown action: {action}. Using 'cap'.")
+        action = "cap"
     
-    q1 = series.quantile(0.25)
-    q3 = series.quantile(0.75)
-    iqr = q3 - q1
+    bounds = bounds.dropna(how="all")
+    cols = [col for col in bounds.index if col in df.columns]
     
-    lower_bound = q1 - multiplier * iqr
-    upper_bound = q3 + multiplier * iqr
+    if not cols:
+        return df, pd.Series(0, index=pd.Index([], dtype=object), dtype=np.int64)
     
-    outliers_mask = ~series.between(lower_bound, upper_bound)
-    outlier_count = outliers_mask.sum()
+    block = df[cols]
+    lower = bounds.loc[cols, "lower"]
+    upper = bounds.loc[cols, "upper"]
     
-    if outlier_count == 0:
-        return df, 0
+    # NaN compares False on both sides, so missing values are never outliers
+    outliers_mask = block.lt(lower, axis=1) | block.gt(upper, axis=1)
+    counts = outliers_mask.sum()
     
     if action == "cap":
-        df[col] = series.clip(lower=lower_bound, upper=upper_bound)
-    elif action == "remove":
-        df = df[~outliers_mask]
+        changed = counts.index[counts > 0].tolist()
+        if changed:
+            # Shallow copy: capped columns are replaced, the input is never modified
+            df = df.copy(deep=False)
+            widened = [col for col in changed if not _keeps_dtype(block[col].dtype)]
+            if widened:
+                df[widened] = block[widened].clip(
+                    lower=lower[widened], upper=upper[widened], axis=1
+                )
+            for col in changed:
+                if col not in widened:
+                    df[col] = _clip_in_dtype(block[col], lower[col], upper[col])
     else:
-        logger.warning(f"Unknown action: {action}. Using 'cap'.")
-        df[col] = series.clip(lower=lower_bound, upper=upper_bound)
+        row_mask = outliers_mask.any(axis=1)
+        if row_mask.any():
+            df = df[~row_mask]
+    
+    return df, counts
+
+
+def _keeps_dtype(dtype) -> bool:
+    """
+    Whether capping keeps a column's dtype.
     
-    return df, outlier_count
\ No newline at end of file
+    Narrow dtypes (e.g. from ``optimize_dtypes``) and nullable ones keep
+    it; int64 and float64 columns are capped to float64, as before.
+    """
+    return (
+        dtype not in (np.dtype("int64"), np.dtype("float64"))
+        and not pd.api.types.is_bool_dtype(dtype)
+    )
+
+
+def _clip_in_dtype(series: pd.Series, lower: float, upper: float) -> pd.Series:
+    """Cap a column within its dtype; integer bounds are rounded inward."""
+    lower = None if pd.isna(lower) else lower
+    upper = None if pd.isna(upper) else upper
+    if pd.api.types.is_integer_dtype(series.dtype):
+        info = np.iinfo(getattr(series.dtype, "numpy_dtype", series.dtype))
+        low = None if lower is None else max(math.ceil(lower), info.min)
+        high = None if upper is None else min(math.floor(upper), info.max)
+        if low is not None and high is not None and low > high:
+            # No integer lies within the bounds
+            low = high = round((lower + upper) / 2)
+        return series.clip(lower=low, upper=high)
+    return series.clip(lower=lower, upper=upper).astype(series.dtype)
@@ -0,0 +1,210 @@
+"""
+Replayable cleaning plans.
+
+A ``CleaningPlan`` records the parameters that ``DataCmp.fit()`` learned
+from one dataset: column renames, dropped columns, fill values, outlier
+bounds and duplicate keys. It applies them to new batches without
+computing any statistics, so training and scoring data are cleaned
+identically. Plans are saved as YAML or JSON.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from .duplicates import drop_duplicates
+from .missing import apply_fill_values
+from .outliers import apply_outlier_bounds, outlier_log
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Version of the saved plan layout
+PLAN_FORMAT_VERSION = 1
+
+
+class CleaningPlan:
+    """
+    Fitted cleaning parameters that can be saved and replayed.
+
+    ``transform()`` runs the stages in the order of ``DataCmp.clean()``:
+    rename columns, drop duplicate rows, drop columns, fill missing values,
+    then cap or remove values outside the outlier bounds. Columns the plan
+    does not mention pass through unchanged. Dtype optimization is not part
+    of the plan.
+
+    Args:
+        rename: Original → cleaned column name (changed names only)
+        drop_columns: Columns dropped for missing values
+        fill_values: Column → fill value for missing values
+        outlier_bounds: Column → (lower, upper) outlier bounds
+        outlier_action: 'cap' or 'remove'
+        duplicates: Drop duplicate rows
+        duplicate_subset: Key columns identifying a row (None for whole rows)
+
+    Example:
+        >>> cmp = DataCmp("train.csv").fit()
+        >>> cmp.cleaning_plan.save("plan.yaml")
+        >>> df, log = CleaningPlan.load("plan.yaml").transform(new_batch)
+    """
+
+    def __init__(
+        self,
+        rename: Optional[Dict[str, str]] = None,
+        drop_columns: Optional[Sequence[str]] = None,
+        fill_values: Optional[Dict[str, Any]] = None,
+        outlier_bounds: Optional[Dict[str, Tuple[float, float]]] = None,
+        outlier_action: str = "cap",
+        duplicates: bool = False,
+        duplicate_subset: Optional[Sequence[str]] = None
+    ):
+        if outlier_action not in ("cap", "remove"):
+            raise ValueError(f"outlier_action must be 'cap' or 'remove', got {outlier_action!r}")
+        self.rename = dict(rename or {})
+        self.drop_columns = list(drop_columns or [])
+        self.fill_values = {col: _plain(value) for col, value in (fill_values or {}).items()}
+        self.outlier_bounds = {
+            col: (float(lower), float(upper))
+            for col, (lower, upper) in (outlier_bounds or {}).items()
+        }
+        self.outlier_action = outlier_action
+        self.duplicates = duplicates
+        self.duplicate_subset = list(duplicate_subset) if duplicate_subset else None
+
+    def transform(self, df: pd.DataFrame) -> Tuple[pd.DataFrame, List[str]]:
+        """
+        Apply the plan to a DataFrame.
+
+        Args:
+            df: Input DataFrame with the columns the plan was fitted on
+
+        Returns:
+            Tuple of (cleaned DataFrame, list of log messages)
+        """
+        log: List[str] = []
+
+        if self.rename:
+            df = df.rename(columns=self.rename)
+
+        if self.duplicates:
+            df, stage_log = drop_duplicates(df, subset=self.duplicate_subset)
+            log.extend(stage_log)
+
+        if self.drop_columns or self.fill_values:
+            df = apply_fill_values(df, self.drop_columns, self._typed_fill_values(df))
+
+        if self.outlier_bounds:
+            bounds = pd.DataFrame.from_dict(
+                self.outlier_bounds, orient="index", columns=["lower", "upper"]
+            )
+            df, counts = apply_outlier_bounds(df, bounds, self.outlier_action)
+            log.extend(outlier_log(counts, self.outlier_action))
+
+        logger.info(f"Applied cleaning plan: {df.shape[0]} rows, {df.shape[1]} columns")
+        return df, log
+
+    def _typed_fill_values(self, df: pd.DataFrame) -> Dict[str, Any]:
+        """Fill values converted back to the types they were saved from."""
+        fill_values = {}
+        for col, value in self.fill_values.items():
+            if col in df.columns and isinstance(value, str) and pd.api.types.is_datetime64_any_dtype(df[col]):
+                # Saved as ISO strings; datetime columns only accept timestamps
+                value = pd.Timestamp(value)
+            fill_values[col] = value
+        return fill_values
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain-data representation, as written by ``save()``."""
+        return {
+            "version": PLAN_FORMAT_VERSION,
+            "rename": self.rename,
+            "duplicates": {"enabled": self.duplicates, "subset": self.duplicate_subset},
+            "drop_columns": self.drop_columns,
+            "fill_values": self.fill_values,
+            "outliers": {
+                "action": self.outlier_action,
+                "bounds": {col: list(bounds) for col, bounds in self.outlier_bounds.items()},
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CleaningPlan":
+        """Build a plan from the output of ``to_dict()``."""
+        version = data.get("version", PLAN_FORMAT_VERSION)
+        if version > PLAN_FORMAT_VERSION:
+            raise ValueError(f"Cleaning plan version {version} is newer than this datacmp supports")
+        duplicates = data.get("duplicates") or {}
+        outliers = data.get("outliers") or {}
+        return cls(
+            rename=data.get("rename"),
+            drop_columns=data.get("drop_columns"),
+            fill_values=data.get("fill_values"),
+            outlier_bounds=outliers.get("bounds"),
+            outlier_action=outliers.get("action", "cap"),
+            duplicates=bool(duplicates.get("enabled", False)),
+            duplicate_subset=duplicates.get("subset"),
+        )
+
+    def save(self, path: Union[str, Path]) -> None:
+        """
+        Save the plan as JSON (``.json``) or YAML (any other extension).
+
+        Args:
+            path: Output file path
+
+        Example:
+            >>> plan.save("plan.yaml")
+        """
+        path = Path(path)
+        with open(path, "w") as f:
+            if path.suffix.lower() == ".json":
+                json.dump(self.to_dict(), f, indent=2)
+            else:
+                import yaml
+
+                yaml.safe_dump(self.to_dict(), f, sort_keys=False, allow_unicode=True)
+        logger.info(f"Saved cleaning plan to {path}")
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "CleaningPlan":
+        """
+        Load a plan saved with ``save()``.
+
+        Args:
+            path: Plan file (JSON or YAML)
+
+        Returns:
+            CleaningPlan
+        """
+        path = Path(path)
+        if not path.exists():
+            raise FileNotFoundError(f"Cleaning plan not found: {path}")
+        with open(path) as f:
+            if path.suffix.lower() == ".json":
+                data = json.load(f)
+            else:
+                import yaml
+
+                data = yaml.safe_load(f)
+        if not isinstance(data, dict):
+            raise ValueError(f"{path} does not contain a cleaning plan")
+        return cls.from_dict(data)
+
+    def __repr__(self) -> str:
+        return (
+            f"CleaningPlan(renames={len(self.rename)}, drops={len(self.drop_columns)}, "
+            f"fills={len(self.fill_values)}, bounds={len(self.outlier_bounds)}, "
+            f"duplicates={self.duplicates})"
+        )
+
+
+def _plain(value: Any) -> Any:
+    """Convert numpy and pandas scalars to YAML/JSON-friendly Python values."""
+    if isinstance(value, pd.Timestamp):
+        return value.isoformat()
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
@@ -3,15 +3,18 @@ Command-line interface for Datacmp.
 """
 
 import argparse
+import glob
 import sys
 from pathlib import Path
 
-from ..pipeline.runner import run_pipeline
-from ..pipeline.config import get_default_config, save_config
+from ..pipeline.config import DEFAULT_CHUNKSIZE, get_default_config, save_config
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Kept here rather than imported so `datacmp --help` does not import pandas
+DEFAULT_CACHE_MAX_MB = 1024
+
 
 def main():
     """Main CLI entry point."""
@@ -22,6 +25,15 @@ def main():
 Examples:
   datacmp run data.csv --config config.yaml
   datacmp run data.csv --export cleaned.csv --report report.html
+  datacmp run events.parquet --columns user_id,amount --export cleaned.parquet
+  datacmp run big.csv --read-engine pyarrow --infer-schema-rows 10000 --dtype zip=str
+  datacmp run big.csv --export cleaned.csv --stream --chunksize 100000
+  datacmp run big.csv --report report.html --sample 0.01 --stratify country
+  datacmp run data.csv --report report.html --cache-dir .datacmp-cache
+  datacmp run 'data/*.csv' --jobs 8 --out-dir cleaned --export-format parquet --report-format html
+  datacmp run 'events/part-*.parquet' --partitioned --jobs 8 --out-dir cleaned
+  datacmp fit train.csv plan.yaml --config config.yaml
+  datacmp apply plan.yaml batch.csv --export cleaned.parquet
   datacmp init config.yaml
   
 For more information, visit: https://github.com/MoustafaMohamed01/datacmp
@@ -32,11 +44,67 @@ For more information, visit: https://github.com/MoustafaMohamed01/datacmp
     
     # Run command
     run_parser = subparsers.add_parser('run', help='Run data cleaning pipeline')
-    run_parser.add_argument('input', help='Path to input CSV file')
+    run_parser.add_argument('input', nargs='+',
+                            help='Path to input file (CSV, Parquet, Feather or Arrow IPC); '
+                                 'several files or glob patterns run in batch mode')
     run_parser.add_argument('--config', '-c', help='Path to config YAML file')
-    run_parser.add_argument('--export', '-e', help='Path to export cleaned CSV')
-    run_parser.add_argument('--report', '-r', help='Path to export report (HTML or TXT)')
+    run_parser.add_argument('--export', '-e',
+                            help='Path to export cleaned data (CSV, Parquet, Feather or Arrow IPC)')
+    run_parser.add_argument('--report', '-r', help='Path to export report (HTML, TXT or JSON)')
     run_parser.add_argument('--quiet', '-q', action='store_true', help='Suppress output')
+    run_parser.add_argument('--stream', action='store_true',
+                            help='Process the input in chunks without loading it into memory')
+    run_parser.add_argument('--chunksize', type=int, default=DEFAULT_CHUNKSIZE,
+                            help=f'Rows per chunk in streaming mode (default: {DEFAULT_CHUNKSIZE})')
+    run_parser.add_argument('--engine', choices=['pandas', 'polars'], default='pandas',
+                            help='Execution engine (default: pandas)')
+    run_parser.add_argument('--sample', type=_parse_sample,
+                            help='Profile a random sample: a fraction (0.01) or a row count (100000)')
+    run_parser.add_argument('--stratify', help='Column to stratify the sample by')
+    run_parser.add_argument('--seed', type=int, default=0, help='Random seed for --sample (default: 0)')
+    run_parser.add_argument('--columns', type=_parse_columns,
+                            help='Comma-separated columns to load (default: all)')
+    run_parser.add_argument('--read-engine', choices=['c', 'pyarrow'],
+                            help='CSV parser; pyarrow is multithreaded (default: io.read.engine or c)')
+    run_parser.add_argument('--dtype', type=_parse_dtype, action='append', metavar='COLUMN=DTYPE',
+                            help='CSV dtype hint, e.g. zip=str (repeatable)')
+    run_parser.add_argument('--infer-schema-rows', type=int, metavar='N',
+                            help='Infer CSV column types from the first N rows and lock them for the full read')
+    run_parser.add_argument('--cache-dir',
+                            help='Reuse results of unchanged runs from this cache directory (requires pyarrow)')
+    run_parser.add_argument('--cache-max-size', type=int, default=DEFAULT_CACHE_MAX_MB, metavar='MB',
+                            help=f'Evict least recently used cached results above this size (default: {DEFAULT_CACHE_MAX_MB})')
+    run_parser.add_argument('--out-dir', '-o',
+                            help='Batch mode: directory for the cleaned data, reports and batch_summary.csv')
+    run_parser.add_argument('--jobs', '-j', type=int, default=1,
+                            help='Batch mode: worker processes, -1 for all cores (default: 1)')
+    run_parser.add_argument('--export-format', choices=['csv', 'parquet', 'feather', 'arrow'],
+                            help="Batch mode: format of the cleaned data (default: the input's format)")
+    run_parser.add_argument('--report-format', choices=['html', 'txt', 'json'],
+                            help='Batch mode: write a report per file in this format')
+    run_parser.add_argument('--partitioned', action='store_true',
+                            help='Batch mode: treat the inputs as partitions of one dataset, '
+                                 'with global fill values, outlier bounds and duplicates')
+    
+    # Fit command
+    fit_parser = subparsers.add_parser('fit', help='Learn a replayable cleaning plan')
+    fit_parser.add_argument('input', help='Path to input file (CSV, Parquet, Feather or Arrow IPC)')
+    fit_parser.add_argument('plan', help='Path to save the plan (YAML, or JSON with a .json extension)')
+    fit_parser.add_argument('--config', '-c', help='Path to config YAML file')
+    fit_parser.add_argument('--columns', type=_parse_columns,
+                            help='Comma-separated columns to load (default: all)')
+    fit_parser.add_argument('--export', '-e',
+                            help='Path to export the cleaned training data')
+    
+    # Apply command
+    apply_parser = subparsers.add_parser('apply', help='Clean new data with a saved cleaning plan')
+    apply_parser.add_argument('plan', help='Path to a plan saved by `datacmp fit`')
+    apply_parser.add_argument('input', help='Path to input file (CSV, Parquet, Feather or Arrow IPC)')
+    apply_parser.add_argument('--export', '-e', required=True,
+                              help='Path to export cleaned data (CSV, Parquet, Feather or Arrow IPC)')
+    apply_parser.add_argument('--config', '-c', help='Path to config YAML file (input and export options)')
+    apply_parser.add_argument('--columns', type=_parse_columns,
+                              help='Comma-separated columns to load (default: all)')
     
     # Init command
     init_parser = subparsers.add_parser('init', help='Create default config file')
@@ -50,6 +118,10 @@ For more information, visit: https://github.com/MoustafaMohamed01/datacmp
     
     if args.command == 'run':
         run_command(args)
+    elif args.command == 'fit':
+        fit_command(args)
+    elif args.command == 'apply':
+        apply_command(args)
     elif args.command == 'init':
         init_command(args)
     elif args.command == 'version':
@@ -59,10 +131,65 @@ For more information, visit: https://github.com/MoustafaMohamed01/datacmp
         sys.exit(1)
 
 
+def _parse_sample(value: str):
+    """Parse --sample as a row count (int) or a fraction (float)."""
+    try:
+        return int(value)
+    except ValueError:
+        pass
+    try:
+        return float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid sample size: {value!r}")
+
+
+def _parse_columns(value: str):
+    """Parse --columns as a comma-separated list of column names."""
+    columns = [col.strip() for col in value.split(',') if col.strip()]
+    if not columns:
+        raise argparse.ArgumentTypeError("--columns needs at least one column name")
+    return columns
+
+
+def _parse_dtype(value: str):
+    """Parse --dtype as a COLUMN=DTYPE pair."""
+    column, sep, dtype = value.partition('=')
+    if not sep or not column.strip() or not dtype.strip():
+        raise argparse.ArgumentTypeError(f"expected COLUMN=DTYPE, got {value!r}")
+    return column.strip(), dtype.strip()
+
+
+def _read_options(args):
+    """io.read overrides from the command line (None if there are none)."""
+    options = {}
+    if args.read_engine:
+        options["engine"] = args.read_engine
+    if args.dtype:
+        options["dtype"] = dict(args.dtype)
+    if args.infer_schema_rows:
+        options["infer_schema_rows"] = args.infer_schema_rows
+    return options or None
+
+
+def _is_batch(args) -> bool:
+    """Whether `datacmp run` was given several inputs, a glob pattern or --out-dir."""
+    return (
+        len(args.input) > 1 or args.out_dir is not None or args.partitioned
+        or any(glob.has_magic(path) for path in args.input)
+    )
+
+
 def run_command(args):
     """Execute run command."""
+    if _is_batch(args):
+        batch_command(args)
+        return
+    
+    # Deferred so `datacmp --help` and `datacmp version` do not import pandas
+    from ..pipeline.runner import run_pipeline
+    
     try:
-        input_path = Path(args.input)
+        input_path = Path(args.input[0])
         
         if not input_path.exists():
             print(f"Error: Input file not found: {input_path}")
@@ -75,7 +202,16 @@ def run_command(args):
             config_path=args.config,
             export_csv_path=args.export,
             export_report_path=args.report,
-            verbose=not args.quiet
+            verbose=not args.quiet,
+            chunksize=args.chunksize if args.stream else None,
+            engine=args.engine,
+            sample=args.sample,
+            stratify=args.stratify,
+            seed=args.seed,
+            columns=args.columns,
+            read_options=_read_options(args),
+            cache_dir=args.cache_dir,
+            cache_max_bytes=args.cache_max_size * 1024**2
         )
         
         print("\n✅ Pipeline completed successfully!\n")
@@ -86,6 +222,162 @@ def run_command(args):
         sys.exit(1)
 
 
+def batch_command(args):
+    """Execute run command over many inputs."""
+    from ..pipeline.batch import run_batch
+    
+    if args.out_dir is None:
+        print("Error: several inputs need --out-dir")
+        sys.exit(1)
+    if args.export or args.report:
+        print("Error: use --export-format/--report-format instead of --export/--report with several inputs")
+        sys.exit(1)
+    if args.partitioned:
+        partitioned_command(args)
+        return
+    
+    try:
+        print(f"\n🚀 Running Datacmp pipeline in batch mode ({args.jobs} jobs)...\n")
+        
+        summary = run_batch(
+            args.input,
+            args.out_dir,
+            jobs=args.jobs,
+            export_format=args.export_format,
+            report_format=args.report_format,
+            verbose=not args.quiet,
+            config_path=args.config,
+            chunksize=args.chunksize if args.stream else None,
+            engine=args.engine,
+            sample=args.sample,
+            stratify=args.stratify,
+            seed=args.seed,
+            columns=args.columns,
+            read_options=_read_options(args),
+            cache_dir=args.cache_dir,
+            cache_max_bytes=args.cache_max_size * 1024**2
+        )
+    except Exception as e:
+        print(f"\n❌ Error: {e}\n")
+        logger.error(f"Batch failed: {e}", exc_info=True)
+        sys.exit(1)
+    
+    from tabulate import tabulate
+    
+    failed = summary[summary["status"] == "failed"]
+    table = summary[["input", "status", "rows", "columns", "seconds"]].astype(object).fillna("-")
+    print("\n" + tabulate(table, headers="keys", tablefmt="rounded_outline", showindex=False, floatfmt=".2f"))
+    print(
+        f"\n{len(summary) - len(failed)} succeeded, {len(failed)} failed, "
+        f"{summary['rows'].sum()} rows, {summary['seconds'].sum():.2f}s of pipeline time"
+    )
+    for _, row in failed.iterrows():
+        print(f"  ❌ {row['input']}: {row['error']}")
+    
+    if len(failed):
+        sys.exit(1)
+    print("\n✅ Batch completed successfully!\n")
+
+
+def partitioned_command(args):
+    """Execute run command over the partitions of one dataset."""
+    from ..pipeline.partitioned import run_partitioned
+    from ..pipeline.runner import with_read_options
+    
+    unsupported = [
+        flag for flag, used in [
+            ('--report-format', args.report_format),
+            ('--stream', args.stream),
+            ('--sample', args.sample is not None),
+            ('--engine polars', args.engine != 'pandas'),
+            ('--cache-dir', args.cache_dir),
+        ] if used
+    ]
+    if unsupported:
+        print(f"Error: {', '.join(unsupported)} cannot be combined with --partitioned")
+        sys.exit(1)
+    
+    try:
+        print(f"\n🚀 Running Datacmp pipeline on partitioned data ({args.jobs} jobs)...\n")
+        
+        read_options = _read_options(args)
+        config = with_read_options(args.config, read_options) if read_options else args.config
+        result = run_partitioned(
+            args.input,
+            args.out_dir,
+            config_path=config,
+            jobs=args.jobs,
+            export_format=args.export_format,
+            columns=args.columns,
+            verbose=not args.quiet
+        )
+        
+        state_path = Path(args.out_dir) / "profile.state"
+        result["profile_state"].save(state_path)
+        plan_path = Path(args.out_dir) / "plan.yaml"
+        result["cleaning_plan"].save(plan_path)
+    except Exception as e:
+        print(f"\n❌ Error: {e}\n")
+        logger.error(f"Partitioned run failed: {e}", exc_info=True)
+        sys.exit(1)
+    
+    if not args.quiet:
+        print("\n" + result["profile_state"].summary())
+        if result["cleaning_log"]:
+            print("\nCleaning log:")
+            for message in result["cleaning_log"]:
+                print(f"  - {message}")
+    
+    print(f"\nProfile state saved to {state_path}, cleaning plan to {plan_path}")
+    print("\n✅ Partitioned run completed successfully!\n")
+
+
+def fit_command(args):
+    """Execute fit command."""
+    from ..core.datacmp import DataCmp
+    
+    try:
+        input_path = Path(args.input)
+        
+        if not input_path.exists():
+            print(f"Error: Input file not found: {input_path}")
+            sys.exit(1)
+        
+        cmp = DataCmp(input_path, config=args.config, columns=args.columns).fit()
+        cmp.cleaning_plan.save(args.plan)
+        if args.export:
+            cmp.export(args.export)
+        
+        print(f"\n✅ Saved cleaning plan to {args.plan}\n")
+        
+    except Exception as e:
+        print(f"\n❌ Error: {e}\n")
+        logger.error(f"Fit failed: {e}", exc_info=True)
+        sys.exit(1)
+
+
+def apply_command(args):
+    """Execute apply command."""
+    from ..core.datacmp import DataCmp
+    
+    try:
+        input_path = Path(args.input)
+        
+        if not input_path.exists():
+            print(f"Error: Input file not found: {input_path}")
+            sys.exit(1)
+        
+        cmp = DataCmp(input_path, config=args.config, columns=args.columns)
+        cmp.transform(args.plan).export(args.export)
+        
+        print(f"\n✅ Cleaned {cmp.df.shape[0]} rows with {args.plan} → {args.export}\n")
+        
+    except Exception as e:
+        print(f"\n❌ Error: {e}\n")
+        logger.error(f"Apply failed: {e}", exc_info=True)
+        sys.exit(1)
+
+
 def init_command(args):
     """Execute init command."""
     try:
@@ -119,4 +411,4 @@ def version_command():
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,88 @@
+"""
+Versioned cache for profiling artifacts.
+"""
+
+from collections.abc import MutableMapping
+from typing import Any, Callable, Dict, Hashable, Iterator, Optional
+import pandas as pd
+
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def frame_fingerprint(df: Optional[pd.DataFrame]) -> Hashable:
+    """
+    Cheap structural fingerprint of a DataFrame.
+
+    Covers object identity, shape, column names and dtypes. It does not scan
+    the values, so in-place edits of cell values are not detected; use
+    ``ProfileCache.clear()`` after mutating a DataFrame in place.
+
+    Args:
+        df: DataFrame (or None)
+
+    Returns:
+        Hashable fingerprint
+    """
+    if df is None:
+        return None
+    return (
+        id(df),
+        df.shape,
+        tuple(df.columns),
+        tuple(str(dtype) for dtype in df.dtypes),
+    )
+
+
+class ProfileCache(MutableMapping):
+    """
+    Dictionary of computed artifacts bound to one version of a DataFrame.
+
+    Every entry (null counts, numeric statistics, correlation matrix,
+    summary, plots, ...) is only valid for the DataFrame version it was
+    computed from. Calling ``bind()`` with a different key drops all entries,
+    so stale results can never be returned.
+
+    Example:
+        >>> cache = ProfileCache()
+        >>> cache.bind((1, frame_fingerprint(df)))
+        >>> corr = cache.get_or_compute("correlations", lambda: df.corr())
+    """
+
+    def __init__(self):
+        self._entries: Dict[str, Any] = {}
+        self._key: Hashable = None
+
+    def bind(self, key: Hashable) -> "ProfileCache":
+        """Bind the cache to a DataFrame version, invalidating on change."""
+        if key != self._key:
+            if self._entries:
+                logger.info("DataFrame changed; invalidating profile cache")
+            self._entries.clear()
+            self._key = key
+        return self
+
+    def get_or_compute(self, name: str, compute: Callable[[], Any]) -> Any:
+        """Return a cached artifact, computing and storing it if missing."""
+        if name not in self._entries:
+            self._entries[name] = compute()
+        return self._entries[name]
+
+    def __getitem__(self, name: str) -> Any:
+        return self._entries[name]
+
+    def __setitem__(self, name: str, value: Any) -> None:
+        self._entries[name] = value
+
+    def __delitem__(self, name: str) -> None:
+        del self._entries[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return f"ProfileCache({sorted(self._entries)})"
@@ -6,20 +6,34 @@ import logging
 from pathlib import Path
 from typing import Optional, Union, Dict, Any, List
 import pandas as pd
+import numpy as np
 
 from ..cleaning.columns import clean_column_names
-from ..cleaning.missing import handle_missing_values
-from ..cleaning.outliers import handle_outliers
+from ..cleaning.duplicates import drop_duplicates, duplicate_settings, row_fingerprints
+from ..cleaning.dtypes import optimize_dtypes
+from ..cleaning.missing import apply_fill_values, compute_fill_values
+from ..cleaning.outliers import apply_outlier_bounds, compute_outlier_bounds, outlier_log
+from ..cleaning.plan import CleaningPlan
 from ..profiling.summary import generate_summary
-from ..profiling.statistics import compute_statistics
-from ..profiling.correlations import compute_correlations
-from ..visuals.plots import create_visualizations
-from ..visuals.reports import generate_html_report, generate_txt_report
+from ..profiling.sampling import sample_frame, confidence_intervals, DEFAULT_CONFIDENCE_LEVEL
+from ..profiling.sketches import sketch_settings
+from ..profiling.statistics import compute_statistics, compute_numeric_stats
+from ..profiling.correlations import compute_correlations, strongest_correlations, DEFAULT_TOP_K
+from ..profiling.histograms import compute_histograms, DEFAULT_BINS
+from ..profiling.state import ProfileState
+from .cache import ProfileCache, frame_fingerprint
+from . import polars_engine
 from ..pipeline.config import load_config
+from ..pipeline.streaming import fit_streaming, apply_streaming, read_schema
+from ..utils.io import (
+    DEFAULT_PARQUET_COMPRESSION, TABLE_FORMATS, detect_format, read_settings, read_table, write_table
+)
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+ENGINES = ("pandas", "polars")
+
 
 class DataCmp:
     """
@@ -33,42 +47,68 @@ class DataCmp:
     Attributes:
         df (pd.DataFrame): The working DataFrame
         original_df (pd.DataFrame): The original DataFrame (backup)
+        original_shape (tuple): Shape of the original DataFrame
+        original_columns (list): Column names of the original DataFrame
         config (dict): Configuration settings
         cleaning_log (list): Log of cleaning operations
+        chunksize (int): Rows per chunk in streaming mode (None when in memory)
+        engine (str): Execution engine ('pandas' or 'polars')
+        profile_state (ProfileState): Incremental profile (None until
+            ``profile_incremental()`` is called)
+        cleaning_plan (CleaningPlan): Parameters learned by the last in-memory
+            pandas ``clean()``/``fit()``, replayable with ``transform()``
     """
     
     def __init__(
         self,
         data: Union[str, Path, pd.DataFrame],
         config: Optional[Union[str, Path, Dict]] = None,
-        auto_clean: bool = False
+        auto_clean: bool = False,
+        chunksize: Optional[int] = None,
+        engine: str = "pandas",
+        columns: Optional[List[str]] = None
     ):
         """
         Initialize DataCmp instance.
         
         Args:
-            data: Path to CSV file or pandas DataFrame
+            data: Path to a CSV, Parquet, Feather or Arrow IPC file (format
+                detected from the extension) or pandas DataFrame
             config: Path to YAML config file or config dictionary
             auto_clean: If True, automatically run basic cleaning
+            chunksize: Stream the file in chunks of this many rows instead
+                of loading it. Only ``clean()`` and CSV ``export()`` are
+                available in streaming mode.
+            engine: 'pandas' (default) or 'polars'. The polars engine loads,
+                cleans and computes numeric statistics with multithreaded
+                Polars lazy queries; ``df`` is still a pandas DataFrame.
+            columns: Load only these columns (default: ``io.read.usecols``).
+                Parquet and Arrow files never read the other columns from disk.
         
         Example:
             >>> cmp = DataCmp("data.csv")
             >>> cmp = DataCmp(df, config="config.yaml")
+            >>> cmp = DataCmp("big.csv", chunksize=100_000)
+            >>> cmp = DataCmp("data.csv", engine="polars")
+            >>> cmp = DataCmp("events.parquet", columns=["user_id", "amount"])
         """
         logger.info("Initializing DataCmp...")
         
-        # Load data
-        if isinstance(data, (str, Path)):
-            self.df = pd.read_csv(data)
-            logger.info(f"Loaded data from {data}: {self.df.shape[0]} rows, {self.df.shape[1]} columns")
-        elif isinstance(data, pd.DataFrame):
-            self.df = data.copy()
-            logger.info(f"Loaded DataFrame: {self.df.shape[0]} rows, {self.df.shape[1]} columns")
-        else:
-            raise TypeError("data must be a file path or pandas DataFrame")
+        if engine not in ENGINES:
+            raise ValueError(f"engine must be one of {ENGINES}, got {engine!r}")
+        if engine == "polars":
+            if chunksize is not None:
+                raise ValueError("engine='polars' is not available in streaming mode")
+            polars_engine.require_polars()
+        self.engine = engine
+        
+        self._df: Optional[pd.DataFrame] = None
+        self._version = 0
+        self._profile_cache = ProfileCache()
         
-        # Store original
-        self.original_df = self.df.copy()
+        self.chunksize = chunksize
+        self._source: Optional[Path] = None
+        self._stream_params: Optional[Dict[str, Any]] = None
         
         # Load configuration
         if config is None:
@@ -80,14 +120,188 @@ class DataCmp:
         else:
             raise TypeError("config must be a file path or dictionary")
         
+        # CSV reader options (io.read); explicit columns override usecols
+        self._read_options = read_settings(self.config)
+        usecols = self._read_options.pop("usecols")
+        self.columns = list(columns) if columns is not None else usecols
+        
+        memory_efficient = self.config.get("performance", {}).get("memory_efficient", False)
+        self._original_df: Optional[pd.DataFrame] = None
+        self._original_source: Optional[Union[Path, pd.DataFrame]] = None
+        
+        # Load data
+        if chunksize is not None:
+            if not isinstance(data, (str, Path)):
+                raise TypeError("chunksize requires data to be a file path")
+            if chunksize <= 0:
+                raise ValueError("chunksize must be a positive integer")
+            self._source = Path(data)
+            self.df = None
+            logger.info(f"Streaming data from {data} in chunks of {chunksize} rows")
+        elif isinstance(data, (str, Path)) and engine == "polars":
+            frame = polars_engine.read_table(data, columns=self.columns)
+            self.df = frame.to_pandas()
+            self._cache()["polars_frame"] = frame
+            self._original_source = Path(data)
+            logger.info(f"Loaded data from {data}: {self.df.shape[0]} rows, {self.df.shape[1]} columns")
+        elif isinstance(data, (str, Path)):
+            self.df = read_table(data, columns=self.columns, **self._read_options)
+            self._original_source = Path(data)
+            logger.info(f"Loaded data from {data}: {self.df.shape[0]} rows, {self.df.shape[1]} columns")
+        elif isinstance(data, pd.DataFrame):
+            # Cleaning stages never modify their input, so in memory-efficient
+            # mode a shallow copy is enough and the caller's frame doubles as
+            # the original snapshot
+            if self.columns is not None:
+                data = data[self.columns]
+            self.df = data.copy(deep=not memory_efficient)
+            self._original_source = data
+            logger.info(f"Loaded DataFrame: {self.df.shape[0]} rows, {self.df.shape[1]} columns")
+        else:
+            raise TypeError("data must be a file path or pandas DataFrame")
+        
+        # Store original: reports only need its shape and columns; the full
+        # snapshot is kept eagerly unless memory-efficient mode is enabled,
+        # in which case it is reloaded from the source on demand
+        self.original_shape = self.df.shape if self.df is not None else None
+        self.original_columns = self.df.columns.tolist() if self.df is not None else None
+        if self.df is not None and not memory_efficient:
+            self._original_df = self.df.copy()
+        
         # Initialize tracking
         self.cleaning_log: List[str] = []
-        self._profile_cache: Dict[str, Any] = {}
+        self.profile_state: Optional[ProfileState] = None
+        self.cleaning_plan: Optional[CleaningPlan] = None
         
         # Auto-clean if requested
         if auto_clean:
             self.clean()
     
+    @property
+    def df(self) -> Optional[pd.DataFrame]:
+        """The working DataFrame."""
+        return self._df
+    
+    @df.setter
+    def df(self, value: Optional[pd.DataFrame]) -> None:
+        # Every assignment is a new version; cached artifacts become stale
+        self._df = value
+        self._version += 1
+    
+    @property
+    def original_df(self) -> Optional[pd.DataFrame]:
+        """The original DataFrame (reloaded from the source in memory-efficient mode)."""
+        if self._original_df is not None:
+            return self._original_df
+        if isinstance(self._original_source, Path) and self.engine == "polars":
+            return polars_engine.read_table(self._original_source, columns=self.columns).to_pandas()
+        if isinstance(self._original_source, Path):
+            return read_table(self._original_source, columns=self.columns, **self._read_options)
+        if isinstance(self._original_source, pd.DataFrame):
+            return self._original_source.copy(deep=False)
+        return None
+    
+    def _cache(self) -> ProfileCache:
+        """Return the profile cache bound to the current DataFrame version."""
+        return self._profile_cache.bind((self._version, frame_fingerprint(self._df)))
+    
+    def _polars_frame(self):
+        """Polars copy of the current DataFrame (cached per version)."""
+        return self._cache().get_or_compute(
+            "polars_frame", lambda: polars_engine.from_pandas(self.df)
+        )
+    
+    def _numeric_stats(self) -> pd.DataFrame:
+        """Numeric statistics of the current DataFrame (cached per version)."""
+        if self.engine == "polars":
+            compute = lambda: polars_engine.compute_numeric_stats(self._polars_frame())
+        else:
+            sketch = self._sketch()
+            compute = lambda: compute_numeric_stats(
+                self.df,
+                workers=self._workers(),
+                quantile_error=sketch["quantile_error"] if sketch else None
+            )
+        return self._cache().get_or_compute("numeric_stats", compute)
+    
+    def _histograms(self, frame: Optional[pd.DataFrame] = None) -> Dict[str, Any]:
+        """Binned histograms of the numeric columns (cached per version)."""
+        bins = self.config.get("profiling", {}).get("histogram_bins", DEFAULT_BINS)
+        compute = lambda: compute_histograms(
+            self.df if frame is None else frame, bins=bins, workers=self._workers()
+        )
+        if frame is not None:
+            return compute()
+        return self._cache().get_or_compute("histograms", compute)
+    
+    def _correlations(self, frame: Optional[pd.DataFrame] = None) -> Dict[str, Any]:
+        """
+        Correlation matrix (``profiling.correlation_method``) and strongest
+        pairs (``profiling.correlation_top_k``, ``profiling.correlation_threshold``)
+        of the current DataFrame or of a sample of it. The full-data results
+        are cached per version and shared by profiling, plots and reports.
+        """
+        profiling_config = self.config.get("profiling", {})
+        target = self.df if frame is None else frame
+        
+        def compute() -> Dict[str, Any]:
+            corr_matrix = compute_correlations(
+                target,
+                method=profiling_config.get("correlation_method", "pearson"),
+                spill_dir=profiling_config.get("correlation_spill_dir"),
+                max_rows=profiling_config.get("correlation_max_rows"),
+                workers=self._workers()
+            )
+            pairs = None
+            if corr_matrix is not None:
+                pairs = strongest_correlations(
+                    corr_matrix,
+                    top_k=profiling_config.get("correlation_top_k", DEFAULT_TOP_K),
+                    threshold=profiling_config.get("correlation_threshold")
+                )
+            return {"correlations": corr_matrix, "correlation_pairs": pairs}
+        
+        if frame is not None:
+            return compute()
+        
+        cache = self._cache()
+        if "correlations" not in cache:
+            cache.update(compute())
+        return {key: cache[key] for key in ("correlations", "correlation_pairs")}
+    
+    def _workers(self) -> int:
+        """Thread count for column-parallel work (``profiling.workers``)."""
+        return self.config.get("profiling", {}).get("workers", 1)
+    
+    def _sketch(self) -> Optional[Dict[str, float]]:
+        """Sketch error bounds if ``profiling.approximate`` is enabled, else None."""
+        return sketch_settings(self.config.get("profiling", {}))
+    
+    def _null_counts(self) -> pd.Series:
+        """Per-column null counts of the current DataFrame (cached per version)."""
+        if self.engine == "polars":
+            compute = lambda: polars_engine.null_counts(self._polars_frame())
+        else:
+            compute = lambda: self.df.isnull().sum()
+        return self._cache().get_or_compute("null_counts", compute)
+    
+    def _row_fingerprints(self) -> np.ndarray:
+        """64-bit fingerprint of every row (cached per version)."""
+        return self._cache().get_or_compute("row_fingerprints", lambda: row_fingerprints(self.df))
+    
+    def clear_cache(self) -> "DataCmp":
+        """
+        Drop all cached profiling artifacts.
+        
+        Only needed after mutating ``df`` in place; assigning a new DataFrame
+        to ``df`` (as ``clean()`` and ``reset()`` do) invalidates automatically.
+        
+        Returns:
+            self for method chaining
+        """
+        self._profile_cache.clear()
+        return self
+    
     def _default_config(self) -> Dict[str, Any]:
         """Return default configuration."""
         return {
@@ -102,6 +316,9 @@ class DataCmp:
                     "method": "iqr",
                     "iqr_multiplier": 1.5,
                     "action": "cap"
+                },
+                "optimize_dtypes": {
+                    "enabled": True
                 }
             },
             "drop_duplicates": True,
@@ -116,7 +333,8 @@ class DataCmp:
         columns: bool = True,
         missing: bool = True,
         outliers: bool = True,
-        duplicates: bool = True
+        duplicates: bool = True,
+        dtypes: bool = True
     ) -> "DataCmp":
         """
         Clean the dataset using various strategies.
@@ -126,6 +344,8 @@ class DataCmp:
             missing: Handle missing values
             outliers: Handle outliers
             duplicates: Remove duplicates
+            dtypes: Shrink column dtypes before the other stages
+                (``cleaning.optimize_dtypes``; in-memory pandas engine only)
         
         Returns:
             self for method chaining
@@ -135,87 +355,429 @@ class DataCmp:
         """
         logger.info("Starting data cleaning...")
         
+        if self.streaming:
+            self._stream_params, log = fit_streaming(
+                self._source,
+                self.config,
+                chunksize=self.chunksize,
+                columns=columns,
+                missing=missing,
+                outliers=outliers,
+                duplicates=duplicates,
+                usecols=self.columns
+            )
+            self.cleaning_log.extend(log)
+            logger.info("Cleaning parameters fitted; they are applied on export")
+            return self
+        
+        if self.engine == "polars":
+            frame, log = polars_engine.clean(
+                self._polars_frame(),
+                self.config,
+                columns=columns,
+                missing=missing,
+                outliers=outliers,
+                duplicates=duplicates
+            )
+            self.df = frame.to_pandas()
+            self._cache()["polars_frame"] = frame
+            self.cleaning_log.extend(log)
+            logger.info(f"Cleaning complete. Final shape: {self.df.shape}")
+            return self
+        
+        # Runs first so every later stage works on the smaller representation
+        dtype_config = self.config.get("cleaning", {}).get("optimize_dtypes", {})
+        if dtypes and dtype_config.get("enabled", True):
+            self.df, log = optimize_dtypes(self.df, dtype_config, workers=self._workers())
+            self.cleaning_log.extend(log)
+        
+        # Every fitted parameter is recorded so the cleaning can be replayed
+        plan = CleaningPlan()
+        
         if columns:
+            original_columns = self.df.columns
             self.df, log = clean_column_names(self.df)
             self.cleaning_log.extend(log)
+            plan.rename = {
+                orig: cleaned for orig, cleaned in zip(original_columns, self.df.columns)
+                if orig != cleaned
+            }
         
-        if duplicates and self.config.get("drop_duplicates", True):
-            initial_rows = len(self.df)
-            self.df = self.df.drop_duplicates()
-            dropped = initial_rows - len(self.df)
-            if dropped > 0:
-                msg = f"Removed {dropped} duplicate rows"
-                logger.info(msg)
-                self.cleaning_log.append(msg)
-        
-        if missing:
-            self.df, log = handle_missing_values(
+        dedup_enabled, subset = duplicate_settings(self.config)
+        if duplicates and dedup_enabled:
+            plan.duplicates, plan.duplicate_subset = True, subset
+            # Whole-row fingerprints are shared with the duplicate count in
+            # compute_statistics
+            deduped, log = drop_duplicates(
                 self.df,
-                self.config.get("cleaning", {})
+                subset=subset,
+                fingerprints=self._row_fingerprints() if subset is None else None
             )
-            self.cleaning_log.extend(log)
+            if log:
+                self.df = deduped
+                self.cleaning_log.extend(log)
         
-        if outliers and self.config.get("cleaning", {}).get("outlier_handling", {}).get("enabled", False):
-            self.df, log = handle_outliers(
+        if missing:
+            drop_cols, fill_values, log = compute_fill_values(
                 self.df,
-                self.config.get("cleaning", {}).get("outlier_handling", {})
+                self.config.get("cleaning", {}),
+                workers=self._workers()
             )
+            self.df = apply_fill_values(self.df, drop_cols, fill_values)
             self.cleaning_log.extend(log)
+            plan.drop_columns, plan.fill_values = drop_cols, fill_values
+        
+        outlier_config = self.config.get("cleaning", {}).get("outlier_handling", {})
+        if outliers and outlier_config.get("enabled", False):
+            sketch = self._sketch()
+            if sketch:
+                outlier_config = {**outlier_config, "sketch": sketch}
+            action = outlier_config.get("action", "cap")
+            bounds = compute_outlier_bounds(self.df, outlier_config).dropna()
+            self.df, counts = apply_outlier_bounds(self.df, bounds, action)
+            self.cleaning_log.extend(outlier_log(counts, action))
+            if action in ("cap", "remove"):
+                plan.outlier_action = action
+            plan.outlier_bounds = {
+                col: (row["lower"], row["upper"]) for col, row in bounds.iterrows()
+            }
+        
+        # Normalizes the recorded values (numpy scalars, tuples) for saving
+        self.cleaning_plan = CleaningPlan.from_dict(plan.to_dict())
         
         logger.info(f"Cleaning complete. Final shape: {self.df.shape}")
         return self
     
-    def profile(self, detailed: bool = True) -> "DataCmp":
+    def fit(
+        self,
+        columns: bool = True,
+        missing: bool = True,
+        outliers: bool = True,
+        duplicates: bool = True,
+        dtypes: bool = True
+    ) -> "DataCmp":
+        """
+        Clean the dataset and learn a replayable ``CleaningPlan``.
+        
+        Runs ``clean()`` with the same arguments. The learned renames,
+        dropped columns, fill values, outlier bounds and duplicate keys are
+        stored in ``cleaning_plan``, which can be saved next to the config and
+        applied to new data with ``transform()`` (or ``datacmp apply``).
+        
+        Args:
+            columns: Clean column names
+            missing: Handle missing values
+            outliers: Handle outliers
+            duplicates: Remove duplicates
+            dtypes: Shrink column dtypes (not recorded in the plan)
+        
+        Returns:
+            self for method chaining
+        
+        Example:
+            >>> DataCmp("train.csv").fit().cleaning_plan.save("plan.yaml")
+        """
+        self._require_in_memory("fit()")
+        if self.engine != "pandas":
+            raise ValueError("fit() requires engine='pandas'")
+        return self.clean(
+            columns=columns,
+            missing=missing,
+            outliers=outliers,
+            duplicates=duplicates,
+            dtypes=dtypes
+        )
+    
+    def transform(self, plan: Union[str, Path, CleaningPlan]) -> "DataCmp":
+        """
+        Clean the dataset with a fitted plan instead of computing statistics.
+        
+        Args:
+            plan: CleaningPlan, or a plan file saved with ``CleaningPlan.save``
+        
+        Returns:
+            self for method chaining
+        
+        Example:
+            >>> DataCmp("batch.csv").transform("plan.yaml").export("scored.parquet")
+        """
+        self._require_in_memory("transform()")
+        if not isinstance(plan, CleaningPlan):
+            plan = CleaningPlan.load(plan)
+        self.df, log = plan.transform(self.df)
+        self.cleaning_log.extend(log)
+        return self
+    
+    def profile(
+        self,
+        detailed: bool = True,
+        sample: Optional[Union[float, int]] = None,
+        stratify: Optional[str] = None,
+        seed: int = 0
+    ) -> "DataCmp":
         """
         Generate profiling information for the dataset.
         
         Args:
             detailed: Include extended statistics
+            sample: Profile a seeded random sample instead of every row: a
+                fraction (float) or a number of rows (int). Row counts and null
+                counts still come from the full data and the report lists
+                confidence intervals for the sampled statistics.
+            stratify: Column to stratify the sample by
+            seed: Random seed for the sample
         
         Returns:
             self for method chaining
         
         Example:
             >>> cmp.profile()
+            >>> cmp.profile(sample=0.01, stratify="country")
         """
+        self._require_in_memory("profile()")
+        
+        if sample is not None:
+            return self._profile_sample(detailed, sample, stratify, seed)
+        
         logger.info("Generating data profile...")
         
-        self._profile_cache["summary"] = generate_summary(
+        cache = self._cache()
+        cache.pop("sampling", None)
+        cache.pop("incremental", None)
+        
+        # One fused pass over the numeric block feeds both summary and statistics
+        numeric_stats = self._numeric_stats()
+        null_counts = self._null_counts()
+        
+        cache["summary"] = generate_summary(
             self.df,
-            self.config.get("profiling", {})
+            self.config.get("profiling", {}),
+            numeric_stats=numeric_stats,
+            null_counts=null_counts
         )
         
         if detailed:
-            self._profile_cache["statistics"] = compute_statistics(self.df)
+            cache["statistics"] = compute_statistics(
+                self.df,
+                numeric_stats=numeric_stats,
+                null_counts=null_counts,
+                workers=self._workers(),
+                sketch=self._sketch(),
+                fingerprints=self._row_fingerprints()
+            )
+            self._histograms()
             
             if self.config.get("profiling", {}).get("compute_correlations", True):
-                self._profile_cache["correlations"] = compute_correlations(self.df)
+                self._correlations()
         
         logger.info("Profiling complete")
         return self
     
-    def visualize(self, output_dir: Optional[Union[str, Path]] = None) -> "DataCmp":
+    def profile_incremental(
+        self,
+        new_batch: Optional[Union[str, Path, pd.DataFrame]] = None,
+        state: Optional[Union[str, Path, ProfileState]] = None
+    ) -> "DataCmp":
+        """
+        Add a batch of rows to a persistent profile without rescanning the rest.
+        
+        The profile is ``profile_state``, a ``ProfileState`` of mergeable
+        per-column summaries; adding a batch costs O(batch). The summary,
+        statistics and histograms used by ``get_summary()``, ``visualize()``
+        and ``export()`` reports are then rendered from the state.
+        
+        - Without ``state``, the first call starts the profile from the
+          current DataFrame and adds ``new_batch`` to it.
+        - With ``state`` (a ProfileState or a file written by
+          ``ProfileState.save``), the profile continues from it and
+          ``new_batch`` (default: the current DataFrame) is added.
+        
+        Batches are profiled as given, so clean them the same way as the
+        rows already in the profile.
+        
+        Args:
+            new_batch: New rows: a DataFrame or a file path (read with the
+                same columns and ``io.read`` options as the input)
+            state: ProfileState or saved state file to continue from
+        
+        Returns:
+            self for method chaining
+        
+        Example:
+            >>> cmp = DataCmp("history.parquet").clean()
+            >>> cmp.profile_incremental("2024-06-02.parquet").export("report.html")
+            >>> cmp.profile_state.save("profile.state")
+            >>> DataCmp("2024-06-03.parquet").clean().profile_incremental(state="profile.state")
+        """
+        self._require_in_memory("profile_incremental()")
+        
+        if isinstance(new_batch, (str, Path)):
+            new_batch = read_table(new_batch, columns=self.columns, **self._read_options)
+        
+        profiling_config = self.config.get("profiling", {})
+        if state is not None:
+            self.profile_state = state if isinstance(state, ProfileState) else ProfileState.load(state)
+            if new_batch is None:
+                new_batch = self.df
+        elif self.profile_state is None:
+            self.profile_state = ProfileState.from_config(profiling_config).update(self.df)
+        
+        if new_batch is not None:
+            self.profile_state.update(new_batch)
+        
+        profile_state = self.profile_state
+        logger.info(
+            f"Updated incremental profile: {profile_state.rows} rows in {profile_state.batches} batches"
+        )
+        
+        cache = self._cache()
+        for key in ("sampling", "correlations", "correlation_pairs", "plots"):
+            cache.pop(key, None)
+        cache["summary"] = profile_state.summary(profiling_config.get("include_more_stats", True))
+        cache["statistics"] = profile_state.statistics()
+        cache["histograms"] = profile_state.histograms()
+        cache["incremental"] = {
+            "rows": profile_state.rows,
+            "columns": len(profile_state.columns),
+            "batches": profile_state.batches,
+        }
+        return self
+    
+    def _sample(self, sample: Union[float, int], stratify: Optional[str], seed: int) -> pd.DataFrame:
+        """Seeded sample of the current DataFrame (cached per version and spec)."""
+        return self._cache().get_or_compute(
+            f"sample:{sample!r}:{stratify}:{seed}",
+            lambda: sample_frame(self.df, sample, stratify=stratify, seed=seed)
+        )
+    
+    def _profile_sample(
+        self,
+        detailed: bool,
+        sample: Union[float, int],
+        stratify: Optional[str],
+        seed: int
+    ) -> "DataCmp":
+        """Profile a sample; exact row and null counts come from the full data."""
+        cache = self._cache()
+        frame = self._sample(sample, stratify, seed)
+        logger.info(f"Generating data profile on a sample of {len(frame)} rows...")
+        
+        profiling_config = self.config.get("profiling", {})
+        sketch = self._sketch()
+        null_counts = self._null_counts()
+        total_rows = len(self.df)
+        
+        numeric_stats = compute_numeric_stats(
+            frame,
+            workers=self._workers(),
+            quantile_error=sketch["quantile_error"] if sketch else None
+        )
+        
+        cache["summary"] = generate_summary(
+            frame,
+            profiling_config,
+            numeric_stats=numeric_stats,
+            null_counts=null_counts,
+            total_rows=total_rows
+        )
+        
+        sampling = {
+            "sample": sample,
+            "stratify": stratify,
+            "seed": seed,
+            "rows": len(frame),
+            "total_rows": total_rows,
+            "confidence_level": profiling_config.get("confidence_level", DEFAULT_CONFIDENCE_LEVEL),
+        }
+        
+        if detailed:
+            cache["statistics"] = compute_statistics(
+                frame,
+                numeric_stats=numeric_stats,
+                null_counts=null_counts,
+                workers=self._workers(),
+                sketch=sketch,
+                total_rows=total_rows
+            )
+            sampling["intervals"] = confidence_intervals(
+                frame,
+                numeric_stats,
+                null_counts,
+                total_rows,
+                level=sampling["confidence_level"]
+            )
+            sampling["histograms"] = self._histograms(frame)
+            
+            if profiling_config.get("compute_correlations", True):
+                sampling.update(self._correlations(frame))
+        
+        cache["sampling"] = sampling
+        logger.info("Profiling complete")
+        return self
+    
+    def visualize(
+        self,
+        output_dir: Optional[Union[str, Path]] = None,
+        sample: Optional[Union[float, int]] = None,
+        stratify: Optional[str] = None,
+        seed: int = 0
+    ) -> "DataCmp":
         """
         Create visualizations for the dataset.
         
         Args:
             output_dir: Directory to save plots (optional)
+            sample: Plot a seeded random sample: a fraction (float) or a number
+                of rows (int). Missing-value counts still use every row.
+            stratify: Column to stratify the sample by
+            seed: Random seed for the sample
         
         Returns:
             self for method chaining
         
         Example:
             >>> cmp.visualize("./plots")
+            >>> cmp.visualize("./plots", sample=100_000)
         """
+        self._require_in_memory("visualize()")
         logger.info("Creating visualizations...")
         
+        # matplotlib and seaborn are only imported when plotting
+        from ..visuals.plots import create_visualizations, MAX_HEATMAP_COLUMNS
+        
+        cache = self._cache()
+        
+        if sample is None:
+            frame = self.df
+            corr_matrix = self._correlations()["correlations"]
+            histograms = self._histograms()
+        else:
+            frame = self._sample(sample, stratify, seed)
+            sampling = cache.get("sampling", {})
+            same_sample = [sampling.get(key) for key in ("sample", "stratify", "seed")] == [sample, stratify, seed]
+            if same_sample and "correlations" in sampling:
+                corr_matrix = sampling["correlations"]
+            else:
+                corr_matrix = self._correlations(frame)["correlations"]
+            if same_sample and "histograms" in sampling:
+                histograms = sampling["histograms"]
+            else:
+                histograms = self._histograms(frame)
+        
         plots = create_visualizations(
-            self.df,
+            frame,
             output_dir=output_dir,
-            show_plots=output_dir is None
+            show_plots=output_dir is None,
+            null_counts=self._null_counts(),
+            corr_matrix=corr_matrix,
+            histograms=histograms,
+            workers=self._workers(),
+            max_heatmap_columns=self.config.get("visualization", {}).get(
+                "max_features_correlation", MAX_HEATMAP_COLUMNS
+            )
         )
         
-        self._profile_cache["plots"] = plots
+        cache["plots"] = plots
         logger.info(f"Created {len(plots)} visualizations")
         return self
     
@@ -230,7 +792,8 @@ class DataCmp:
         
         Args:
             output: Output file path
-            format: Export format ('csv', 'html', 'txt'). Auto-detected from extension if None
+            format: Export format ('csv', 'parquet', 'feather', 'arrow', 'html', 'txt',
+                'json'). Auto-detected from extension if None
             include_plots: Include visualizations in reports
         
         Returns:
@@ -238,28 +801,48 @@ class DataCmp:
         
         Example:
             >>> cmp.export("cleaned_data.csv")
+            >>> cmp.export("cleaned_data.parquet")
             >>> cmp.export("report.html")
+            >>> cmp.export("profile.json")
         """
         output_path = Path(output)
         
         if format is None:
-            format = output_path.suffix.lstrip('.')
+            format = detect_format(output_path) or output_path.suffix.lstrip('.')
         
         format = format.lower()
         
-        if format == "csv":
+        from ..visuals.reports import generate_html_report, generate_txt_report, generate_json_report
+        
+        if self.streaming:
+            if format != "csv":
+                self._require_in_memory(f"{format} export")
+            self._export_streaming(output_path)
+        
+        elif format == "csv":
             self.df.to_csv(output_path, index=False)
             logger.info(f"Exported cleaned data to {output_path}")
         
+        elif format in TABLE_FORMATS.values():
+            parquet_config = self.config.get("export", {}).get("parquet", {})
+            write_table(
+                self.df,
+                output_path,
+                format=format,
+                compression=parquet_config.get("compression", DEFAULT_PARQUET_COMPRESSION),
+                row_group_size=parquet_config.get("row_group_size")
+            )
+            logger.info(f"Exported cleaned data to {output_path} ({format})")
+        
         elif format == "html":
-            # Ensure we have profiling data
-            if not self._profile_cache:
+            # Ensure we have profiling data for the current DataFrame
+            if "summary" not in self._cache():
                 self.profile()
             
             generate_html_report(
                 self.df,
-                self.original_df,
-                self._profile_cache,
+                self.original_shape,
+                self._cache(),
                 self.cleaning_log,
                 output_path,
                 include_plots=include_plots
@@ -267,23 +850,68 @@ class DataCmp:
             logger.info(f"Generated HTML report: {output_path}")
         
         elif format == "txt":
-            if not self._profile_cache:
+            if "summary" not in self._cache():
                 self.profile()
             
             generate_txt_report(
                 self.df,
-                self.original_df,
-                self._profile_cache,
+                self.original_shape,
+                self._cache(),
                 self.cleaning_log,
                 output_path
             )
             logger.info(f"Generated text report: {output_path}")
         
+        elif format == "json":
+            if "summary" not in self._cache():
+                self.profile()
+            
+            generate_json_report(
+                self.df,
+                self.original_shape,
+                self._cache(),
+                self.cleaning_log,
+                output_path
+            )
+            logger.info(f"Generated JSON report: {output_path}")
+        
         else:
             raise ValueError(f"Unsupported format: {format}")
         
         return self
     
+    def _export_streaming(self, output_path: Path) -> None:
+        """Apply fitted cleaning parameters chunk by chunk and write CSV."""
+        if self._stream_params is not None:
+            params = self._stream_params
+        else:
+            engine, dtype = read_schema(self._source, self.config, self.columns)
+            params = {"usecols": self.columns, "engine": engine, "dtype": dtype}
+        meta, log = apply_streaming(
+            self._source,
+            params,
+            output_path,
+            chunksize=self.chunksize
+        )
+        self.cleaning_log.extend(log)
+        logger.info(
+            f"Exported cleaned data to {output_path}: "
+            f"{meta['rows']} rows, {len(meta['columns'])} columns"
+        )
+    
+    @property
+    def streaming(self) -> bool:
+        """Whether this instance processes its input in chunks."""
+        return self.chunksize is not None
+    
+    def _require_in_memory(self, operation: str) -> None:
+        """Raise if an operation needs the full DataFrame in streaming mode."""
+        if self.streaming:
+            raise RuntimeError(
+                f"{operation} is not available in streaming mode; "
+                "load the data without chunksize to use it"
+            )
+    
     def reset(self) -> "DataCmp":
         """
         Reset to original DataFrame.
@@ -291,27 +919,43 @@ class DataCmp:
         Returns:
             self for method chaining
         """
-        self.df = self.original_df.copy()
+        if self.streaming:
+            self._stream_params = None
+            self.cleaning_log = []
+            self._profile_cache.clear()
+            logger.info("Reset streaming cleaning parameters")
+            return self
+        
+        if self._original_df is not None:
+            self.df = self._original_df.copy()
+        else:
+            self.df = self.original_df
         self.cleaning_log = []
-        self._profile_cache = {}
+        self.cleaning_plan = None
         logger.info("Reset to original DataFrame")
         return self
     
     def get_summary(self) -> str:
         """Get dataset summary as string."""
-        if "summary" not in self._profile_cache:
-            self._profile_cache["summary"] = generate_summary(
+        self._require_in_memory("get_summary()")
+        cache = self._cache()
+        if "summary" not in cache:
+            cache["summary"] = generate_summary(
                 self.df,
-                self.config.get("profiling", {})
+                self.config.get("profiling", {}),
+                numeric_stats=self._numeric_stats(),
+                null_counts=self._null_counts()
             )
-        return self._profile_cache["summary"]
+        return cache["summary"]
     
     def get_cleaning_log(self) -> List[str]:
         """Get list of cleaning operations performed."""
         return self.cleaning_log.copy()
     
     def __repr__(self) -> str:
+        if self.streaming:
+            return f"DataCmp(source={self._source}, chunksize={self.chunksize}, cleaned={len(self.cleaning_log) > 0})"
         return f"DataCmp(shape={self.df.shape}, cleaned={len(self.cleaning_log) > 0})"
     
     def __str__(self) -> str:
-        return self.get_summary()
\ No newline at end of file
+        return self.get_summary()
@@ -0,0 +1,252 @@
+"""
+Multi-file batch execution.
+
+``run_batch`` runs ``run_pipeline`` over many input files in a process
+pool. Every worker imports datacmp once and then processes files one after
+another, so the interpreter and import startup is paid per worker instead
+of per file. A failing file is recorded in the summary and never stops the
+others.
+"""
+
+import glob
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+import pandas as pd
+
+from ..utils.io import TABLE_FORMATS, detect_format
+from ..utils.logger import get_logger
+from ..utils.parallel import resolve_workers
+
+logger = get_logger(__name__)
+
+SUMMARY_FILE = "batch_summary.csv"
+SUMMARY_COLUMNS = ["input", "status", "rows", "columns", "seconds", "export", "report", "error"]
+
+# Suffixes of compressed CSV files, stripped together with the format suffix
+_COMPRESSION_SUFFIXES = (".gz", ".bz2", ".zip", ".xz", ".zst")
+
+_REPORT_FORMATS = ("html", "txt", "json")
+
+
+def expand_inputs(patterns: Sequence[Union[str, Path]]) -> List[Path]:
+    """
+    Expand glob patterns into a sorted, de-duplicated list of files.
+
+    Args:
+        patterns: File paths or glob patterns such as ``data/*.csv``
+
+    Returns:
+        Matching file paths, in pattern order
+
+    Example:
+        >>> expand_inputs(["data/2024-*.csv", "extra.parquet"])
+    """
+    paths: List[Path] = []
+    seen = set()
+    for pattern in patterns:
+        pattern = str(pattern)
+        if glob.has_magic(pattern):
+            matches = sorted(glob.glob(pattern, recursive=True))
+            if not matches:
+                logger.warning(f"No files match {pattern!r}")
+        else:
+            matches = [pattern]
+        for match in matches:
+            path = Path(match)
+            if path.is_dir():
+                continue
+            if path.resolve() not in seen:
+                seen.add(path.resolve())
+                paths.append(path)
+    return paths
+
+
+def output_stem(path: Union[str, Path]) -> str:
+    """File name without its format (and compression) suffix: ``data.csv.gz`` → ``data``."""
+    path = Path(path)
+    if path.suffix.lower() in _COMPRESSION_SUFFIXES:
+        path = path.with_suffix("")
+    return path.stem
+
+
+def run_batch(
+    inputs: Sequence[Union[str, Path]],
+    out_dir: Union[str, Path],
+    jobs: Optional[int] = 1,
+    export_format: Optional[str] = None,
+    report_format: Optional[str] = None,
+    verbose: bool = True,
+    **pipeline_options: Any
+) -> pd.DataFrame:
+    """
+    Run the pipeline over many files in a process pool.
+
+    Each input ``<stem>.<ext>`` produces ``<out_dir>/<stem>.<export_format>``
+    and, with ``report_format``, ``<out_dir>/<stem>_report.<report_format>``.
+    The summary is also written to ``<out_dir>/batch_summary.csv``.
+
+    Args:
+        inputs: File paths or glob patterns
+        out_dir: Output directory (created if missing)
+        jobs: Worker processes (1 runs in this process, -1 uses all cores)
+        export_format: Format of the cleaned data ('csv', 'parquet',
+            'feather' or 'arrow'; default: the input's format)
+        report_format: Report format ('html', 'txt' or 'json'; default: no
+            report)
+        verbose: Print one progress line per finished file
+        **pipeline_options: Passed to ``run_pipeline`` (``config_path``,
+            ``engine``, ``chunksize``, ``cache_dir``, ...)
+
+    Returns:
+        Summary DataFrame with one row per input: ``input``, ``status``
+        ('ok' or 'failed'), ``rows``, ``columns``, ``seconds``, ``export``,
+        ``report`` and ``error``
+
+    Example:
+        >>> summary = run_batch(["data/*.csv"], "out", jobs=8, export_format="parquet")
+        >>> summary[summary["status"] == "failed"]
+    """
+    paths = expand_inputs(inputs)
+    if not paths:
+        raise ValueError("No input files found")
+    if export_format is not None and export_format not in TABLE_FORMATS.values():
+        raise ValueError(f"Unsupported export format: {export_format}")
+    if report_format is not None and report_format not in _REPORT_FORMATS:
+        raise ValueError(f"Unsupported report format: {report_format}")
+
+    if pipeline_options.get("chunksize") is not None:
+        _check_streaming(paths, export_format, report_format, pipeline_options)
+
+    stems = pd.Series([output_stem(path) for path in paths])
+    clashes = sorted(set(stems[stems.duplicated()]))
+    if clashes:
+        raise ValueError(f"Inputs would write the same output files: {clashes}")
+
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    tasks = []
+    for path, stem in zip(paths, stems):
+        data_format = export_format or detect_format(path) or "csv"
+        tasks.append({
+            "input": str(path),
+            "export": str(out_dir / f"{stem}.{data_format}"),
+            "report": str(out_dir / f"{stem}_report.{report_format}") if report_format else None,
+            "options": pipeline_options,
+        })
+
+    workers = min(resolve_workers(jobs), len(tasks))
+    logger.info(f"Running {len(tasks)} files with {workers} worker processes")
+    started = time.perf_counter()
+
+    results: List[Optional[Dict[str, Any]]] = [None] * len(tasks)
+
+    def record(index: int, result: Dict[str, Any]) -> None:
+        results[index] = result
+        if verbose:
+            done = sum(item is not None for item in results)
+            status = "ok" if result["status"] == "ok" else f"FAILED: {result['error']}"
+            print(f"[{done}/{len(tasks)}] {result['input']} ({result['seconds']:.2f}s) {status}")
+
+    if workers <= 1:
+        for index, task in enumerate(tasks):
+            record(index, _run_task(task))
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_warm_up) as pool:
+            futures = {pool.submit(_run_task, task): index for index, task in enumerate(tasks)}
+            for future in as_completed(futures):
+                index = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    # The worker process itself died (e.g. killed for memory)
+                    result = _failure(tasks[index], e, 0.0)
+                record(index, result)
+
+    summary = pd.DataFrame(results, columns=SUMMARY_COLUMNS).astype({"rows": "Int64", "columns": "Int64"})
+    summary.to_csv(out_dir / SUMMARY_FILE, index=False)
+
+    failed = int((summary["status"] == "failed").sum())
+    logger.info(
+        f"Batch finished in {time.perf_counter() - started:.2f}s: "
+        f"{len(summary) - failed} succeeded, {failed} failed"
+    )
+    return summary
+
+
+def _check_streaming(
+    paths: List[Path],
+    export_format: Optional[str],
+    report_format: Optional[str],
+    pipeline_options: Dict[str, Any]
+) -> None:
+    """Reject options streaming mode cannot run, before any worker starts."""
+    if report_format is not None:
+        raise ValueError("Reports are not available in streaming mode")
+    if pipeline_options.get("engine", "pandas") != "pandas":
+        raise ValueError(f"engine={pipeline_options['engine']!r} is not available in streaming mode")
+    if pipeline_options.get("sample") is not None:
+        raise ValueError("Sampling is not available in streaming mode")
+    if export_format not in (None, "csv"):
+        raise ValueError(f"Streaming mode writes CSV only, not {export_format}; use export_format='csv'")
+    if export_format is None:
+        other = [str(path) for path in paths if (detect_format(path) or "csv") != "csv"]
+        if other:
+            raise ValueError(
+                f"Streaming mode writes CSV only; use export_format='csv' for the non-CSV inputs "
+                f"({', '.join(other[:3])}{', ...' if len(other) > 3 else ''})"
+            )
+
+
+def _warm_up() -> None:
+    """Import the pipeline once per worker process."""
+    from . import runner  # noqa: F401
+
+
+def _run_task(task: Dict[str, Any]) -> Dict[str, Any]:
+    """Run the pipeline on one file, turning any error into a failure record."""
+    from .runner import run_pipeline
+
+    started = time.perf_counter()
+    try:
+        df = run_pipeline(
+            task["input"],
+            export_csv_path=task["export"],
+            export_report_path=task["report"],
+            verbose=False,
+            **task["options"]
+        )
+    except Exception as e:
+        logger.error(f"Pipeline failed for {task['input']}: {e}")
+        logger.debug(traceback.format_exc())
+        return _failure(task, e, time.perf_counter() - started)
+
+    return {
+        "input": task["input"],
+        "status": "ok",
+        # Streaming runs do not keep the cleaned data in memory
+        "rows": df.shape[0] if df is not None else None,
+        "columns": df.shape[1] if df is not None else None,
+        "seconds": time.perf_counter() - started,
+        "export": task["export"],
+        "report": task["report"],
+        "error": None,
+    }
+
+
+def _failure(task: Dict[str, Any], error: BaseException, seconds: float) -> Dict[str, Any]:
+    """Summary record of a failed file."""
+    return {
+        "input": task["input"],
+        "status": "failed",
+        "rows": None,
+        "columns": None,
+        "seconds": seconds,
+        "export": None,
+        "report": None,
+        "error": f"{type(error).__name__}: {error}",
+    }
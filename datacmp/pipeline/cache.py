@@ -0,0 +1,345 @@
+"""
+Persistent on-disk cache of pipeline results.
+
+A cache entry holds everything ``run_pipeline`` produces for one input file
+and configuration: the cleaned data (Parquet), the profile artifacts and the
+rendered reports. Entries are content-addressed: the key hashes the bytes of
+the input file, the normalized configuration and the options that change the
+result, so re-running an unchanged pipeline only copies the stored outputs.
+
+The cache is bounded in size; the least recently used entries are evicted
+first. Entries contain pickles: only use cache directories you trust.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import shutil
+import time
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional, Union
+
+import pandas as pd
+
+from ..utils.io import DEFAULT_PARQUET_COMPRESSION, detect_format, require_pyarrow, write_table
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_CACHE_MAX_BYTES = 1024**3
+
+# Report formats stored per entry
+REPORT_FORMATS = ("html", "txt", "json")
+
+# Profile artifacts that are not worth persisting (large, cheap to rebuild
+# or tied to the running process)
+_TRANSIENT_ARTIFACTS = ("polars_frame", "row_fingerprints", "plots")
+
+_HASH_BLOCK = 1024**2
+_DATA_FILE = "data.parquet"
+_PROFILE_FILE = "profile.pkl"
+_META_FILE = "meta.json"
+_DIGESTS_FILE = "digests.json"
+
+
+def config_digest(config: Optional[Mapping[str, Any]]) -> str:
+    """
+    Hash of a configuration dictionary, independent of key order.
+
+    Args:
+        config: Configuration dictionary (None for the built-in defaults)
+
+    Returns:
+        Hex digest
+    """
+    normalized = json.dumps(config, sort_keys=True, default=str)
+    return hashlib.blake2b(normalized.encode(), digest_size=16).hexdigest()
+
+
+def file_digest(path: Union[str, Path]) -> str:
+    """
+    Hash of the bytes of a file, read in 1 MB blocks.
+
+    Args:
+        path: File path
+
+    Returns:
+        Hex digest
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        while block := f.read(_HASH_BLOCK):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """
+    Content-addressed, size-bounded cache of pipeline results.
+
+    Every entry is a directory named after its key containing the cleaned
+    data (``data.parquet``), the pickled profile artifacts, the cleaning log
+    and the reports rendered so far. Reports in a format that has not been
+    rendered yet are generated from the stored profile, without re-running
+    the pipeline.
+
+    File digests are remembered by path, size and modification time, so an
+    unchanged input is not re-read to compute its key.
+
+    Args:
+        cache_dir: Cache directory (created if missing)
+        max_bytes: Total size above which least recently used entries are
+            evicted
+
+    Example:
+        >>> cache = ResultCache(".datacmp-cache")
+        >>> key = cache.key("data.csv", config)
+        >>> df = cache.restore(key, export_data_path="clean.parquet")
+        >>> if df is None:
+        ...     cmp = DataCmp("data.csv", config=config).clean().profile()
+        ...     cache.store(key, cmp)
+    """
+
+    def __init__(self, cache_dir: Union[str, Path], max_bytes: int = DEFAULT_CACHE_MAX_BYTES):
+        require_pyarrow("The result cache")
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+
+    def key(
+        self,
+        data: Union[str, Path],
+        config: Optional[Mapping[str, Any]],
+        **options: Any
+    ) -> str:
+        """
+        Cache key of a pipeline run.
+
+        Args:
+            data: Input file path
+            config: Normalized configuration (None for the defaults)
+            **options: Other settings that change the result (engine,
+                columns, sample, ...)
+
+        Returns:
+            Hex key
+        """
+        from .. import __version__
+
+        parts = {
+            "version": __version__,
+            "data": self._file_digest(Path(data)),
+            "config": config_digest(config),
+            "options": options,
+        }
+        return config_digest(parts)
+
+    def restore(
+        self,
+        key: str,
+        export_data_path: Optional[Union[str, Path]] = None,
+        export_report_path: Optional[Union[str, Path]] = None
+    ) -> Optional[pd.DataFrame]:
+        """
+        Write the cached outputs of a run and return its cleaned data.
+
+        Args:
+            key: Cache key from ``key()``
+            export_data_path: Where to write the cleaned data (format from
+                the extension)
+            export_report_path: Where to write the report (HTML, TXT or JSON)
+
+        Returns:
+            Cleaned DataFrame, or None if the key is not cached
+        """
+        entry = self.cache_dir / key
+        meta_path = entry / _META_FILE
+        if not meta_path.exists():
+            return None
+
+        with open(meta_path) as f:
+            meta = json.load(f)
+        df = pd.read_parquet(entry / _DATA_FILE)
+
+        if export_data_path:
+            self._export_data(entry, df, Path(export_data_path))
+        if export_report_path:
+            self._export_report(entry, df, meta, Path(export_report_path))
+
+        # Touch the entry: eviction order is least recently used
+        os.utime(meta_path)
+        logger.info(f"Restored cached result {key[:12]} ({df.shape[0]} rows, {df.shape[1]} columns)")
+        return df
+
+    def store(self, key: str, cmp: Any, report_path: Optional[Union[str, Path]] = None) -> None:
+        """
+        Add the result of a pipeline run to the cache.
+
+        Errors while writing the entry are logged and otherwise ignored.
+
+        Args:
+            key: Cache key from ``key()``
+            cmp: Cleaned and profiled DataCmp instance
+            report_path: Report written by the run, stored alongside
+        """
+        entry = self.cache_dir / key
+        if entry.exists():
+            return
+
+        # Written to a private directory and renamed into place, so
+        # concurrent runs never see a partial entry
+        staging = self.cache_dir / f".{key}.{os.getpid()}.tmp"
+        staging.mkdir(parents=True, exist_ok=True)
+        try:
+            parquet_config = cmp.config.get("export", {}).get("parquet", {})
+            compression = parquet_config.get("compression", DEFAULT_PARQUET_COMPRESSION)
+            write_table(
+                cmp.df,
+                staging / _DATA_FILE,
+                format="parquet",
+                compression=compression,
+                row_group_size=parquet_config.get("row_group_size")
+            )
+
+            profile = {
+                name: value for name, value in cmp._cache().items()
+                if name not in _TRANSIENT_ARTIFACTS
+            }
+            with open(staging / _PROFILE_FILE, "wb") as f:
+                pickle.dump(profile, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+            if report_path is not None:
+                report_format = Path(report_path).suffix.lstrip(".").lower()
+                if report_format in REPORT_FORMATS:
+                    shutil.copyfile(report_path, staging / f"report.{report_format}")
+
+            meta = {
+                "original_shape": list(cmp.original_shape),
+                "cleaning_log": cmp.cleaning_log,
+                "parquet_compression": compression,
+                "created": time.time(),
+            }
+            with open(staging / _META_FILE, "w") as f:
+                json.dump(meta, f)
+
+            os.replace(staging, entry)
+        except Exception as e:
+            # Caching is best-effort: a result that cannot be stored (another
+            # process stored the same key first, a full disk, data pyarrow
+            # or pickle cannot serialize) must not fail the run
+            if not entry.exists():
+                logger.warning(f"Could not cache result {key[:12]}: {type(e).__name__}: {e}")
+            return
+        finally:
+            if staging.exists():
+                shutil.rmtree(staging, ignore_errors=True)
+
+        logger.info(f"Cached result {key[:12]} in {entry}")
+        try:
+            self.evict(keep=key)
+        except OSError as e:
+            logger.warning(f"Could not evict cached results: {e}")
+
+    def evict(self, keep: Optional[str] = None) -> int:
+        """
+        Remove least recently used entries until the cache fits ``max_bytes``.
+
+        Args:
+            keep: Key of an entry that is never evicted (the newest one)
+
+        Returns:
+            Number of evicted entries
+        """
+        entries = []
+        for entry in self.cache_dir.iterdir():
+            meta_path = entry / _META_FILE
+            if entry.is_dir() and meta_path.exists():
+                entries.append((meta_path.stat().st_mtime, _directory_size(entry), entry))
+
+        total = sum(size for _, size, _ in entries)
+        evicted = 0
+        for _, size, entry in sorted(entries, key=lambda item: item[0]):
+            if total <= self.max_bytes:
+                break
+            if entry.name == keep:
+                continue
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= size
+            evicted += 1
+
+        if evicted:
+            logger.info(f"Evicted {evicted} cached results ({total / 1024**2:.1f} MB remaining)")
+        return evicted
+
+    def clear(self) -> None:
+        """Remove every cached result."""
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _file_digest(self, path: Path) -> str:
+        """Digest of an input file, reusing the remembered one if the file is unchanged."""
+        stat = path.stat()
+        signature = [stat.st_size, stat.st_mtime_ns]
+        digests_path = self.cache_dir / _DIGESTS_FILE
+        try:
+            with open(digests_path) as f:
+                digests = json.load(f)
+        except (OSError, ValueError):
+            digests = {}
+
+        name = str(path.resolve())
+        known = digests.get(name)
+        if known is not None and known[:2] == signature:
+            return known[2]
+
+        digest = file_digest(path)
+        digests[name] = signature + [digest]
+        staging = digests_path.with_name(f".{_DIGESTS_FILE}.{os.getpid()}.tmp")
+        with open(staging, "w") as f:
+            json.dump(digests, f)
+        os.replace(staging, digests_path)
+        return digest
+
+    def _export_data(self, entry: Path, df: pd.DataFrame, path: Path) -> None:
+        """Write the cached cleaned data in the format of ``path``."""
+        format = detect_format(path) or "csv"
+        if format == "csv":
+            df.to_csv(path, index=False)
+        elif format == "parquet":
+            # Stored with the configured settings: copying is exact
+            shutil.copyfile(entry / _DATA_FILE, path)
+        else:
+            write_table(df, path, format=format)
+        logger.info(f"Exported cached data to {path}")
+
+    def _export_report(self, entry: Path, df: pd.DataFrame, meta: Dict[str, Any], path: Path) -> None:
+        """Copy the cached report, rendering and storing it first if needed."""
+        report_format = path.suffix.lstrip(".").lower()
+        if report_format not in REPORT_FORMATS:
+            raise ValueError(f"Unsupported format: {report_format}")
+
+        stored = entry / f"report.{report_format}"
+        if not stored.exists():
+            from ..visuals.reports import generate_html_report, generate_txt_report, generate_json_report
+
+            generate = {
+                "html": generate_html_report,
+                "txt": generate_txt_report,
+                "json": generate_json_report,
+            }[report_format]
+            with open(entry / _PROFILE_FILE, "rb") as f:
+                profile = pickle.load(f)
+            staging = stored.with_name(f".{stored.name}.{os.getpid()}.tmp")
+            generate(df, tuple(meta["original_shape"]), profile, meta["cleaning_log"], staging)
+            os.replace(staging, stored)
+
+        shutil.copyfile(stored, path)
+        logger.info(f"Exported cached report to {path}")
+
+
+def _directory_size(path: Path) -> int:
+    """Total size of the files in a directory tree."""
+    return sum(file.stat().st_size for file in path.rglob("*") if file.is_file())
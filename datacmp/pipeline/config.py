@@ -5,12 +5,13 @@ Configuration management utilities.
 import logging
 from pathlib import Path
 from typing import Dict, Any, Union
-import yaml
 
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+DEFAULT_CHUNKSIZE = 100_000
+
 
 def load_config(config_path: Union[str, Path]) -> Dict[str, Any]:
     """
@@ -30,6 +31,8 @@ def load_config(config_path: Union[str, Path]) -> Dict[str, Any]:
     if not config_path.exists():
         raise FileNotFoundError(f"Config file not found: {config_path}")
     
+    import yaml
+    
     with open(config_path, 'r') as f:
         config = yaml.safe_load(f)
     
@@ -48,6 +51,8 @@ def save_config(config: Dict[str, Any], output_path: Union[str, Path]) -> None:
     Example:
         >>> save_config(config, "my_config.yaml")
     """
+    import yaml
+    
     output_path = Path(output_path)
     
     with open(output_path, 'w') as f:
@@ -78,6 +83,9 @@ def get_default_config() -> Dict[str, Any]:
                 "method": "iqr",
                 "iqr_multiplier": 1.5,
                 "action": "cap"
+            },
+            "optimize_dtypes": {
+                "enabled": True
             }
         },
         "drop_duplicates": True,
@@ -85,4 +93,4 @@ def get_default_config() -> Dict[str, Any]:
             "include_more_stats": True,
             "compute_correlations": True
         }
-    }
\ No newline at end of file
+    }
@@ -0,0 +1,532 @@
+"""
+Partitioned (map/merge) cleaning and profiling over a process pool.
+
+One logical dataset stored as many partition files is cleaned in parallel
+passes. Each pass maps a function over the partitions in worker processes
+and merges the partial results in the parent, so only one partition per
+worker has to fit in memory:
+
+1. Row fingerprints of every partition. The parent keeps a global
+   fingerprint set and marks each row that repeats an earlier row (in
+   partition order) as a duplicate. This pass is skipped when duplicate
+   removal is disabled.
+2. Partial statistics of the de-duplicated rows: row and null counts,
+   central moments and KLL quantile sketches of numeric columns and value
+   counts of the others. The parent merges them into the global dropped
+   columns, fill values and outlier bounds.
+3. Every worker applies the global parameters to its partition, writes the
+   cleaned partition and profiles it into a ``ProfileState``. The parent
+   merges these into the profile of the whole cleaned dataset.
+
+Compared with ``DataCmp.clean()`` on the concatenated partitions:
+
+- column renames, duplicate removal, missing ratios, dropped columns and
+  mode fill values are exact
+- mean fills and ``zscore`` bounds agree up to floating-point rounding
+- median fills and ``iqr`` bounds come from KLL sketches, with rank error
+  at most ``profiling.sketch.quantile_error`` (default 1%)
+- the ``mad`` outlier method (which needs a pass per center) and dtype
+  optimization are not available
+"""
+
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from .batch import expand_inputs, output_stem
+from .config import get_default_config, load_config
+from ..cleaning.columns import standardize_column_names
+from ..cleaning.duplicates import FingerprintSet, duplicate_settings, row_fingerprints
+from ..cleaning.missing import apply_fill_values
+from ..cleaning.outliers import apply_outlier_bounds, outlier_log
+from ..cleaning.plan import CleaningPlan
+from ..profiling.sketches import DEFAULT_QUANTILE_ERROR
+from ..profiling.state import ColumnSummary, ProfileState
+from ..utils.io import (
+    DEFAULT_PARQUET_COMPRESSION, TABLE_FORMATS, detect_format, read_settings, read_table, write_table
+)
+from ..utils.logger import get_logger
+from ..utils.parallel import resolve_workers
+
+logger = get_logger(__name__)
+
+PARTITIONED_OUTLIER_METHODS = ("iqr", "zscore")
+
+
+def fit_partitioned(
+    paths: Sequence[Union[str, Path]],
+    config: Dict[str, Any],
+    jobs: Optional[int] = -1,
+    columns: bool = True,
+    missing: bool = True,
+    outliers: bool = True,
+    duplicates: bool = True,
+    usecols: Optional[Sequence[str]] = None
+) -> Tuple[Dict[str, Any], List[str]]:
+    """
+    Compute global cleaning parameters over partition files (passes 1 and 2).
+
+    Args:
+        paths: Partition files, in dataset order
+        config: Full DataCmp configuration
+        jobs: Worker processes (1 runs in this process, -1 uses all cores)
+        columns: Clean column names
+        missing: Handle missing values
+        outliers: Handle outliers
+        duplicates: Remove duplicates
+        usecols: Columns to read (default: all)
+
+    Returns:
+        Tuple of (cleaning parameters, list of log messages)
+
+    Example:
+        >>> params, log = fit_partitioned(paths, config, jobs=8)
+    """
+    cleaning_config = config.get("cleaning", {})
+    outlier_config = cleaning_config.get("outlier_handling", {})
+    fill_strategy = cleaning_config.get("fill_strategy", {})
+    numeric_strategy = fill_strategy.get("numeric", "median")
+    categorical_strategy = fill_strategy.get("categorical", "mode")
+    dedup_enabled, subset = duplicate_settings(config)
+    duplicates = duplicates and dedup_enabled
+    outliers = outliers and outlier_config.get("enabled", False)
+    method = outlier_config.get("method", "iqr")
+    if outliers and method not in PARTITIONED_OUTLIER_METHODS:
+        raise ValueError(
+            f"Outlier method {method!r} is not available for partitioned data; "
+            f"use one of {PARTITIONED_OUTLIER_METHODS}"
+        )
+    sketch = config.get("profiling", {}).get("sketch", {}) or {}
+
+    read_options = read_settings(config)
+    read_options.pop("usecols")
+    params: Dict[str, Any] = {
+        "paths": [str(path) for path in paths],
+        "usecols": list(usecols) if usecols is not None else None,
+        "read_options": read_options,
+        "clean_columns": columns,
+        "rename": {},
+        "duplicates": duplicates,
+        "duplicate_subset": subset,
+        "duplicate_rows": [np.empty(0, dtype=np.int64) for _ in paths],
+        "drop_columns": [],
+        "fill_values": {},
+        "outlier_bounds": {},
+        "outlier_action": outlier_config.get("action", "cap"),
+    }
+    log: List[str] = []
+
+    # Pass 1: global duplicate rows, partition by partition in dataset order
+    if duplicates:
+        fingerprints = FingerprintSet(spill_dir=config.get("performance", {}).get("dedup_spill_dir"))
+        removed = 0
+        for index, partition_fingerprints in enumerate(
+            map_partitions(_partition_fingerprints, _tasks(params), jobs)
+        ):
+            keep = fingerprints.add(partition_fingerprints)
+            params["duplicate_rows"][index] = np.flatnonzero(~keep)
+            removed += int(len(keep) - keep.sum())
+        fingerprints.close()
+        if removed > 0:
+            msg = f"Removed {removed} duplicate rows"
+            if subset is not None:
+                msg += f" (by {', '.join(map(str, subset))})"
+            logger.info(msg)
+            log.append(msg)
+
+    # Pass 2: partial statistics, merged in the parent
+    tasks = _tasks(
+        params,
+        quantile_error=sketch.get("quantile_error", DEFAULT_QUANTILE_ERROR),
+        numeric_counts=numeric_strategy == "mode",
+    )
+    merged: Optional[Dict[str, Any]] = None
+    for partial in map_partitions(_partition_statistics, tasks, jobs):
+        merged = partial if merged is None else _merge_statistics(merged, partial)
+
+    original_columns = merged["original_columns"]
+    if columns:
+        cleaned_columns = standardize_column_names(original_columns)
+        rename_log = []
+        for orig, cleaned in zip(original_columns, cleaned_columns):
+            if orig != cleaned:
+                params["rename"][orig] = cleaned
+                msg = f"Renamed column: '{orig}' → '{cleaned}'"
+                logger.info(msg)
+                rename_log.append(msg)
+        # Renaming runs before duplicate removal, as in DataCmp.clean()
+        log[:0] = rename_log
+
+    rows = merged["rows"]
+    nulls = merged["nulls"]
+    summaries = merged["summaries"]
+    value_counts = merged["value_counts"]
+    non_numeric = merged["non_numeric"]
+    for col in non_numeric:
+        if col in summaries and summaries[col].count > 0 and not value_counts[col].empty:
+            raise ValueError(
+                f"Column '{col}' is numeric in some partitions and not in others; "
+                "set its type with io.read.dtype"
+            )
+    # A column that is all missing where it was read as numeric takes the
+    # type of the other partitions
+    numeric_cols = {
+        col for col, summary in summaries.items()
+        if summary.count > 0 or col not in non_numeric
+    }
+
+    if missing and rows > 0:
+        threshold_drop = cleaning_config.get("threshold_drop", 0.45)
+        for col, null_count in nulls.items():
+            missing_ratio = null_count / rows
+            if missing_ratio > threshold_drop:
+                params["drop_columns"].append(col)
+                msg = f"Dropped column '{col}' ({missing_ratio:.1%} missing)"
+                logger.warning(msg)
+                log.append(msg)
+                continue
+            if missing_ratio == 0:
+                continue
+
+            if col in numeric_cols:
+                summary = summaries[col]
+                if numeric_strategy == "mean":
+                    fill_value = summary.mean
+                elif numeric_strategy == "mode":
+                    fill_value = _mode(value_counts.get(col), default=0)
+                else:
+                    fill_value = summary.quantiles.quantile(0.5)
+                msg = f"Filled numeric column '{col}' with {numeric_strategy} ({fill_value:.2f})"
+            else:
+                if categorical_strategy == "mode":
+                    fill_value = _mode(value_counts.get(col), default="Unknown")
+                else:
+                    fill_value = "Unknown"
+                msg = f"Filled categorical column '{col}' with '{fill_value}'"
+            params["fill_values"][col] = fill_value
+            logger.info(msg)
+            log.append(msg)
+
+    if outliers:
+        # Imputed values join the statistics so the bounds describe the same
+        # post-imputation data as the in-memory stage
+        for col, summary in summaries.items():
+            if col in params["drop_columns"] or col not in numeric_cols:
+                continue
+            fill_value = params["fill_values"].get(col)
+            if fill_value is not None:
+                summary.update_repeated(fill_value, int(nulls[col]))
+            if summary.count == 0:
+                continue
+            if method == "zscore":
+                threshold = outlier_config.get("zscore_threshold", 3.0)
+                if summary.count < 2:
+                    continue
+                spread = threshold * np.sqrt(summary.m2 / (summary.count - 1))
+                lower, upper = summary.mean - spread, summary.mean + spread
+            else:
+                multiplier = outlier_config.get("iqr_multiplier", 1.5)
+                q1, q3 = summary.quantiles.quantiles([0.25, 0.75])
+                lower, upper = q1 - multiplier * (q3 - q1), q3 + multiplier * (q3 - q1)
+            params["outlier_bounds"][col] = (float(lower), float(upper))
+
+    params["rows_in"] = merged["rows_in"]
+    logger.info(f"Fitted partitioned parameters over {merged['rows_in']} rows in {len(paths)} partitions")
+    return params, log
+
+
+def apply_partitioned(
+    params: Dict[str, Any],
+    out_dir: Union[str, Path],
+    config: Dict[str, Any],
+    jobs: Optional[int] = -1,
+    format: Optional[str] = None
+) -> Tuple[Dict[str, Any], List[str]]:
+    """
+    Clean every partition with the global parameters and profile it (pass 3).
+
+    Each partition ``<stem>.<ext>`` is written to ``<out_dir>/<stem>.<format>``.
+
+    Args:
+        params: Parameters returned by ``fit_partitioned``
+        out_dir: Output directory (created if missing)
+        config: Full DataCmp configuration (profiling and export settings)
+        jobs: Worker processes (1 runs in this process, -1 uses all cores)
+        format: Output format ('csv', 'parquet', 'feather' or 'arrow';
+            default: each partition's format)
+
+    Returns:
+        Tuple of (metadata with ``rows``, ``columns``, ``outputs`` and the
+        merged ``profile_state``, list of log messages)
+
+    Example:
+        >>> meta, log = apply_partitioned(params, "cleaned", config, jobs=8)
+        >>> print(meta["profile_state"].summary())
+    """
+    if format is not None and format not in TABLE_FORMATS.values():
+        raise ValueError(f"Unsupported export format: {format}")
+
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    stems = [output_stem(path) for path in params["paths"]]
+    if len(set(stems)) < len(stems):
+        raise ValueError("Partition files must have distinct names to be written to one directory")
+
+    parquet_config = config.get("export", {}).get("parquet", {})
+    tasks = _tasks(
+        params,
+        outputs=[
+            str(out_dir / f"{stem}.{format or detect_format(path) or 'csv'}")
+            for path, stem in zip(params["paths"], stems)
+        ],
+        profiling=config.get("profiling", {}),
+        compression=parquet_config.get("compression", DEFAULT_PARQUET_COMPRESSION),
+        row_group_size=parquet_config.get("row_group_size"),
+    )
+
+    state: Optional[ProfileState] = None
+    outlier_counts = pd.Series(0, dtype=np.int64)
+    rows = 0
+    columns: List[str] = []
+    for result in map_partitions(_partition_apply, tasks, jobs):
+        state = result["state"] if state is None else state.merge(result["state"])
+        outlier_counts = outlier_counts.add(result["outlier_counts"], fill_value=0).astype(np.int64)
+        rows += result["rows"]
+        columns = result["columns"]
+
+    log = outlier_log(outlier_counts, params["outlier_action"])
+    logger.info(f"Wrote {rows} rows in {len(tasks)} partitions to {out_dir}")
+    meta = {
+        "rows": rows,
+        "columns": columns,
+        "outputs": [task["output"] for task in tasks],
+        "profile_state": state,
+    }
+    return meta, log
+
+
+def run_partitioned(
+    inputs: Sequence[Union[str, Path]],
+    out_dir: Union[str, Path],
+    config_path: Optional[Union[str, Path, Dict[str, Any]]] = None,
+    jobs: Optional[int] = -1,
+    export_format: Optional[str] = None,
+    columns: Optional[List[str]] = None,
+    verbose: bool = True
+) -> Dict[str, Any]:
+    """
+    Clean and profile a dataset stored as many partition files.
+
+    Args:
+        inputs: Partition file paths or glob patterns, in dataset order
+        out_dir: Directory for the cleaned partitions
+        config_path: Path to YAML configuration file or config dictionary
+        jobs: Worker processes (1 runs in this process, -1 uses all cores)
+        export_format: Format of the cleaned partitions (default: the
+            input's format)
+        columns: Load only these columns
+        verbose: Print progress messages
+
+    Returns:
+        Dictionary with ``rows_in``, ``rows``, ``columns``, ``outputs``,
+        ``profile_state`` (ProfileState of the cleaned dataset),
+        ``cleaning_plan`` (CleaningPlan without the duplicate positions) and
+        ``cleaning_log``
+
+    Example:
+        >>> result = run_partitioned(["parts/*.parquet"], "cleaned", jobs=8)
+        >>> print(result["profile_state"].summary())
+    """
+    paths = expand_inputs(inputs)
+    if not paths:
+        raise ValueError("No input files found")
+    if isinstance(config_path, dict):
+        config = config_path
+    elif config_path is not None:
+        config = load_config(config_path)
+    else:
+        config = get_default_config()
+
+    started = time.perf_counter()
+    if verbose:
+        print(f"[1/2] Fitting cleaning parameters over {len(paths)} partitions...")
+    params, log = fit_partitioned(paths, config, jobs=jobs, usecols=columns)
+
+    if verbose:
+        print("[2/2] Cleaning and profiling partitions...")
+    meta, apply_log = apply_partitioned(params, out_dir, config, jobs=jobs, format=export_format)
+    log.extend(apply_log)
+
+    if verbose:
+        print(
+            f"Cleaned {params['rows_in']} → {meta['rows']} rows in {len(paths)} partitions "
+            f"({time.perf_counter() - started:.2f}s)"
+        )
+
+    plan = CleaningPlan(
+        rename=params["rename"],
+        drop_columns=params["drop_columns"],
+        fill_values=params["fill_values"],
+        outlier_bounds=params["outlier_bounds"],
+        outlier_action=params["outlier_action"],
+        duplicates=params["duplicates"],
+        duplicate_subset=params["duplicate_subset"],
+    )
+    return {"rows_in": params["rows_in"], **meta, "cleaning_plan": plan, "cleaning_log": log}
+
+
+def map_partitions(
+    func: Callable[[Dict[str, Any]], Any],
+    tasks: List[Dict[str, Any]],
+    jobs: Optional[int]
+) -> Iterator[Any]:
+    """
+    Apply ``func`` to every task in a process pool, yielding results in task order.
+
+    Args:
+        func: Module-level function (it is pickled to the workers)
+        tasks: One task per partition
+        jobs: Worker processes (1 runs in this process, -1 uses all cores)
+
+    Yields:
+        Results, in task order
+    """
+    workers = min(resolve_workers(jobs), len(tasks))
+    if workers <= 1:
+        yield from map(func, tasks)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from pool.map(func, tasks)
+
+
+def _tasks(params: Dict[str, Any], outputs: Optional[List[str]] = None, **settings: Any) -> List[Dict[str, Any]]:
+    """One task per partition with what the workers need from ``params``."""
+    shared = {
+        key: params[key]
+        for key in (
+            "usecols", "read_options", "clean_columns", "duplicate_subset", "drop_columns",
+            "fill_values", "outlier_bounds", "outlier_action",
+        )
+    }
+    return [
+        {
+            **shared,
+            **settings,
+            "path": path,
+            "duplicate_rows": params["duplicate_rows"][index],
+            "output": outputs[index] if outputs is not None else None,
+        }
+        for index, path in enumerate(params["paths"])
+    ]
+
+
+def _read_partition(task: Dict[str, Any]) -> Tuple[pd.DataFrame, List[Any]]:
+    """Read a partition, clean its column names and drop its duplicate rows."""
+    df = read_table(task["path"], columns=task["usecols"], **task["read_options"])
+    original_columns = df.columns.tolist()
+    if task["clean_columns"]:
+        df.columns = standardize_column_names(original_columns)
+    if len(task["duplicate_rows"]):
+        keep = np.ones(len(df), dtype=bool)
+        keep[task["duplicate_rows"]] = False
+        df = df[keep]
+    return df, original_columns
+
+
+def _partition_fingerprints(task: Dict[str, Any]) -> np.ndarray:
+    """Pass 1: row fingerprints of a partition."""
+    df, _ = _read_partition(task)
+    return row_fingerprints(df, task["duplicate_subset"])
+
+
+def _partition_statistics(task: Dict[str, Any]) -> Dict[str, Any]:
+    """Pass 2: mergeable statistics of a partition's de-duplicated rows."""
+    df, original_columns = _read_partition(task)
+    summaries: Dict[Any, ColumnSummary] = {}
+    value_counts: Dict[Any, pd.Series] = {}
+    non_numeric = set()
+    for col in df.columns:
+        series = df[col]
+        if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+            summaries[col] = ColumnSummary(
+                "numeric", str(series.dtype), quantile_error=task["quantile_error"]
+            ).update(series)
+            if task["numeric_counts"]:
+                value_counts[col] = series.value_counts()
+        else:
+            non_numeric.add(col)
+            value_counts[col] = series.value_counts()
+    return {
+        "original_columns": original_columns,
+        "rows_in": len(df) + len(task["duplicate_rows"]),
+        "rows": len(df),
+        "nulls": df.isnull().sum(),
+        "summaries": summaries,
+        "value_counts": value_counts,
+        "non_numeric": non_numeric,
+    }
+
+
+def _merge_statistics(merged: Dict[str, Any], partial: Dict[str, Any]) -> Dict[str, Any]:
+    """Merge the pass 2 statistics of another partition."""
+    if partial["original_columns"] != merged["original_columns"]:
+        raise ValueError(
+            f"Partitions have different columns: {merged['original_columns']} and {partial['original_columns']}"
+        )
+    merged["rows_in"] += partial["rows_in"]
+    merged["rows"] += partial["rows"]
+    merged["nulls"] = merged["nulls"].add(partial["nulls"], fill_value=0).astype(np.int64)
+    for col, summary in partial["summaries"].items():
+        if col in merged["summaries"]:
+            merged["summaries"][col].merge(summary)
+        else:
+            merged["summaries"][col] = summary
+    for col, counts in partial["value_counts"].items():
+        known = merged["value_counts"].get(col)
+        merged["value_counts"][col] = counts if known is None else known.add(counts, fill_value=0)
+    merged["non_numeric"] |= partial["non_numeric"]
+    return merged
+
+
+def _partition_apply(task: Dict[str, Any]) -> Dict[str, Any]:
+    """Pass 3: clean a partition with the global parameters, write and profile it."""
+    df, _ = _read_partition(task)
+    df = apply_fill_values(df, task["drop_columns"], task["fill_values"])
+    bounds = pd.DataFrame.from_dict(task["outlier_bounds"], orient="index", columns=["lower", "upper"])
+    df, outlier_counts = apply_outlier_bounds(df, bounds, task["outlier_action"])
+
+    output = Path(task["output"])
+    format = detect_format(output) or "csv"
+    if format == "csv":
+        df.to_csv(output, index=False)
+    else:
+        write_table(
+            df,
+            output,
+            format=format,
+            compression=task["compression"],
+            row_group_size=task["row_group_size"]
+        )
+
+    state = ProfileState.from_config(task["profiling"], track_duplicates=False)
+    return {
+        "rows": len(df),
+        "columns": df.columns.tolist(),
+        "outlier_counts": outlier_counts,
+        "state": state.update(df),
+    }
+
+
+def _mode(counts: Optional[pd.Series], default: Any) -> Any:
+    """Most frequent value (the smallest one on ties, as ``Series.mode``)."""
+    if counts is None or counts.empty or counts.max() <= 0:
+        return default
+    top = counts.index[counts == counts.max()]
+    try:
+        return sorted(top)[0]
+    except TypeError:
+        return top[0]
@@ -2,13 +2,16 @@
 Pipeline execution utilities.
 """
 
+import copy
 import logging
 from pathlib import Path
-from typing import Optional, Union
+from typing import Any, Dict, List, Optional, Union
 import pandas as pd
 
-from .config import load_config
+from .cache import DEFAULT_CACHE_MAX_BYTES, ResultCache
+from .config import get_default_config, load_config
 from ..core.datacmp import DataCmp
+from ..utils.io import detect_format
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -19,31 +22,93 @@ def run_pipeline(
     config_path: Optional[Union[str, Path]] = None,
     export_csv_path: Optional[Union[str, Path]] = None,
     export_report_path: Optional[Union[str, Path]] = None,
-    verbose: bool = True
-) -> pd.DataFrame:
+    verbose: bool = True,
+    chunksize: Optional[int] = None,
+    engine: str = "pandas",
+    sample: Optional[Union[float, int]] = None,
+    stratify: Optional[str] = None,
+    seed: int = 0,
+    columns: Optional[List[str]] = None,
+    read_options: Optional[Dict[str, Any]] = None,
+    cache_dir: Optional[Union[str, Path]] = None,
+    cache_max_bytes: int = DEFAULT_CACHE_MAX_BYTES
+) -> Optional[pd.DataFrame]:
     """
     Run complete data cleaning and profiling pipeline.
     
     Args:
-        data: Path to CSV file or pandas DataFrame
+        data: Path to a CSV, Parquet, Feather or Arrow IPC file, or pandas
+            DataFrame
         config_path: Path to YAML configuration file
-        export_csv_path: Path to save cleaned CSV
+        export_csv_path: Path to save cleaned data; the format (CSV,
+            Parquet, Feather or Arrow IPC) follows the extension
         export_report_path: Path to save report
         verbose: Print progress messages
+        chunksize: Stream the input in chunks of this many rows. Requires
+            export_csv_path; profiling and reports are skipped.
+        engine: Execution engine ('pandas' or 'polars')
+        sample: Profile a seeded random sample: a fraction (float) or a
+            number of rows (int)
+        stratify: Column to stratify the sample by
+        seed: Random seed for the sample
+        columns: Load only these columns
+        read_options: Overrides of the ``io.read`` configuration (CSV
+            ``engine``, ``dtype`` hints, ``infer_schema_rows``)
+        cache_dir: Directory of a persistent result cache. A run whose input
+            file, configuration and options are unchanged restores the
+            cleaned data and report from it instead of recomputing them
+            (file inputs outside streaming mode; requires pyarrow)
+        cache_max_bytes: Size of the result cache above which least
+            recently used results are evicted
     
     Returns:
-        Cleaned pandas DataFrame
+        Cleaned pandas DataFrame, or None in streaming mode
     
     Example:
         >>> df_clean = run_pipeline("data.csv", config_path="config.yaml")
+        >>> run_pipeline("big.csv", export_csv_path="clean.csv", chunksize=100_000)
+        >>> run_pipeline("big.csv", export_report_path="report.html", sample=0.01)
+        >>> run_pipeline("events.parquet", export_csv_path="clean.parquet")
+        >>> run_pipeline("big.csv", read_options={"engine": "pyarrow"})
+        >>> run_pipeline("data.csv", export_report_path="report.html", cache_dir=".datacmp-cache")
     """
+    if read_options:
+        config_path = with_read_options(config_path, read_options)
+    
+    if chunksize is not None:
+        if engine != "pandas":
+            raise ValueError(f"engine={engine!r} is not available in streaming mode")
+        if sample is not None:
+            raise ValueError("Sampling is not available in streaming mode")
+        return _run_streaming_pipeline(
+            data, config_path, export_csv_path, export_report_path, verbose, chunksize, columns
+        )
+    
+    cache = cache_key = None
+    if cache_dir is not None and isinstance(data, (str, Path)):
+        cache = ResultCache(cache_dir, max_bytes=cache_max_bytes)
+        cache_key = cache.key(
+            data,
+            load_config(config_path) if isinstance(config_path, (str, Path)) else config_path,
+            engine=engine,
+            columns=columns,
+            sample=sample,
+            stratify=stratify,
+            seed=seed
+        )
+        df = cache.restore(cache_key, export_csv_path, export_report_path)
+        if df is not None:
+            if verbose:
+                print(f"Restored cached result: {df.shape[0]} rows × {df.shape[1]} columns")
+            return df
+    
     if verbose:
         print("\n" + "="*80)
         print("DATACMP PIPELINE")
         print("="*80 + "\n")
     
     # Initialize DataCmp
-    cmp = DataCmp(data, config=config_path)
+    cmp = DataCmp(data, config=config_path, engine=engine, columns=columns)
     
     if verbose:
         print(f"[1/4] Loaded data: {cmp.df.shape[0]} rows × {cmp.df.shape[1]} columns")
@@ -56,20 +121,23 @@ def run_pipeline(
     # Profile data
     if verbose:
         print("[3/4] Generating profile...")
-    cmp.profile()
+    cmp.profile(sample=sample, stratify=stratify, seed=seed)
     
     # Export results
     if verbose:
         print("[4/4] Exporting results...")
     
     if export_csv_path:
-        cmp.export(export_csv_path, format="csv")
+        cmp.export(export_csv_path, format=detect_format(export_csv_path) or "csv")
     
     if export_report_path:
         report_path = Path(export_report_path)
         format_type = report_path.suffix.lstrip('.')
         cmp.export(export_report_path, format=format_type)
     
+    if cache is not None:
+        cache.store(cache_key, cmp, export_report_path)
+    
     if verbose:
         print("\n" + "="*80)
         print("PIPELINE COMPLETE")
@@ -77,4 +145,81 @@ def run_pipeline(
         print(f"Final shape: {cmp.df.shape[0]} rows × {cmp.df.shape[1]} columns")
         print(f"Cleaning operations: {len(cmp.cleaning_log)}")
     
-    return cmp.df
\ No newline at end of file
+    return cmp.df
+
+
+def with_read_options(
+    config_path: Optional[Union[str, Path, Dict[str, Any]]],
+    read_options: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    Configuration with ``io.read`` overridden by ``read_options``.
+    
+    Dtype hints are added to the configured ones; other settings replace
+    them.
+    
+    Args:
+        config_path: Path to YAML configuration file, config dictionary
+            (not modified) or None for the defaults
+        read_options: ``io.read`` settings (``engine``, ``dtype``,
+            ``infer_schema_rows``, ...)
+    
+    Returns:
+        Configuration dictionary
+    
+    Example:
+        >>> config = with_read_options("config.yaml", {"engine": "pyarrow"})
+    """
+    if isinstance(config_path, dict):
+        config = copy.deepcopy(config_path)
+    elif config_path is not None:
+        config = load_config(config_path)
+    else:
+        config = get_default_config()
+    io_config = config.get("io") or {}
+    read_config = {**(io_config.get("read") or {}), **read_options}
+    if "dtype" in read_options:
+        # Dtype hints add to the configured ones
+        read_config["dtype"] = {**((io_config.get("read") or {}).get("dtype") or {}), **read_options["dtype"]}
+    config["io"] = {**io_config, "read": read_config}
+    return config
+
+
+def _run_streaming_pipeline(
+    data: Union[str, Path],
+    config_path: Optional[Union[str, Path]],
+    export_csv_path: Optional[Union[str, Path]],
+    export_report_path: Optional[Union[str, Path]],
+    verbose: bool,
+    chunksize: int,
+    columns: Optional[List[str]] = None
+) -> None:
+    """Run the cleaning pipeline out-of-core, writing the result to CSV."""
+    if not export_csv_path:
+        raise ValueError("Streaming mode requires an export CSV path")
+    if export_report_path:
+        raise ValueError("Reports are not available in streaming mode")
+    
+    if verbose:
+        print("\n" + "="*80)
+        print("DATACMP PIPELINE (STREAMING)")
+        print("="*80 + "\n")
+    
+    cmp = DataCmp(data, config=config_path, chunksize=chunksize, columns=columns)
+    
+    if verbose:
+        print(f"[1/3] Streaming {data} in chunks of {chunksize} rows")
+        print("[2/3] Fitting cleaning parameters...")
+    cmp.clean()
+    
+    if verbose:
+        print("[3/3] Cleaning and exporting chunks...")
+    cmp.export(export_csv_path, format=detect_format(export_csv_path) or "csv")
+    
+    if verbose:
+        print("\n" + "="*80)
+        print("PIPELINE COMPLETE")
+        print("="*80 + "\n")
+        print(f"Cleaning operations: {len(cmp.cleaning_log)}")
+    
+    return None
@@ -0,0 +1,477 @@
+"""
+Out-of-core (chunked) cleaning utilities.
+
+Streaming mode cleans a CSV, Parquet, Feather or Arrow IPC file in two
+passes over fixed-size chunks:
+
+1. ``fit_streaming`` computes everything the cleaning stages need
+   (missing ratios, fill values, outlier bounds) while tracking duplicate
+   row fingerprints.
+2. ``apply_streaming`` re-reads the file, applies the fitted parameters
+   chunk by chunk and appends the result to the output CSV.
+
+Peak memory depends on the chunk size, the per-column quantile sample and
+the number of distinct rows seen (8 bytes per fingerprint, or a bounded
+amount with ``performance.dedup_spill_dir``, which spills the fingerprint
+set to disk), never on the full table. A categorical ``mode`` fill also
+counts the distinct values of every text column. With
+``profiling.approximate`` enabled, medians and IQR bounds come from
+mergeable KLL sketches with a guaranteed rank error instead of the sample,
+and categorical modes from bounded Space-Saving sketches.
+"""
+
+from pathlib import Path
+from typing import Dict, Any, List, Tuple, Iterator, Optional, Sequence, Union
+import pandas as pd
+import numpy as np
+
+from .config import DEFAULT_CHUNKSIZE
+from ..cleaning.columns import clean_column_names
+from ..cleaning.duplicates import FingerprintSet, duplicate_settings, row_fingerprints
+from ..cleaning.outliers import compute_outlier_bounds, apply_outlier_bounds
+from ..profiling.sketches import KLLSketch, SpaceSaving, sketch_settings
+from ..utils.io import detect_format, infer_csv_schema, iter_table_chunks, read_settings
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_SAMPLE_SIZE = 100_000
+
+
+def iter_chunks(
+    path: Union[str, Path],
+    chunksize: int,
+    usecols: Optional[Sequence[str]] = None,
+    dtype: Optional[Dict[str, Any]] = None,
+    engine: str = "c"
+) -> Iterator[pd.DataFrame]:
+    """
+    Iterate over a CSV, Parquet, Feather or Arrow IPC file in chunks.
+
+    Args:
+        path: Input file path (format detected from the extension)
+        chunksize: Number of rows per chunk
+        usecols: Columns to read (default: all)
+        dtype: CSV column → dtype, applied to every chunk
+        engine: CSV parser: 'c' or 'pyarrow'
+
+    Yields:
+        DataFrame chunks
+    """
+    yield from iter_table_chunks(path, chunksize, columns=usecols, engine=engine, dtype=dtype)
+
+
+def read_schema(
+    path: Union[str, Path],
+    config: Dict[str, Any],
+    usecols: Optional[Sequence[str]] = None
+) -> Tuple[str, Dict[str, Any]]:
+    """
+    CSV parser and column dtypes for reading a file in chunks.
+
+    With ``io.read.infer_schema_rows``, the dtypes of a CSV file are
+    inferred from its first rows and locked for every chunk. Integer and
+    boolean columns are widened to float64 and boolean, since a later chunk
+    may contain missing values.
+
+    Args:
+        path: Input file path
+        config: Full DataCmp configuration
+        usecols: Columns to read (default: all)
+
+    Returns:
+        Tuple of (CSV engine, column → dtype)
+    """
+    settings = read_settings(config)
+    dtype = settings["dtype"]
+    if settings["infer_schema_rows"] and (detect_format(path) or "csv") == "csv":
+        dtype = infer_csv_schema(path, settings["infer_schema_rows"], usecols, dtype, widen=True)
+    return settings["engine"], dtype
+
+
+class _Reservoir:
+    """Fixed-size uniform sample of a numeric column (NaN included)."""
+
+    def __init__(self, size: int, rng: np.random.Generator):
+        self.size = size
+        self.values = np.empty(0, dtype=np.float64)
+        self.seen = 0
+        self._rng = rng
+
+    def update(self, values: np.ndarray) -> None:
+        free = self.size - len(self.values)
+        if free > 0:
+            self.values = np.concatenate([self.values, values[:free]])
+            self.seen += min(free, len(values))
+            values = values[free:]
+        if len(values) == 0:
+            return
+
+        positions = self.seen + np.arange(len(values))
+        slots = (self._rng.random(len(values)) * (positions + 1)).astype(np.int64)
+        keep = slots < self.size
+        self.values[slots[keep]] = values[keep]
+        self.seen += len(values)
+
+
+def fit_streaming(
+    path: Union[str, Path],
+    config: Dict[str, Any],
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    columns: bool = True,
+    missing: bool = True,
+    outliers: bool = True,
+    duplicates: bool = True,
+    usecols: Optional[Sequence[str]] = None
+) -> Tuple[Dict[str, Any], List[str]]:
+    """
+    First pass: compute cleaning parameters over a chunked file.
+
+    Statistics are computed on de-duplicated rows so the result follows
+    the same stage order as ``DataCmp.clean()``. Means, missing ratios and
+    categorical modes are exact; medians and outlier bounds come from a uniform
+    sample of ``performance.stream_sample_size`` values per column and are
+    exact whenever the file has fewer rows than the sample size. With
+    ``profiling.approximate`` enabled, median fills and IQR bounds come from
+    KLL sketches (error ``profiling.sketch.quantile_error``) instead, and
+    categorical modes from Space-Saving sketches (error
+    ``profiling.sketch.top_values_error``).
+
+    Exact categorical modes keep one count per distinct value of each text
+    column, so high-cardinality text columns (IDs, free text) cost memory
+    proportional to their distinct values; values are only counted when
+    missing values are handled with the categorical ``mode`` strategy.
+
+    Args:
+        path: Input file path
+        config: Full DataCmp configuration
+        chunksize: Number of rows per chunk
+        columns: Clean column names
+        missing: Handle missing values
+        outliers: Handle outliers
+        duplicates: Remove duplicates
+        usecols: Columns to read (default: all)
+
+    Returns:
+        Tuple of (cleaning parameters, list of log messages)
+
+    Example:
+        >>> params, log = fit_streaming("data.csv", config, chunksize=50_000)
+    """
+    cleaning_config = config.get("cleaning", {})
+    outlier_config = cleaning_config.get("outlier_handling", {})
+    sample_size = config.get("performance", {}).get("stream_sample_size", DEFAULT_SAMPLE_SIZE)
+    dedup_enabled, subset = duplicate_settings(config)
+    duplicates = duplicates and dedup_enabled
+    spill_dir = config.get("performance", {}).get("dedup_spill_dir")
+    outliers = outliers and outlier_config.get("enabled", False)
+    sketch = sketch_settings(config.get("profiling", {}))
+    numeric_strategy = cleaning_config.get("fill_strategy", {}).get("numeric", "median")
+    categorical_strategy = cleaning_config.get("fill_strategy", {}).get("categorical", "mode")
+    # Text values are only counted for categorical mode fills
+    count_values = missing and categorical_strategy == "mode"
+    
+    # Sketches replace the sample for medians and IQR bounds; the sample is
+    # still needed for numeric modes and the zscore/mad bounds
+    use_sketches = sketch is not None
+    use_reservoirs = not use_sketches or numeric_strategy == "mode" or (
+        outliers and outlier_config.get("method", "iqr") in ("zscore", "mad")
+    )
+
+    engine, dtype = read_schema(path, config, usecols)
+    params: Dict[str, Any] = {
+        "usecols": list(usecols) if usecols is not None else None,
+        "engine": engine,
+        "dtype": dtype,
+        "duplicates": duplicates,
+        "duplicate_subset": subset,
+        "dedup_spill_dir": spill_dir,
+        "drop_columns": [],
+        "fill_values": {},
+        "outlier_bounds": {},
+        "outlier_action": outlier_config.get("action", "cap"),
+    }
+    log: List[str] = []
+
+    rng = np.random.default_rng(0)
+    fingerprints = FingerprintSet(spill_dir=spill_dir)
+    total_rows = 0
+    kept_rows = 0
+    null_counts: Optional[pd.Series] = None
+    sums: Dict[str, float] = {}
+    counts: Dict[str, int] = {}
+    reservoirs: Dict[str, _Reservoir] = {}
+    quantile_sketches: Dict[str, KLLSketch] = {}
+    value_counts: Dict[str, pd.Series] = {}
+    top_values: Dict[str, SpaceSaving] = {}
+    numeric = set()
+    text = set()
+    chunk_dtypes: Dict[str, set] = {}
+
+    for chunk in iter_chunks(path, chunksize, usecols, params["dtype"], engine):
+        total_rows += len(chunk)
+        _observe_dtypes(chunk, chunk_dtypes)
+
+        if columns:
+            if "column_names" not in params:
+                chunk, rename_log = clean_column_names(chunk)
+                params["column_names"] = chunk.columns.tolist()
+                log.extend(rename_log)
+            else:
+                chunk.columns = params["column_names"]
+
+        if duplicates:
+            chunk = chunk[fingerprints.add(row_fingerprints(chunk, subset))]
+        kept_rows += len(chunk)
+
+        chunk_nulls = chunk.isnull().sum()
+        null_counts = (
+            chunk_nulls if null_counts is None else null_counts.add(chunk_nulls, fill_value=0)
+        )
+
+        for col in chunk.columns:
+            series = chunk[col]
+            if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+                if series.count():
+                    numeric.add(col)
+                values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+                sums[col] = sums.get(col, 0.0) + float(np.nansum(values))
+                counts[col] = counts.get(col, 0) + int(series.count())
+                if use_reservoirs:
+                    if col not in reservoirs:
+                        reservoirs[col] = _Reservoir(sample_size, rng)
+                    reservoirs[col].update(values)
+                if use_sketches:
+                    if col not in quantile_sketches:
+                        quantile_sketches[col] = KLLSketch.from_error(sketch["quantile_error"])
+                    quantile_sketches[col].update(values)
+            else:
+                if series.count():
+                    text.add(col)
+                if not count_values:
+                    continue
+                if use_sketches:
+                    if col not in top_values:
+                        top_values[col] = SpaceSaving.from_error(sketch["top_values_error"])
+                    top_values[col].update(series)
+                    continue
+                chunk_counts = series.value_counts()
+                value_counts[col] = (
+                    chunk_counts if col not in value_counts
+                    else value_counts[col].add(chunk_counts, fill_value=0)
+                )
+
+    fingerprints.close()
+
+    if null_counts is None:
+        logger.warning(f"No rows found in {path}")
+        return params, log
+
+    # A chunk where a column is all missing says nothing about its type
+    non_numeric = text | (set(null_counts.index) - set(sums))
+
+    if (detect_format(path) or "csv") == "csv":
+        # The second pass reads every chunk with the dtypes a full read
+        # would infer, so the output does not depend on the chunk size
+        params["dtype"] = {**_resolve_dtypes(chunk_dtypes), **params["dtype"]}
+    for col in sorted(numeric & text, key=str):
+        logger.warning(
+            f"Column '{col}' is numeric in some chunks and text in others; its fill value "
+            "comes from the text chunks only. Set its type with io.read.dtype"
+        )
+
+    params["rows_in"] = total_rows
+
+    if duplicates and total_rows > kept_rows:
+        msg = f"Removed {total_rows - kept_rows} duplicate rows"
+        if subset is not None:
+            msg += f" (by {', '.join(map(str, subset))})"
+        logger.info(msg)
+        log.append(msg)
+
+    if missing:
+        threshold_drop = cleaning_config.get("threshold_drop", 0.45)
+        missing_info = null_counts / kept_rows if kept_rows else null_counts * 0
+
+        for col, missing_ratio in missing_info.items():
+            if missing_ratio > threshold_drop:
+                params["drop_columns"].append(col)
+                msg = f"Dropped column '{col}' ({missing_ratio:.1%} missing)"
+                logger.warning(msg)
+                log.append(msg)
+                continue
+
+            if missing_ratio == 0:
+                continue
+
+            if col not in non_numeric:
+                strategy = numeric_strategy
+                if strategy == "mean":
+                    fill_value = sums[col] / counts[col]
+                elif strategy == "mode":
+                    sample = reservoirs[col].values
+                    mode = pd.Series(sample[~np.isnan(sample)]).mode()
+                    fill_value = mode[0] if not mode.empty else 0
+                elif use_sketches:
+                    fill_value = quantile_sketches[col].quantile(0.5)
+                else:
+                    sample = reservoirs[col].values
+                    fill_value = float(np.median(sample[~np.isnan(sample)]))
+                params["fill_values"][col] = fill_value
+                msg = f"Filled numeric column '{col}' with {strategy} ({fill_value:.2f})"
+            else:
+                counts_col = value_counts.get(col)
+                top = top_values[col].top(1) if col in top_values else []
+                if counts_col is not None and not counts_col.empty:
+                    fill_value = counts_col.idxmax()
+                elif top:
+                    fill_value = top[0][0]
+                else:
+                    fill_value = "Unknown"
+                params["fill_values"][col] = fill_value
+                msg = f"Filled categorical column '{col}' with '{fill_value}'"
+            logger.info(msg)
+            log.append(msg)
+
+    if outliers and not use_reservoirs:
+        # Imputed values join the sketch as one weighted entry, so bounds
+        # describe the same post-imputation state as the in-memory stage
+        multiplier = outlier_config.get("iqr_multiplier", 1.5)
+        for col, quantile_sketch in quantile_sketches.items():
+            if col in params["drop_columns"] or col in non_numeric:
+                continue
+            if col in params["fill_values"]:
+                quantile_sketch.update_repeated(params["fill_values"][col], null_counts[col])
+            if quantile_sketch.n == 0:
+                continue
+            q1, q3 = quantile_sketch.quantiles([0.25, 0.75])
+            iqr = q3 - q1
+            params["outlier_bounds"][col] = (
+                float(q1 - multiplier * iqr), float(q3 + multiplier * iqr)
+            )
+    elif outliers:
+        # Bounds are computed on the sampled values after imputation, the
+        # same state the in-memory outlier stage sees
+        sample = pd.DataFrame({
+            col: pd.Series(reservoir.values)
+            for col, reservoir in reservoirs.items()
+            if col not in non_numeric and col not in params["drop_columns"]
+        })
+        sample = sample.fillna({
+            col: value for col, value in params["fill_values"].items() if col in sample.columns
+        })
+        bounds = compute_outlier_bounds(sample, outlier_config).dropna()
+        params["outlier_bounds"] = {
+            col: (float(row["lower"]), float(row["upper"]))
+            for col, row in bounds.iterrows()
+        }
+
+    logger.info(f"Fitted streaming parameters over {total_rows} rows")
+    return params, log
+
+
+def _observe_dtypes(chunk: pd.DataFrame, chunk_dtypes: Dict[str, set]) -> None:
+    """Record the dtype each column was read with (None for an all-missing chunk)."""
+    counts = chunk.count()
+    for col, col_dtype in chunk.dtypes.items():
+        chunk_dtypes.setdefault(col, set()).add(col_dtype if counts[col] else None)
+
+
+def _resolve_dtypes(chunk_dtypes: Dict[str, set]) -> Dict[str, Any]:
+    """
+    Dtypes of the columns whose chunks were read with different dtypes.
+
+    Numbers become float64 when any chunk has floats or missing values (as
+    in a full read of the file), and a mix of numbers and text becomes text.
+    """
+    def is_number(dtype: Any) -> bool:
+        return pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype)
+
+    resolved = {}
+    for col, dtypes in chunk_dtypes.items():
+        observed = {dtype for dtype in dtypes if dtype is not None}
+        if observed and all(is_number(dtype) for dtype in observed):
+            if len(dtypes) > 1 or any(pd.api.types.is_float_dtype(dtype) for dtype in observed):
+                resolved[col] = "float64"
+        elif any(is_number(dtype) for dtype in observed) and any(
+            pd.api.types.is_string_dtype(dtype) for dtype in observed
+        ):
+            resolved[col] = "str"
+    return resolved
+
+
+def apply_streaming(
+    path: Union[str, Path],
+    params: Dict[str, Any],
+    output_path: Union[str, Path],
+    chunksize: int = DEFAULT_CHUNKSIZE
+) -> Tuple[Dict[str, Any], List[str]]:
+    """
+    Second pass: clean a chunked file and write the result as CSV.
+
+    Args:
+        path: Input file path
+        params: Parameters returned by ``fit_streaming``
+        output_path: Output CSV path
+        chunksize: Number of rows per chunk
+
+    Returns:
+        Tuple of (output metadata, list of log messages)
+
+    Example:
+        >>> meta, log = apply_streaming("data.csv", params, "cleaned.csv")
+    """
+    output_path = Path(output_path)
+    fingerprints = None
+    if params.get("duplicates"):
+        fingerprints = FingerprintSet(spill_dir=params.get("dedup_spill_dir"))
+    subset = params.get("duplicate_subset")
+    bounds = pd.DataFrame.from_dict(
+        params.get("outlier_bounds", {}), orient="index", columns=["lower", "upper"]
+    )
+    action = params.get("outlier_action", "cap")
+    outlier_counts = pd.Series(0, index=bounds.index, dtype=np.int64)
+    rows_out = 0
+    columns_out: List[str] = []
+    header = True
+
+    if action not in ("cap", "remove"):
+        logger.warning(f"Unknown action: {action}. Using 'cap'.")
+        action = "cap"
+
+    for chunk in iter_chunks(
+        path, chunksize, params.get("usecols"), params.get("dtype"), params.get("engine", "c")
+    ):
+        if "column_names" in params:
+            chunk.columns = params["column_names"]
+
+        if fingerprints is not None:
+            chunk = chunk[fingerprints.add(row_fingerprints(chunk, subset))]
+
+        if params.get("drop_columns"):
+            chunk = chunk.drop(columns=params["drop_columns"])
+
+        if params.get("fill_values"):
+            chunk = chunk.fillna(params["fill_values"])
+
+        if not bounds.empty:
+            chunk, counts = apply_outlier_bounds(chunk, bounds, action)
+            outlier_counts = outlier_counts.add(counts, fill_value=0).astype(np.int64)
+
+        chunk.to_csv(output_path, mode="w" if header else "a", header=header, index=False)
+        header = False
+        rows_out += len(chunk)
+        columns_out = chunk.columns.tolist()
+
+    if fingerprints is not None:
+        fingerprints.close()
+
+    log = []
+    for col, count in outlier_counts.items():
+        if count > 0:
+            msg = f"Handled {count} outliers in '{col}' (action: {action})"
+            logger.info(msg)
+            log.append(msg)
+
+    logger.info(f"Wrote {rows_out} rows to {output_path}")
+    return {"rows": rows_out, "columns": columns_out}, log
@@ -1,43 +1,395 @@
 """
 Correlation analysis utilities.
+
+Pearson correlations are computed block by block on standardized float32
+copies of the numeric columns, so wide tables never go through pandas'
+pairwise loop. The standardized data can be spilled to a memory-mapped file
+when it does not fit in memory. Spearman correlations rank every column once
+and reuse the blocked Pearson kernel on the ranks; Kendall's tau uses
+Knight's O(n log n) merge-sort algorithm per pair.
 """
 
+import tempfile
+from contextlib import nullcontext
+from pathlib import Path
 import pandas as pd
 import numpy as np
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Union
 
 from ..utils.logger import get_logger
+from ..utils.parallel import map_column_batches
 
 logger = get_logger(__name__)
 
+# Columns per block of the correlation matrix
+DEFAULT_BLOCK_SIZE = 256
+
+DEFAULT_TOP_K = 20
+
+CORRELATION_METHODS = ("pearson", "spearman", "kendall")
+
 
 def compute_correlations(
     df: pd.DataFrame,
-    method: str = "pearson"
+    method: str = "pearson",
+    block_size: int = DEFAULT_BLOCK_SIZE,
+    spill_dir: Optional[Union[str, Path]] = None,
+    max_rows: Optional[int] = None,
+    seed: int = 0,
+    workers: Optional[int] = 1
 ) -> Optional[pd.DataFrame]:
     """
     Compute correlation matrix for numeric columns.
-    
+
+    Like ``DataFrame.corr``, each pair uses the rows where both columns are
+    present. Pearson correlations are computed as float32 matrix products
+    over blocks of ``block_size`` columns. Spearman ranks each column once
+    over its non-missing values (identical to pandas when there are no
+    missing values) and correlates the ranks the same way. Kendall's tau-b
+    is computed per pair with Knight's O(n log n) algorithm.
+
     Args:
         df: Input DataFrame
         method: Correlation method ('pearson', 'spearman', 'kendall')
-    
+        block_size: Columns per block
+        spill_dir: Directory for a temporary memory-mapped copy of the
+            standardized data (default: keep it in memory)
+        max_rows: Estimate from a seeded random sample of this many rows when
+            the data is larger (default: use every row)
+        seed: Random seed for ``max_rows`` sampling
+        workers: Threads used for Kendall column pairs (-1 for all cores)
+
     Returns:
         Correlation matrix or None if insufficient numeric columns
-    
+
     Example:
         >>> corr_matrix = compute_correlations(df, method='spearman')
+        >>> corr_matrix = compute_correlations(wide_df, spill_dir="/scratch")
+        >>> corr_matrix = compute_correlations(big_df, method='kendall', max_rows=200_000)
     """
+    if method not in CORRELATION_METHODS:
+        raise ValueError(f"method must be one of {CORRELATION_METHODS}, got {method!r}")
+
     numeric_df = df.select_dtypes(include=[np.number])
-    
+
     if numeric_df.shape[1] < 2:
         logger.warning("Insufficient numeric columns for correlation analysis")
         return None
-    
+
+    if max_rows is not None and len(numeric_df) > max_rows:
+        positions = np.sort(np.random.default_rng(seed).choice(len(numeric_df), max_rows, replace=False))
+        numeric_df = numeric_df.iloc[positions]
+        logger.info(f"Computing {method} correlations on a sample of {max_rows} rows")
+
     try:
-        corr_matrix = numeric_df.corr(method=method)
+        if method == "pearson":
+            corr_matrix = _blocked_pearson(numeric_df, block_size, spill_dir)
+        elif method == "spearman":
+            corr_matrix = _blocked_pearson(_rank_columns(numeric_df, block_size), block_size, spill_dir)
+        else:
+            corr_matrix = _kendall_matrix(numeric_df, workers)
         logger.info(f"Computed {method} correlation matrix")
         return corr_matrix
     except Exception as e:
         logger.error(f"Error computing correlations: {e}")
-        return None
\ No newline at end of file
+        return None
+
+
+def _rank_columns(numeric_df: pd.DataFrame, block_size: int) -> pd.DataFrame:
+    """Average ranks of every column (missing values stay missing), computed once."""
+    blocks = [
+        numeric_df.iloc[:, start:start + block_size].rank(method="average")
+        for start in range(0, numeric_df.shape[1], block_size)
+    ]
+    return pd.concat(blocks, axis=1)
+
+
+def _blocked_pearson(
+    numeric_df: pd.DataFrame,
+    block_size: int,
+    spill_dir: Optional[Union[str, Path]]
+) -> pd.DataFrame:
+    """Pairwise-complete Pearson correlations from blocked float32 products."""
+    n_rows, n_cols = numeric_df.shape
+
+    with tempfile.TemporaryDirectory(dir=spill_dir) if spill_dir else nullcontext() as tmp:
+        if tmp:
+            standardized = np.lib.format.open_memmap(
+                Path(tmp) / "standardized.npy", mode="w+", dtype=np.float32, shape=(n_rows, n_cols)
+            )
+        else:
+            standardized = np.empty((n_rows, n_cols), dtype=np.float32)
+
+        # Standardize one block of columns at a time so the float64 copy stays
+        # bounded; missing values become 0 and are tracked in the null mask
+        has_nulls = np.zeros(n_cols, dtype=bool)
+        usable = np.zeros(n_cols, dtype=bool)
+        for start in range(0, n_cols, block_size):
+            stop = min(start + block_size, n_cols)
+            values = numeric_df.iloc[:, start:stop].to_numpy(dtype=np.float64, na_value=np.nan, copy=True)
+            missing = ~np.isfinite(values)
+            values[missing] = np.nan
+            has_nulls[start:stop] = missing.any(axis=0)
+            count = (~missing).sum(axis=0)
+            with np.errstate(invalid="ignore", divide="ignore"):
+                mean = np.nansum(values, axis=0) / count
+                values -= mean
+                std = np.sqrt(np.nansum(values * values, axis=0) / (count - 1))
+            usable[start:stop] = (count > 1) & (std > 0)
+            values /= np.where(usable[start:stop], std, 1.0)
+            values[missing] = 0.0
+            standardized[:, start:stop] = values
+
+        null_cols = np.flatnonzero(has_nulls)
+        present = numeric_df.iloc[:, null_cols].notna().to_numpy() if len(null_cols) else None
+        null_position = np.full(n_cols, -1)
+        null_position[null_cols] = np.arange(len(null_cols))
+
+        def mask(cols: slice) -> np.ndarray:
+            """float32 presence mask of a column block (all ones without nulls)."""
+            block = np.ones((n_rows, cols.stop - cols.start), dtype=np.float32)
+            positions = null_position[cols]
+            with_nulls = positions >= 0
+            if with_nulls.any():
+                block[:, with_nulls] = present[:, positions[with_nulls]]
+            return block
+
+        corr = np.empty((n_cols, n_cols), dtype=np.float32)
+        blocks = [slice(start, min(start + block_size, n_cols)) for start in range(0, n_cols, block_size)]
+        for i, rows in enumerate(blocks):
+            z_i = np.asarray(standardized[:, rows])
+            m_i = mask(rows) if has_nulls[rows].any() else None
+            for cols in blocks[i:]:
+                z_j = z_i if cols == rows else np.asarray(standardized[:, cols])
+                products = z_i.T @ z_j
+                if m_i is None and not has_nulls[cols].any():
+                    block = products / np.float32(n_rows - 1)
+                else:
+                    # Pairwise-complete rows: recompute sums over the rows
+                    # where both columns are present
+                    m_i_ = mask(rows) if m_i is None else m_i
+                    m_j = mask(cols)
+                    n = m_i_.T @ m_j
+                    sum_i = z_i.T @ m_j
+                    sum_j = m_i_.T @ z_j
+                    with np.errstate(invalid="ignore", divide="ignore"):
+                        cov = products - sum_i * sum_j / n
+                        var_i = (z_i * z_i).T @ m_j - sum_i * sum_i / n
+                        var_j = m_i_.T @ (z_j * z_j) - sum_j * sum_j / n
+                        block = np.where(n > 1, cov / np.sqrt(var_i * var_j), np.nan)
+                corr[rows, cols] = block
+                corr[cols, rows] = block.T
+
+        del standardized
+
+    np.clip(corr, -1, 1, out=corr)
+    corr[~usable, :] = np.nan
+    corr[:, ~usable] = np.nan
+    diagonal = np.arange(n_cols)
+    corr[diagonal[usable], diagonal[usable]] = 1.0
+
+    return pd.DataFrame(corr, index=numeric_df.columns, columns=numeric_df.columns)
+
+
+def _dense_ranks(values: np.ndarray) -> np.ndarray:
+    """Integer ranks 0..k-1 of the distinct values of a 1-D array."""
+    return np.unique(values, return_inverse=True)[1].reshape(-1)
+
+
+def _count_inversions(values: np.ndarray) -> int:
+    """
+    Number of pairs ``i < j`` with ``values[i] > values[j]``.
+
+    Bottom-up merge sort: at every level adjacent sorted runs are merged and,
+    for each element of a right run, the elements of its left run that are
+    greater are counted with one vectorized ``searchsorted``.
+    """
+    n = len(values)
+    if n < 2:
+        return 0
+
+    span = int(values.max()) + 1
+    runs = values.astype(np.int64)
+    position = np.arange(n)
+    inversions = 0
+    width = 1
+    while width < n:
+        # Offsetting by the merge group keeps every group's keys apart, so all
+        # groups of a level are handled by the same array operations
+        group = position // (2 * width)
+        keys = group * span + runs
+        right = (position // width) % 2 == 1
+        left_keys = keys[~right]
+        right_keys = keys[right]
+        left_end = np.searchsorted(left_keys, (group[right] + 1) * span, side="left")
+        inversions += int((left_end - np.searchsorted(left_keys, right_keys, side="right")).sum())
+        runs = np.sort(keys, kind="stable") - group * span
+        width *= 2
+
+    return inversions
+
+
+def _tied_pairs(counts: np.ndarray) -> int:
+    """Number of pairs within groups of tied values."""
+    counts = counts.astype(np.int64)
+    return int((counts * (counts - 1) // 2).sum())
+
+
+def _kendall_tau(x: np.ndarray, y: np.ndarray) -> float:
+    """Kendall's tau-b of two dense-ranked arrays (Knight's algorithm)."""
+    n = len(x)
+    if n < 2:
+        return np.nan
+
+    # Sort by x, then y: discordant pairs are exactly the inversions of y
+    key = x.astype(np.int64) * (int(y.max()) + 1) + y
+    order = np.argsort(key, kind="stable")
+    discordant = _count_inversions(y[order])
+
+    sorted_key = key[order]
+    boundaries = np.flatnonzero(np.r_[True, sorted_key[1:] != sorted_key[:-1], True])
+    tied_both = _tied_pairs(np.diff(boundaries))
+    tied_x = _tied_pairs(np.bincount(x))
+    tied_y = _tied_pairs(np.bincount(y))
+
+    total = n * (n - 1) // 2
+    denominator = np.sqrt(float(total - tied_x) * float(total - tied_y))
+    if denominator == 0:
+        return np.nan
+    return float(total - tied_x - tied_y + tied_both - 2 * discordant) / denominator
+
+
+def _kendall_matrix(numeric_df: pd.DataFrame, workers: Optional[int]) -> pd.DataFrame:
+    """Pairwise-complete Kendall tau-b matrix."""
+    columns = numeric_df.columns
+    n_cols = len(columns)
+    values = numeric_df.to_numpy(dtype=np.float64, na_value=np.nan)
+    present = ~np.isnan(values)
+    complete = present.all(axis=0)
+
+    # Ranks computed once per column; pairs with missing values re-rank the
+    # rows both columns share
+    ranks = [_dense_ranks(values[present[:, j], j]) if complete[j] else None for j in range(n_cols)]
+
+    def pair_ranks(i: int, j: int):
+        if complete[i] and complete[j]:
+            return ranks[i], ranks[j]
+        both = present[:, i] & present[:, j]
+        return _dense_ranks(values[both, i]), _dense_ranks(values[both, j])
+
+    def rows(block: list) -> Dict[int, np.ndarray]:
+        result = {}
+        for i in block:
+            row = np.full(n_cols, np.nan)
+            for j in range(i + 1, n_cols):
+                row[j] = _kendall_tau(*pair_ranks(i, j))
+            result[i] = row
+        return result
+
+    corr = np.full((n_cols, n_cols), np.nan)
+    for block in map_column_batches(rows, list(range(n_cols)), workers=workers):
+        for i, row in block.items():
+            corr[i, i + 1:] = row[i + 1:]
+            corr[i + 1:, i] = row[i + 1:]
+
+    # Constant or empty columns have no defined correlation, even with themselves
+    diagonal = [
+        i for i in range(n_cols)
+        if np.unique(values[present[:, i], i]).size > 1
+    ]
+    corr[diagonal, diagonal] = 1.0
+
+    return pd.DataFrame(corr, index=columns, columns=columns)
+
+
+def strongest_correlations(
+    corr_matrix: pd.DataFrame,
+    top_k: Optional[int] = DEFAULT_TOP_K,
+    threshold: Optional[float] = None
+) -> pd.DataFrame:
+    """
+    Strongest column pairs of a correlation matrix by absolute correlation.
+
+    The upper triangle is scanned in row blocks, keeping at most ``top_k``
+    candidates, so the full list of pairs is never materialized.
+
+    Args:
+        corr_matrix: Correlation matrix
+        top_k: Maximum number of pairs (None for no limit)
+        threshold: Only keep pairs with ``|correlation| >= threshold``
+
+    Returns:
+        DataFrame with columns ``column_1``, ``column_2``, ``correlation``,
+        strongest first
+
+    Example:
+        >>> strongest_correlations(corr_matrix, top_k=10)
+        >>> strongest_correlations(corr_matrix, top_k=None, threshold=0.9)
+    """
+    values = corr_matrix.to_numpy()
+    n_cols = values.shape[0]
+
+    rows: List[np.ndarray] = []
+    cols: List[np.ndarray] = []
+    for start in range(0, n_cols, DEFAULT_BLOCK_SIZE):
+        stop = min(start + DEFAULT_BLOCK_SIZE, n_cols)
+        block = np.abs(values[start:stop])
+        # Upper triangle only: each pair once, no diagonal
+        block = np.where(np.arange(n_cols) > np.arange(start, stop)[:, None], block, np.nan)
+        keep = ~np.isnan(block)
+        if threshold is not None:
+            keep &= block >= threshold
+        r, c = np.nonzero(keep)
+        r += start
+        rows.append(r)
+        cols.append(c)
+
+        # Bound the candidate set to the current top_k
+        if top_k is not None and sum(len(part) for part in rows) > top_k:
+            r, c = np.concatenate(rows), np.concatenate(cols)
+            best = np.argpartition(-np.abs(values[r, c]), top_k - 1)[:top_k] if top_k > 0 else []
+            rows, cols = [r[best]], [c[best]]
+
+    r = np.concatenate(rows) if rows else np.array([], dtype=np.int64)
+    c = np.concatenate(cols) if cols else np.array([], dtype=np.int64)
+    order = np.argsort(-np.abs(values[r, c]), kind="stable")
+    r, c = r[order], c[order]
+
+    labels = corr_matrix.columns
+    return pd.DataFrame({
+        "column_1": labels[r],
+        "column_2": labels[c],
+        "correlation": values[r, c].astype(np.float64),
+    })
+
+
+def cluster_order(corr_matrix: pd.DataFrame) -> List:
+    """
+    Order columns so that strongly correlated columns are adjacent.
+
+    Greedy nearest-neighbour chaining on ``|correlation|``: start from the
+    column with the largest total absolute correlation and repeatedly append
+    the remaining column most correlated with the last one.
+
+    Args:
+        corr_matrix: Correlation matrix
+
+    Returns:
+        Column labels in clustered order
+    """
+    strength = np.nan_to_num(np.abs(corr_matrix.to_numpy(dtype=np.float64)))
+    np.fill_diagonal(strength, 0.0)
+    n_cols = strength.shape[0]
+    if n_cols == 0:
+        return []
+
+    remaining = np.ones(n_cols, dtype=bool)
+    current = int(np.argmax(strength.sum(axis=1)))
+    order = [current]
+    remaining[current] = False
+    for _ in range(n_cols - 1):
+        current = int(np.argmax(np.where(remaining, strength[current], -1.0)))
+        order.append(current)
+        remaining[current] = False
+
+    return [corr_matrix.columns[i] for i in order]
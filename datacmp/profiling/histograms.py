@@ -0,0 +1,182 @@
+"""
+Binned histograms for numeric columns.
+
+Histograms are computed once per profile with vectorized NumPy binning over
+blocks of columns, cached, and reused by plots and reports. They can be
+merged, so histograms of chunks, files or partitions combine into one.
+"""
+
+import warnings
+from typing import Dict, Any, Optional, List
+import pandas as pd
+import numpy as np
+
+from ..utils.logger import get_logger
+from ..utils.parallel import map_column_batches
+
+logger = get_logger(__name__)
+
+DEFAULT_BINS = 30
+
+# Same bound as the numeric statistics kernel: cells binned at once
+_BLOCK_CELLS = 1_000_000
+
+
+class Histogram:
+    """
+    Equal-width histogram of one numeric column.
+
+    ``counts[i]`` holds the number of values in ``[edges[i], edges[i + 1])``;
+    the last bin also includes its right edge. Missing and infinite values
+    are not counted.
+
+    Example:
+        >>> hist = Histogram.from_values(df["age"], bins=20)
+        >>> hist = hist.merge(Histogram.from_values(chunk["age"], bins=20))
+    """
+
+    def __init__(self, edges: np.ndarray, counts: np.ndarray):
+        self.edges = np.asarray(edges, dtype=np.float64)
+        self.counts = np.asarray(counts, dtype=np.int64)
+
+    @classmethod
+    def from_values(cls, values: Any, bins: int = DEFAULT_BINS) -> "Histogram":
+        """Bin an array of values (NaN and infinities are ignored)."""
+        values = np.asarray(values, dtype=np.float64).reshape(-1, 1)
+        return _bin_block(values, bins)[0]
+
+    @property
+    def total(self) -> int:
+        """Number of values counted."""
+        return int(self.counts.sum())
+
+    def merge(self, other: "Histogram", bins: Optional[int] = None) -> "Histogram":
+        """
+        Combine two histograms.
+
+        Histograms with identical edges are added exactly. Otherwise both are
+        re-binned onto equal-width edges spanning their combined range,
+        spreading each source bin's count over the target bins it overlaps
+        (values are assumed uniform within a bin).
+
+        Args:
+            other: Histogram to merge
+            bins: Number of bins of the result (default: the larger of the two)
+
+        Returns:
+            New merged Histogram
+        """
+        if other.total == 0:
+            return Histogram(self.edges, self.counts)
+        if self.total == 0:
+            return Histogram(other.edges, other.counts)
+
+        if bins is None and len(self.edges) == len(other.edges) and np.array_equal(self.edges, other.edges):
+            return Histogram(self.edges, self.counts + other.counts)
+
+        bins = bins or max(len(self.counts), len(other.counts))
+        edges = np.linspace(
+            min(self.edges[0], other.edges[0]), max(self.edges[-1], other.edges[-1]), bins + 1
+        )
+        counts = _rebin(self, edges) + _rebin(other, edges)
+
+        # Rounding the spread counts must not change the total
+        rounded = np.floor(counts).astype(np.int64)
+        shortfall = self.total + other.total - int(rounded.sum())
+        if shortfall > 0:
+            rounded[np.argsort(rounded - counts)[:shortfall]] += 1
+        return Histogram(edges, rounded)
+
+    def to_dict(self) -> Dict[str, List[float]]:
+        """JSON-serializable representation."""
+        return {"edges": self.edges.tolist(), "counts": self.counts.tolist()}
+
+    def __repr__(self) -> str:
+        return f"Histogram(bins={len(self.counts)}, total={self.total})"
+
+
+def _rebin(hist: Histogram, edges: np.ndarray) -> np.ndarray:
+    """Spread a histogram's counts over new edges, proportional to overlap."""
+    low = np.maximum(hist.edges[:-1, None], edges[None, :-1])
+    high = np.minimum(hist.edges[1:, None], edges[None, 1:])
+    widths = np.diff(hist.edges)[:, None]
+    overlap = np.clip(high - low, 0, None) / np.where(widths > 0, widths, 1)
+    return (hist.counts[:, None] * overlap).sum(axis=0)
+
+
+def _bin_block(values: np.ndarray, bins: int) -> List[Histogram]:
+    """Histograms of every column of a 2-D (rows x columns) float array."""
+    n_cols = values.shape[1]
+    finite = np.isfinite(values)
+    has_infinite = (~finite & ~np.isnan(values)).any()
+    
+    with np.errstate(invalid="ignore"), warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        low = np.nanmin(values, axis=0)
+        high = np.nanmax(values, axis=0)
+        if has_infinite:
+            # Infinite values are not binned and must not stretch the range
+            masked = np.where(finite, values, np.nan)
+            low, high = np.nanmin(masked, axis=0), np.nanmax(masked, axis=0)
+    
+    empty = np.isnan(low)
+    low, high = np.where(empty, 0.0, low), np.where(empty, 1.0, high)
+    # Constant columns get a unit-wide range around the value, as np.histogram does
+    constant = low == high
+    low, high = np.where(constant, low - 0.5, low), np.where(constant, high + 0.5, high)
+    
+    # Bin index of every finite value, offset per column so one bincount
+    # counts the whole block
+    scaled = values - low
+    scaled *= bins / (high - low)
+    column = np.broadcast_to(np.arange(n_cols) * bins, values.shape)[finite]
+    index = np.clip(scaled[finite], 0, bins - 1).astype(np.int64) + column
+    
+    counts = np.bincount(index, minlength=n_cols * bins).reshape(n_cols, bins)
+    return [
+        Histogram(np.linspace(low[j], high[j], bins + 1), counts[j])
+        for j in range(n_cols)
+    ]
+
+
+def compute_histograms(
+    df: pd.DataFrame,
+    bins: int = DEFAULT_BINS,
+    workers: Optional[int] = 1
+) -> Dict[str, Histogram]:
+    """
+    Compute an equal-width histogram for every numeric column.
+
+    Columns are binned in blocks: one min/max pass and one ``np.bincount``
+    per block, with no per-column Python loop over the data.
+
+    Args:
+        df: Input DataFrame (non-numeric columns are ignored)
+        bins: Number of bins per column
+        workers: Threads used to process column blocks concurrently
+            (-1 for all cores)
+
+    Returns:
+        Dict mapping column name to Histogram
+
+    Example:
+        >>> histograms = compute_histograms(df, bins=50)
+        >>> histograms["age"].counts
+    """
+    columns = [
+        col for col in df.columns
+        if pd.api.types.is_numeric_dtype(df[col])
+        and not pd.api.types.is_bool_dtype(df[col])
+        and not pd.api.types.is_complex_dtype(df[col])
+    ]
+
+    def block_histograms(block_cols: list) -> Dict[str, Histogram]:
+        values = df[block_cols].to_numpy(dtype=np.float64, na_value=np.nan)
+        return dict(zip(block_cols, _bin_block(values, bins)))
+
+    histograms: Dict[str, Histogram] = {}
+    block_size = max(1, _BLOCK_CELLS // max(len(df), 1))
+    for block in map_column_batches(block_histograms, columns, workers=workers, batch_size=block_size):
+        histograms.update(block)
+
+    return histograms
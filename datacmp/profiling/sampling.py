@@ -0,0 +1,142 @@
+"""
+Reproducible row sampling and confidence intervals for sampled profiles.
+"""
+
+from statistics import NormalDist
+from typing import Dict, Any, Optional, Tuple, Union
+import pandas as pd
+import numpy as np
+
+from .statistics import categorical_columns
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_CONFIDENCE_LEVEL = 0.95
+
+
+def sample_frame(
+    df: pd.DataFrame,
+    sample: Union[float, int],
+    stratify: Optional[str] = None,
+    seed: int = 0
+) -> pd.DataFrame:
+    """
+    Draw a reproducible random sample of rows.
+
+    Args:
+        df: Input DataFrame
+        sample: Fraction of rows (float in (0, 1]) or number of rows (int)
+        stratify: Column to stratify by; every group is sampled with the same
+            fraction, so group proportions are preserved
+        seed: Random seed (the same seed always gives the same rows)
+
+    Returns:
+        Sampled DataFrame in original row order
+
+    Example:
+        >>> sampled = sample_frame(df, 0.01, stratify="country", seed=42)
+    """
+    n_rows = len(df)
+
+    if isinstance(sample, (bool, np.bool_)) or not isinstance(sample, (int, float, np.integer, np.floating)):
+        raise TypeError("sample must be a fraction (float) or a number of rows (int)")
+    if isinstance(sample, (float, np.floating)):
+        if not 0 < sample <= 1:
+            raise ValueError("sample fraction must be in (0, 1]")
+        fraction = float(sample)
+    else:
+        if sample <= 0:
+            raise ValueError("sample row count must be positive")
+        fraction = min(1.0, sample / n_rows) if n_rows else 1.0
+
+    if fraction >= 1.0:
+        return df
+
+    rng = np.random.default_rng(seed)
+    keys = rng.random(n_rows)
+
+    if stratify is None:
+        size = max(1, round(fraction * n_rows))
+        positions = np.sort(np.argpartition(keys, size - 1)[:size])
+    else:
+        if stratify not in df.columns:
+            raise ValueError(f"Stratification column not found: {stratify!r}")
+        codes, _ = pd.factorize(df[stratify], use_na_sentinel=False)
+        group_sizes = np.bincount(codes)
+        quota = np.maximum(1, np.round(fraction * group_sizes)).astype(np.int64)
+        # Keep the rows with the smallest random keys within each group
+        ranks = pd.Series(keys).groupby(codes).rank(method="first").to_numpy()
+        positions = np.flatnonzero(ranks <= quota[codes])
+
+    logger.info(f"Sampled {len(positions)} of {n_rows} rows (seed={seed})")
+    return df.iloc[positions]
+
+
+def confidence_intervals(
+    sample_df: pd.DataFrame,
+    numeric_stats: pd.DataFrame,
+    null_counts: pd.Series,
+    total_rows: int,
+    level: float = DEFAULT_CONFIDENCE_LEVEL
+) -> Dict[str, Dict[str, Tuple[float, float, float]]]:
+    """
+    Confidence intervals for statistics estimated from a simple random sample.
+
+    - mean: normal interval with finite population correction
+    - median, q25, q75: distribution-free interval from sample order statistics
+    - top_share (categorical): share of the most frequent value, Wald interval
+
+    Args:
+        sample_df: Sampled DataFrame
+        numeric_stats: ``compute_numeric_stats`` output for the sample
+        null_counts: Exact per-column null counts of the full data
+        total_rows: Number of rows in the full data
+        level: Confidence level
+
+    Returns:
+        Dict mapping column -> statistic -> (estimate, lower, upper)
+
+    Example:
+        >>> intervals = confidence_intervals(sampled, stats, df.isnull().sum(), len(df))
+        >>> intervals["age"]["mean"]
+    """
+    z = NormalDist().inv_cdf((1 + level) / 2)
+    intervals: Dict[str, Dict[str, Tuple[float, float, float]]] = {}
+
+    def finite_population_correction(n: float, population: float) -> float:
+        return np.sqrt(max(population - n, 0) / (population - 1)) if population > 1 else 0.0
+
+    numeric_cols = [col for col in numeric_stats.index if col in sample_df.columns]
+    if numeric_cols:
+        ordered = np.sort(sample_df[numeric_cols].to_numpy(dtype=np.float64, na_value=np.nan), axis=0)
+
+    for j, col in enumerate(numeric_cols):
+        row = numeric_stats.loc[col]
+        n = int(row["count"])
+        if n < 2:
+            continue
+        fpc = finite_population_correction(n, total_rows - null_counts.get(col, 0))
+
+        margin = z * row["std"] / np.sqrt(n) * fpc
+        col_intervals = {"mean": (float(row["mean"]), float(row["mean"] - margin), float(row["mean"] + margin))}
+
+        for stat, q in (("q25", 0.25), ("median", 0.5), ("q75", 0.75)):
+            spread = z * np.sqrt(n * q * (1 - q)) * fpc
+            low = int(np.clip(np.floor(n * q - spread), 0, n - 1))
+            high = int(np.clip(np.ceil(n * q + spread), 0, n - 1))
+            col_intervals[stat] = (float(row[stat]), float(ordered[low, j]), float(ordered[high, j]))
+
+        intervals[col] = col_intervals
+
+    for col in categorical_columns(sample_df):
+        value_counts = sample_df[col].value_counts()
+        n = int(value_counts.sum())
+        if n == 0:
+            continue
+        share = value_counts.iloc[0] / n
+        fpc = finite_population_correction(n, total_rows - null_counts.get(col, 0))
+        margin = z * np.sqrt(share * (1 - share) / n) * fpc
+        intervals[col] = {"top_share": (float(share), float(max(0.0, share - margin)), float(min(1.0, share + margin)))}
+
+    return intervals
@@ -0,0 +1,368 @@
+"""
+Mergeable streaming sketches for approximate profiling.
+
+- ``KLLSketch``: quantiles (median, quartiles, IQR bounds)
+- ``HyperLogLog``: distinct counts
+- ``SpaceSaving``: most frequent values
+
+Each sketch uses bounded memory set by an error parameter, can be updated
+with arrays of values (e.g. one chunk at a time) and can be merged with
+another sketch of the same kind, so partial sketches from chunks, files or
+worker processes combine into one.
+"""
+
+import math
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_QUANTILE_ERROR = 0.01
+DEFAULT_DISTINCT_ERROR = 0.01
+DEFAULT_TOP_VALUES_ERROR = 0.001
+
+# Values are fed to KLL in slices so level-0 sorts stay small
+_KLL_BATCH = 1 << 16
+
+# Values are fed to Space-Saving in slices of this many times its capacity,
+# so counting a slice never holds more than that many distinct values
+_TOP_VALUES_SLICE = 32
+
+
+def sketch_settings(config: Dict[str, Any]) -> Optional[Dict[str, float]]:
+    """
+    Read sketch error bounds from a profiling configuration.
+
+    Args:
+        config: Profiling configuration
+
+    Returns:
+        Dict with ``quantile_error``, ``distinct_error`` and
+        ``top_values_error``, or None when ``approximate`` is disabled
+
+    Example:
+        >>> sketch_settings({"approximate": True, "sketch": {"quantile_error": 0.005}})
+    """
+    if not config.get("approximate", False):
+        return None
+
+    settings = config.get("sketch", {}) or {}
+    return {
+        "quantile_error": settings.get("quantile_error", DEFAULT_QUANTILE_ERROR),
+        "distinct_error": settings.get("distinct_error", DEFAULT_DISTINCT_ERROR),
+        "top_values_error": settings.get("top_values_error", DEFAULT_TOP_VALUES_ERROR),
+    }
+
+
+class KLLSketch:
+    """
+    KLL quantile sketch.
+
+    Keeps a hierarchy of compactors; items at level ``h`` carry weight
+    ``2**h``. The normalized rank error is about ``1.65 / k`` with high
+    probability, using ``O(k)`` memory.
+
+    Example:
+        >>> sketch = KLLSketch.from_error(0.01)
+        >>> sketch.update(values)
+        >>> q1, median, q3 = sketch.quantiles([0.25, 0.5, 0.75])
+    """
+
+    def __init__(self, k: int = 200, seed: Optional[int] = 0):
+        self.k = max(8, int(k))
+        self.n = 0
+        self.min = np.nan
+        self.max = np.nan
+        self._levels: List[np.ndarray] = [np.empty(0, dtype=np.float64)]
+        self._rng = np.random.default_rng(seed)
+
+    @classmethod
+    def from_error(cls, error: float, seed: Optional[int] = 0) -> "KLLSketch":
+        """Create a sketch whose normalized rank error is about ``error``."""
+        return cls(k=math.ceil(1.65 / error), seed=seed)
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self._levels) - level - 1
+        return max(2, math.ceil(self.k * (2 / 3) ** depth))
+
+    def update(self, values: Any) -> "KLLSketch":
+        """Add an array of values (NaN is ignored)."""
+        values = np.asarray(values, dtype=np.float64).ravel()
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return self
+
+        self.min = np.nanmin([self.min, values.min()])
+        self.max = np.nanmax([self.max, values.max()])
+        self.n += len(values)
+
+        for start in range(0, len(values), _KLL_BATCH):
+            self._levels[0] = np.concatenate([self._levels[0], values[start:start + _KLL_BATCH]])
+            self._compress()
+        return self
+
+    def update_repeated(self, value: float, count: int) -> "KLLSketch":
+        """Add ``count`` copies of one value without materializing them."""
+        count = int(count)
+        if count <= 0 or np.isnan(value):
+            return self
+
+        self.min = np.nanmin([self.min, value])
+        self.max = np.nanmax([self.max, value])
+        self.n += count
+
+        # One item per set bit of `count`, at the level with that weight
+        level = 0
+        while count:
+            if count & 1:
+                while len(self._levels) <= level:
+                    self._levels.append(np.empty(0, dtype=np.float64))
+                self._levels[level] = np.append(self._levels[level], value)
+            count >>= 1
+            level += 1
+        self._compress()
+        return self
+
+    def merge(self, other: "KLLSketch") -> "KLLSketch":
+        """Merge another KLL sketch into this one."""
+        if other.n == 0:
+            return self
+
+        self.n += other.n
+        self.min = np.nanmin([self.min, other.min])
+        self.max = np.nanmax([self.max, other.max])
+        self.k = max(self.k, other.k)
+        while len(self._levels) < len(other._levels):
+            self._levels.append(np.empty(0, dtype=np.float64))
+        for level, items in enumerate(other._levels):
+            self._levels[level] = np.concatenate([self._levels[level], items])
+        self._compress()
+        return self
+
+    def _compress(self) -> None:
+        level = 0
+        while level < len(self._levels):
+            items = self._levels[level]
+            if len(items) > self._capacity(level):
+                items = np.sort(items)
+                keep = items[len(items) - len(items) % 2:]
+                items = items[:len(items) - len(items) % 2]
+                promoted = items[self._rng.integers(2)::2]
+                self._levels[level] = keep
+                if level + 1 == len(self._levels):
+                    self._levels.append(np.empty(0, dtype=np.float64))
+                self._levels[level + 1] = np.concatenate([self._levels[level + 1], promoted])
+            level += 1
+
+    def quantiles(self, qs: Sequence[float]) -> np.ndarray:
+        """
+        Estimate quantiles.
+
+        Args:
+            qs: Quantile levels in [0, 1]
+
+        Returns:
+            Array of estimates (NaN if the sketch is empty)
+        """
+        qs = np.asarray(qs, dtype=np.float64)
+        if self.n == 0:
+            return np.full(qs.shape, np.nan)
+
+        values = np.concatenate(self._levels)
+        weights = np.concatenate([
+            np.full(len(items), 2.0 ** level) for level, items in enumerate(self._levels)
+        ])
+        order = np.argsort(values, kind="stable")
+        values, cumulative = values[order], np.cumsum(weights[order])
+
+        positions = np.searchsorted(cumulative, qs * cumulative[-1], side="left")
+        result = values[np.clip(positions, 0, len(values) - 1)]
+        result = np.where(qs <= 0, self.min, result)
+        return np.where(qs >= 1, self.max, result)
+
+    def quantile(self, q: float) -> float:
+        """Estimate a single quantile."""
+        return float(self.quantiles([q])[0])
+
+
+def _hash_values(values: Any) -> np.ndarray:
+    """64-bit hashes of the non-null values of an array."""
+    series = pd.Series(values).dropna()
+    return pd.util.hash_pandas_object(series, index=False).to_numpy(dtype=np.uint64)
+
+
+def _leading_zeros(x: np.ndarray) -> np.ndarray:
+    """Count leading zero bits of each uint64 (53+ bits are reported as 64)."""
+    # The top 53 bits convert to float64 exactly; the exponent is their bit length
+    _, exponent = np.frexp((x >> np.uint64(11)).astype(np.float64))
+    return np.where(exponent > 0, 53 - exponent, 64).astype(np.uint8)
+
+
+class HyperLogLog:
+    """
+    HyperLogLog distinct-count sketch.
+
+    Uses ``2**p`` one-byte registers; the relative standard error is about
+    ``1.04 / sqrt(2**p)``. Merging takes the register-wise maximum.
+
+    Example:
+        >>> hll = HyperLogLog.from_error(0.01)
+        >>> hll.update(df["city"])
+        >>> hll.count()
+    """
+
+    def __init__(self, p: int = 14):
+        if not 4 <= p <= 18:
+            raise ValueError("HyperLogLog precision p must be between 4 and 18")
+        self.p = p
+        self.registers = np.zeros(1 << p, dtype=np.uint8)
+
+    @classmethod
+    def from_error(cls, error: float) -> "HyperLogLog":
+        """Create a sketch whose relative standard error is about ``error``."""
+        p = math.ceil(math.log2((1.04 / error) ** 2))
+        return cls(p=min(18, max(4, p)))
+
+    def update(self, values: Any) -> "HyperLogLog":
+        """Add an array of values (nulls are ignored)."""
+        hashes = _hash_values(values)
+        if len(hashes) == 0:
+            return self
+
+        index = (hashes >> np.uint64(64 - self.p)).astype(np.int64)
+        remainder = hashes << np.uint64(self.p)
+        rank = np.minimum(_leading_zeros(remainder), 64 - self.p) + 1
+        np.maximum.at(self.registers, index, rank.astype(np.uint8))
+        return self
+
+    def merge(self, other: "HyperLogLog") -> "HyperLogLog":
+        """Merge another HyperLogLog sketch (same precision) into this one."""
+        if other.p != self.p:
+            raise ValueError("Cannot merge HyperLogLog sketches with different precision")
+        np.maximum(self.registers, other.registers, out=self.registers)
+        return self
+
+    def count(self) -> int:
+        """Estimate the number of distinct values."""
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / np.sum(np.ldexp(1.0, -self.registers.astype(np.int64)))
+
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if estimate <= 2.5 * m and zeros > 0:
+            estimate = m * math.log(m / zeros)
+        return int(round(estimate))
+
+
+class SpaceSaving:
+    """
+    Space-Saving heavy-hitters sketch.
+
+    Tracks at most ``capacity`` values. Each tracked count overestimates the
+    true count by at most its recorded error, and every value occurring more
+    than ``n / capacity`` times is guaranteed to be tracked. ``update()``
+    counts its input in slices of ``32 * capacity`` values, so memory stays
+    ``O(capacity)`` however many values are passed at once (including a
+    whole in-memory column).
+
+    Example:
+        >>> top = SpaceSaving.from_error(0.001)
+        >>> top.update(df["city"])
+        >>> value, count, error = top.top(1)[0]
+    """
+
+    def __init__(self, capacity: int = 1000):
+        self.capacity = max(1, int(capacity))
+        self.n = 0
+        self.counts = pd.Series(dtype=np.int64)
+        self.errors = pd.Series(dtype=np.int64)
+
+    @classmethod
+    def from_error(cls, error: float) -> "SpaceSaving":
+        """Create a sketch whose count error is at most ``error * n``."""
+        return cls(capacity=math.ceil(1 / error))
+
+    def _floor(self) -> int:
+        """Count assumed for untracked values (0 until the sketch is full)."""
+        if len(self.counts) < self.capacity:
+            return 0
+        return int(self.counts.min())
+
+    def update(self, values: Any) -> "SpaceSaving":
+        """Add an array of values (nulls are ignored), one bounded slice at a time."""
+        values = pd.Series(values)
+        step = _TOP_VALUES_SLICE * self.capacity
+        for start in range(0, len(values), step):
+            chunk = values.iloc[start:start + step].value_counts(dropna=True)
+            chunk = chunk[chunk > 0]
+            # The slice's top values (counts are sorted) form a summary of the
+            # same capacity: untracked values count at most its smallest count
+            summary = SpaceSaving(capacity=self.capacity)
+            summary.counts = chunk.iloc[:self.capacity].astype(np.int64)
+            summary.errors = pd.Series(0, index=summary.counts.index, dtype=np.int64)
+            summary.n = int(chunk.sum())
+            self.merge(summary)
+        return self
+
+    def merge(self, other: "SpaceSaving") -> "SpaceSaving":
+        """Merge another Space-Saving sketch into this one."""
+        floor_self, floor_other = self._floor(), other._floor()
+        union = self.counts.index.append(other.counts.index).unique()
+
+        counts = (
+            self.counts.reindex(union, fill_value=floor_self)
+            + other.counts.reindex(union, fill_value=floor_other)
+        )
+        errors = (
+            self.errors.reindex(union, fill_value=floor_self)
+            + other.errors.reindex(union, fill_value=floor_other)
+        )
+
+        keep = counts.nlargest(self.capacity, keep="first").index
+        self.counts = counts[keep].astype(np.int64)
+        self.errors = errors[keep].astype(np.int64)
+        self.n += other.n
+        return self
+
+    def top(self, k: int = 10) -> List[Tuple[Any, int, int]]:
+        """
+        Most frequent values.
+
+        Args:
+            k: Number of values to return
+
+        Returns:
+            List of (value, estimated count, maximum overestimate), most
+            frequent first
+        """
+        ordered = self.counts.sort_values(ascending=False, kind="stable").head(k)
+        return [(value, int(count), int(self.errors[value])) for value, count in ordered.items()]
+
+
+def sketch_quantiles(block: pd.DataFrame, qs: Sequence[float], error: float) -> pd.DataFrame:
+    """
+    Approximate ``block.quantile(qs)`` with one KLL sketch per column.
+
+    Args:
+        block: Numeric DataFrame
+        qs: Quantile levels in [0, 1]
+        error: Normalized rank error of each sketch
+
+    Returns:
+        DataFrame indexed by quantile level with one column per input column
+    """
+    result = {}
+    for col in block.columns:
+        sketch = KLLSketch.from_error(error)
+        sketch.update(block[col].to_numpy(dtype=np.float64, na_value=np.nan))
+        result[col] = sketch.quantiles(qs)
+    return pd.DataFrame(result, index=pd.Index(qs), columns=block.columns, dtype=float)
+
+
+def sketch_nunique(df: pd.DataFrame, error: float) -> pd.Series:
+    """Approximate ``df.nunique()`` with one HyperLogLog sketch per column."""
+    return pd.Series(
+        {col: HyperLogLog.from_error(error).update(df[col]).count() for col in df.columns},
+        index=df.columns,
+        dtype="int64",
+    )
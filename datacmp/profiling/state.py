@@ -0,0 +1,476 @@
+"""
+Incremental profiling state.
+
+A ``ProfileState`` keeps one mergeable summary per column (counts, null
+counts, central moments, a KLL quantile sketch, a HyperLogLog distinct
+count, a histogram and Space-Saving top values) plus a row fingerprint set
+for duplicates. Adding a batch touches only that batch, and the summary,
+statistics and histograms are rendered from the state, so a table that
+grows by appended partitions never has to be re-profiled from scratch.
+
+States can be saved to disk, reloaded on the next run and merged with
+states built elsewhere (other files, partitions or processes).
+"""
+
+import pickle
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from .histograms import Histogram, compute_histograms, DEFAULT_BINS
+from .sketches import (
+    KLLSketch, HyperLogLog, SpaceSaving,
+    DEFAULT_QUANTILE_ERROR, DEFAULT_DISTINCT_ERROR, DEFAULT_TOP_VALUES_ERROR,
+)
+from .statistics import NUMERIC_STAT_FIELDS, moment_stats
+from .summary import format_summary
+from ..cleaning.duplicates import FingerprintSet, row_fingerprints
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def _column_kind(series: pd.Series) -> str:
+    """Profiling kind of a column, following the ``select_dtypes`` groups used elsewhere."""
+    dtype = series.dtype
+    if pd.api.types.is_datetime64_any_dtype(dtype):
+        return "datetime"
+    if (
+        pd.api.types.is_numeric_dtype(dtype)
+        and not pd.api.types.is_bool_dtype(dtype)
+        and not pd.api.types.is_complex_dtype(dtype)
+    ):
+        return "numeric"
+    if (
+        pd.api.types.is_object_dtype(dtype)
+        or pd.api.types.is_string_dtype(dtype)
+        or isinstance(dtype, pd.CategoricalDtype)
+    ):
+        return "categorical"
+    return "other"
+
+
+class ColumnSummary:
+    """
+    Mergeable summary of one column.
+
+    Numeric (and, with ``moments``, boolean) columns keep the count, mean and
+    the sums of 2nd-4th powers of deviations from the mean (combined with
+    the pairwise update of Chan et al. / Pébay, which stays accurate where
+    raw power sums would cancel), min/max and a KLL quantile sketch; numeric
+    columns also keep a histogram. Categorical columns keep Space-Saving top
+    values. Every column keeps a HyperLogLog distinct count.
+    """
+
+    def __init__(
+        self,
+        kind: str,
+        dtype: str,
+        moments: bool = False,
+        quantile_error: float = DEFAULT_QUANTILE_ERROR,
+        distinct_error: float = DEFAULT_DISTINCT_ERROR,
+        top_values_error: float = DEFAULT_TOP_VALUES_ERROR
+    ):
+        self.kind = kind
+        self.dtype = dtype
+        self.moments = moments or kind == "numeric"
+        self.count = 0
+        self.nulls = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.m3 = 0.0
+        self.m4 = 0.0
+        self.min = np.nan
+        self.max = np.nan
+        self.quantiles = KLLSketch.from_error(quantile_error) if self.moments else None
+        self.histogram: Optional[Histogram] = None
+        self.distinct = HyperLogLog.from_error(distinct_error)
+        self.top = SpaceSaving.from_error(top_values_error) if kind == "categorical" else None
+
+    def update(self, series: pd.Series, histogram: Optional[Histogram] = None) -> "ColumnSummary":
+        """Add the values of a batch (``histogram`` is the batch's histogram, if numeric)."""
+        nulls = int(series.isna().sum())
+        self.nulls += nulls
+        if nulls == len(series):
+            return self
+
+        self.dtype = str(series.dtype)
+        self.distinct.update(series)
+        if self.top is not None:
+            self.top.update(series)
+
+        if self.moments:
+            values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+            values = values[~np.isnan(values)]
+            mean = float(values.mean())
+            centered = values - mean
+            power = centered * centered
+            m2 = float(power.sum())
+            power *= centered
+            m3 = float(power.sum())
+            power *= centered
+            m4 = float(power.sum())
+            self._merge_moments(len(values), mean, m2, m3, m4, float(values.min()), float(values.max()))
+            self.quantiles.update(values)
+            self._merge_histogram(histogram)
+        else:
+            self.count += len(series) - nulls
+        return self
+
+    def update_repeated(self, value: float, count: int) -> "ColumnSummary":
+        """
+        Add ``count`` copies of one value, such as the values imputed for the
+        nulls of a numeric column. The null count is left unchanged.
+        """
+        if not self.moments:
+            raise ValueError("update_repeated() needs a numeric summary")
+        if count <= 0:
+            return self
+        value = float(value)
+        self._merge_moments(int(count), value, 0.0, 0.0, 0.0, value, value)
+        self.quantiles.update_repeated(value, count)
+        self.distinct.update([value])
+        return self
+
+    def _merge_moments(
+        self, n_b: int, mean_b: float, m2_b: float, m3_b: float, m4_b: float, min_b: float, max_b: float
+    ) -> None:
+        n_a = self.count
+        if n_b == 0:
+            return
+        if n_a == 0:
+            self.count, self.mean = n_b, mean_b
+            self.m2, self.m3, self.m4 = m2_b, m3_b, m4_b
+            self.min, self.max = min_b, max_b
+            return
+
+        n = n_a + n_b
+        delta = mean_b - self.mean
+        delta_n = delta / n
+        m2 = self.m2 + m2_b + delta * delta_n * n_a * n_b
+        m3 = (
+            self.m3 + m3_b
+            + delta * delta_n ** 2 * n_a * n_b * (n_a - n_b)
+            + 3 * delta_n * (n_a * m2_b - n_b * self.m2)
+        )
+        m4 = (
+            self.m4 + m4_b
+            + delta * delta_n ** 3 * n_a * n_b * (n_a * n_a - n_a * n_b + n_b * n_b)
+            + 6 * delta_n ** 2 * (n_a * n_a * m2_b + n_b * n_b * self.m2)
+            + 4 * delta_n * (n_a * m3_b - n_b * self.m3)
+        )
+        self.count = n
+        self.mean += delta_n * n_b
+        self.m2, self.m3, self.m4 = m2, m3, m4
+        self.min = min(self.min, min_b)
+        self.max = max(self.max, max_b)
+
+    def _merge_histogram(self, histogram: Optional[Histogram]) -> None:
+        if histogram is not None:
+            self.histogram = histogram if self.histogram is None else self.histogram.merge(histogram)
+
+    def merge(self, other: "ColumnSummary") -> "ColumnSummary":
+        """Merge the summary of the same column from another state into this one."""
+        self.nulls += other.nulls
+        if other.kind != self.kind:
+            if other.count:
+                raise ValueError(f"Cannot merge a {other.kind} column summary into a {self.kind} one")
+            return self
+        self.distinct.merge(other.distinct)
+        if self.moments:
+            self._merge_moments(other.count, other.mean, other.m2, other.m3, other.m4, other.min, other.max)
+            self.quantiles.merge(other.quantiles)
+            self._merge_histogram(other.histogram)
+        else:
+            self.count += other.count
+            if self.top is not None:
+                self.top.merge(other.top)
+        return self
+
+    def distinct_count(self) -> int:
+        """Estimated distinct non-null values (never more than the values seen)."""
+        return min(self.distinct.count(), int(self.count))
+
+    def __repr__(self) -> str:
+        return f"ColumnSummary(kind={self.kind!r}, count={self.count}, nulls={self.nulls})"
+
+
+class ProfileState:
+    """
+    Persistent, mergeable profile of a growing table.
+
+    ``update(batch)`` costs O(batch): the rows already profiled are never
+    read again. Columns that first appear in a later batch count as missing
+    in the earlier rows, and columns absent from a batch count as missing
+    in it. Medians, quartiles, distinct counts and top values come from
+    sketches (error bounds as in ``profiling.sketch``); counts, null counts,
+    means, std, skewness, kurtosis, min and max are exact, and so is the
+    duplicate row count when ``track_duplicates`` is on (8 bytes per
+    distinct row).
+
+    Example:
+        >>> state = ProfileState.from_config(config["profiling"])
+        >>> state.update(monday).update(tuesday)
+        >>> print(state.summary())
+        >>> state.save("profile.state")
+        >>> state = ProfileState.load("profile.state").update(wednesday)
+    """
+
+    def __init__(
+        self,
+        bins: int = DEFAULT_BINS,
+        quantile_error: float = DEFAULT_QUANTILE_ERROR,
+        distinct_error: float = DEFAULT_DISTINCT_ERROR,
+        top_values_error: float = DEFAULT_TOP_VALUES_ERROR,
+        track_duplicates: bool = True
+    ):
+        self.bins = bins
+        self.quantile_error = quantile_error
+        self.distinct_error = distinct_error
+        self.top_values_error = top_values_error
+        self.rows = 0
+        self.batches = 0
+        self.columns: Dict[Any, ColumnSummary] = {}
+        self.fingerprints = FingerprintSet() if track_duplicates else None
+        self.duplicate_rows = 0
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any], track_duplicates: bool = True) -> "ProfileState":
+        """
+        Create an empty state from a profiling configuration.
+
+        Args:
+            config: Profiling configuration (``histogram_bins`` and the
+                ``sketch`` error bounds)
+            track_duplicates: Count duplicate rows (keeps a fingerprint set)
+
+        Returns:
+            Empty ProfileState
+        """
+        sketch = config.get("sketch", {}) or {}
+        return cls(
+            bins=config.get("histogram_bins", DEFAULT_BINS),
+            quantile_error=sketch.get("quantile_error", DEFAULT_QUANTILE_ERROR),
+            distinct_error=sketch.get("distinct_error", DEFAULT_DISTINCT_ERROR),
+            top_values_error=sketch.get("top_values_error", DEFAULT_TOP_VALUES_ERROR),
+            track_duplicates=track_duplicates,
+        )
+
+    def _new_column(self, kind: str, dtype: str, moments: bool = False) -> ColumnSummary:
+        summary = ColumnSummary(
+            kind, dtype, moments, self.quantile_error, self.distinct_error, self.top_values_error
+        )
+        # Rows profiled before the column appeared are missing values
+        summary.nulls = self.rows
+        return summary
+
+    def update(self, batch: pd.DataFrame) -> "ProfileState":
+        """
+        Add a batch of rows.
+
+        Args:
+            batch: New rows
+
+        Returns:
+            self for method chaining
+        """
+        if len(batch) == 0:
+            return self
+
+        histograms = compute_histograms(batch, bins=self.bins)
+        for col in batch.columns:
+            series = batch[col]
+            kind = _column_kind(series)
+            summary = self.columns.get(col)
+            # Booleans are not numeric columns but have numeric statistics,
+            # as in compute_numeric_stats
+            moments = pd.api.types.is_bool_dtype(series.dtype)
+            if summary is None:
+                summary = self.columns[col] = self._new_column(kind, str(series.dtype), moments)
+            elif summary.kind != kind and series.notna().any():
+                if summary.count:
+                    raise ValueError(
+                        f"Column '{col}' changed from {summary.kind} to {kind} ({series.dtype}) between batches"
+                    )
+                # Only missing values so far: adopt the new kind
+                nulls = summary.nulls
+                summary = self.columns[col] = self._new_column(kind, str(series.dtype), moments)
+                summary.nulls = nulls
+            summary.update(series, histograms.get(col))
+
+        for col, summary in self.columns.items():
+            if col not in batch.columns:
+                summary.nulls += len(batch)
+
+        if self.fingerprints is not None:
+            new = self.fingerprints.add(row_fingerprints(batch))
+            self.duplicate_rows += int(len(new) - new.sum())
+
+        self.rows += len(batch)
+        self.batches += 1
+        return self
+
+    def merge(self, other: "ProfileState") -> "ProfileState":
+        """
+        Merge another state (e.g. of a different partition) into this one.
+
+        The duplicate count of the merged state is None: fingerprint sets of
+        different states are not combined.
+
+        Returns:
+            self for method chaining
+        """
+        for col, summary in other.columns.items():
+            current = self.columns.get(col)
+            if current is None or (current.kind != summary.kind and not current.count):
+                # New column, or one that held only missing values so far
+                merged = self._new_column(summary.kind, summary.dtype, summary.moments)
+                merged.nulls = current.nulls if current is not None else self.rows
+                self.columns[col] = merged.merge(summary)
+            else:
+                current.merge(summary)
+        for col, summary in self.columns.items():
+            if col not in other.columns:
+                summary.nulls += other.rows
+
+        self.rows += other.rows
+        self.batches += other.batches
+        self.fingerprints = None
+        self.duplicate_rows = None
+        return self
+
+    def null_counts(self) -> pd.Series:
+        """Per-column null counts."""
+        return pd.Series(
+            {col: summary.nulls for col, summary in self.columns.items()},
+            index=pd.Index(list(self.columns)),
+            dtype="int64",
+        )
+
+    def numeric_stats(self) -> pd.DataFrame:
+        """Numeric statistics in the layout of ``compute_numeric_stats``."""
+        numeric = {col: s for col, s in self.columns.items() if s.moments}
+        if not numeric:
+            return pd.DataFrame(columns=NUMERIC_STAT_FIELDS, dtype=float)
+
+        summaries = list(numeric.values())
+        count = np.array([s.count for s in summaries], dtype=np.int64)
+        std, skewness, kurtosis = moment_stats(
+            count,
+            np.array([s.m2 for s in summaries]),
+            np.array([s.m3 for s in summaries]),
+            np.array([s.m4 for s in summaries]),
+            np.array([s.min == s.max for s in summaries]),
+        )
+        quantiles = np.array([s.quantiles.quantiles([0.25, 0.5, 0.75]) for s in summaries])
+
+        stats = {
+            "count": count,
+            "mean": np.where(count > 0, [s.mean for s in summaries], np.nan),
+            "median": quantiles[:, 1],
+            "std": std,
+            "min": [s.min for s in summaries],
+            "max": [s.max for s in summaries],
+            "q25": quantiles[:, 0],
+            "q75": quantiles[:, 2],
+            "skewness": skewness,
+            "kurtosis": kurtosis,
+        }
+        return pd.DataFrame(stats, index=pd.Index(list(numeric)), columns=NUMERIC_STAT_FIELDS)
+
+    def statistics(self) -> Dict[str, Any]:
+        """Statistics in the layout of ``compute_statistics``."""
+        stats: Dict[str, Any] = {"numeric": {}, "categorical": {}, "overall": {}}
+
+        for col, row in self.numeric_stats().to_dict("index").items():
+            if self.columns[col].kind != "numeric":
+                continue
+            stats["numeric"][col] = {
+                field: int(row[field]) if field == "count" else float(row[field])
+                for field in NUMERIC_STAT_FIELDS
+            }
+
+        for col, summary in self.columns.items():
+            if summary.kind != "categorical":
+                continue
+            top = summary.top.top(1)
+            stats["categorical"][col] = {
+                "count": int(summary.count),
+                "unique": summary.distinct_count(),
+                "top": str(top[0][0]) if top else None,
+                "freq": top[0][1] if top else 0,
+            }
+
+        total_missing = int(sum(summary.nulls for summary in self.columns.values()))
+        total_cells = self.rows * len(self.columns)
+        stats["overall"] = {
+            "total_rows": int(self.rows),
+            "total_columns": len(self.columns),
+            "total_missing": total_missing,
+            "missing_percentage": float(total_missing / total_cells * 100) if total_cells else 0.0,
+            "duplicate_rows": self.duplicate_rows if self.fingerprints is not None else None,
+        }
+        return stats
+
+    def histograms(self) -> Dict[Any, Histogram]:
+        """Histograms of the numeric columns."""
+        return {
+            col: summary.histogram for col, summary in self.columns.items()
+            if summary.histogram is not None
+        }
+
+    def summary(self, include_more_stats: bool = True) -> str:
+        """
+        Render the dataset summary of ``generate_summary`` from the state.
+
+        Args:
+            include_more_stats: Include mean, median, std, skewness and kurtosis
+
+        Returns:
+            Formatted string summary
+        """
+        kinds = pd.Series([s.kind for s in self.columns.values()], dtype=object).value_counts()
+        overview_data = [
+            ["Total Rows", self.rows],
+            ["Total Columns", len(self.columns)],
+            ["Numeric Columns", int(kinds.get("numeric", 0))],
+            ["Categorical Columns", int(kinds.get("categorical", 0))],
+            ["Datetime Columns", int(kinds.get("datetime", 0))],
+            ["Other Types", int(kinds.get("other", 0))],
+            ["Batches", self.batches],
+        ]
+
+        data = [
+            [
+                col, summary.dtype, summary.nulls, self.rows - summary.nulls,
+                f"{summary.nulls / self.rows:.1%}" if self.rows > 0 else "0%",
+                summary.distinct_count(),
+            ]
+            for col, summary in self.columns.items()
+        ]
+
+        return format_summary(overview_data, data, self.numeric_stats() if include_more_stats else None)
+
+    def save(self, path: Union[str, Path]) -> None:
+        """
+        Save the state to a file.
+
+        The file is a pickle: only load states from trusted locations.
+        """
+        with open(path, "wb") as f:
+            pickle.dump(self, f, protocol=pickle.HIGHEST_PROTOCOL)
+        logger.info(f"Saved profile state ({self.rows} rows, {self.batches} batches) to {path}")
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "ProfileState":
+        """Load a state saved with ``save()``."""
+        with open(path, "rb") as f:
+            state = pickle.load(f)
+        if not isinstance(state, cls):
+            raise TypeError(f"{path} does not contain a ProfileState")
+        return state
+
+    def __repr__(self) -> str:
+        return f"ProfileState(rows={self.rows}, columns={len(self.columns)}, batches={self.batches})"
@@ -4,19 +4,239 @@ Statistical analysis utilities.
 
 import pandas as pd
 import numpy as np
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
 
+from .sketches import KLLSketch, HyperLogLog, SpaceSaving
+from ..cleaning.duplicates import row_fingerprints, count_duplicates
 from ..utils.logger import get_logger
+from ..utils.parallel import map_column_batches
 
 logger = get_logger(__name__)
 
+NUMERIC_STAT_FIELDS = [
+    "count", "mean", "median", "std", "min", "max",
+    "q25", "q75", "skewness", "kurtosis",
+]
 
-def compute_statistics(df: pd.DataFrame) -> Dict[str, Any]:
+# Upper bound on cells materialized at once by the numeric kernel (~8 MB
+# per float64 temporary), so its memory does not grow with the table
+_BLOCK_CELLS = 1_000_000
+
+
+def compute_numeric_stats(
+    df: pd.DataFrame,
+    workers: Optional[int] = 1,
+    quantile_error: Optional[float] = None
+) -> pd.DataFrame:
+    """
+    Compute all per-column numeric statistics in one vectorized pass.
+    
+    The numeric block is converted to 2-D float arrays (a bounded number of
+    columns at a time). Each block is sorted once along the rows, which
+    yields min, max, median and quartiles; moments come from the same
+    centered array. Results follow pandas' definitions (sample std, bias
+    adjusted skewness and excess kurtosis, linear quantile interpolation).
+    
+    With ``quantile_error`` set, the sort is skipped: median and quartiles
+    come from per-column KLL sketches (min, max and moments stay exact).
+    
+    Args:
+        df: Input DataFrame (non-numeric columns are ignored)
+        workers: Threads used to process column blocks concurrently
+            (-1 for all cores)
+        quantile_error: Normalized rank error for approximate quantiles
+            (None for exact quantiles)
+    
+    Returns:
+        DataFrame indexed by column name with one column per statistic
+        in ``NUMERIC_STAT_FIELDS``
+    
+    Example:
+        >>> numeric_stats = compute_numeric_stats(df)
+        >>> numeric_stats.loc["age", "median"]
+    """
+    columns = [
+        col for col in df.columns
+        if pd.api.types.is_numeric_dtype(df[col]) and not pd.api.types.is_complex_dtype(df[col])
+    ]
+    
+    if not columns:
+        return pd.DataFrame(columns=NUMERIC_STAT_FIELDS, dtype=float)
+    
+    def block_stats(block_cols: list) -> pd.DataFrame:
+        values = df[block_cols].to_numpy(dtype=np.float64, na_value=np.nan)
+        return _numeric_block_stats(values, block_cols, quantile_error)
+    
+    block_size = max(1, _BLOCK_CELLS // max(len(df), 1))
+    blocks = map_column_batches(block_stats, columns, workers=workers, batch_size=block_size)
+    
+    return pd.concat(blocks)
+
+
+def _numeric_block_stats(
+    values: np.ndarray,
+    columns: list,
+    quantile_error: Optional[float] = None
+) -> pd.DataFrame:
+    """Compute statistics for a 2-D (rows x columns) float array."""
+    n_rows = values.shape[0]
+    count = n_rows - np.isnan(values).sum(axis=0)
+    
+    if quantile_error is None:
+        # NaN sorts to the end, so the first `count` rows of each column are valid
+        ordered = np.sort(values, axis=0)
+        quantiles = {
+            q: _sorted_quantile(ordered, count, q) for q in (0.0, 0.25, 0.5, 0.75, 1.0)
+        }
+        del ordered
+    else:
+        sketched = np.array([
+            KLLSketch.from_error(quantile_error).update(values[:, j]).quantiles([0.25, 0.5, 0.75])
+            for j in range(values.shape[1])
+        ]).reshape(values.shape[1], 3)
+        with np.errstate(invalid="ignore"):
+            quantiles = {
+                0.0: np.where(count > 0, np.nanmin(values, axis=0, initial=np.inf), np.nan),
+                0.25: sketched[:, 0],
+                0.5: sketched[:, 1],
+                0.75: sketched[:, 2],
+                1.0: np.where(count > 0, np.nanmax(values, axis=0, initial=-np.inf), np.nan),
+            }
+    
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = np.nansum(values, axis=0) / count
+        centered = values - mean
+        power = centered * centered
+        m2 = np.nansum(power, axis=0)
+        power *= centered
+        m3 = np.nansum(power, axis=0)
+        power *= centered
+        m4 = np.nansum(power, axis=0)
+    
+    std, skewness, kurtosis = moment_stats(count, m2, m3, m4, quantiles[0.0] == quantiles[1.0])
+    
+    stats = {
+        "count": count,
+        "mean": mean,
+        "median": quantiles[0.5],
+        "std": std,
+        "min": quantiles[0.0],
+        "max": quantiles[1.0],
+        "q25": quantiles[0.25],
+        "q75": quantiles[0.75],
+        "skewness": skewness,
+        "kurtosis": kurtosis,
+    }
+    
+    return pd.DataFrame(stats, index=pd.Index(columns), columns=NUMERIC_STAT_FIELDS)
+
+
+def moment_stats(
+    count: np.ndarray,
+    m2: np.ndarray,
+    m3: np.ndarray,
+    m4: np.ndarray,
+    constant: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Sample std, skewness and excess kurtosis from central moment sums.
+    
+    Args:
+        count: Number of values per column
+        m2, m3, m4: Sums of the 2nd, 3rd and 4th powers of deviations
+            from the mean
+        constant: Whether all values of a column are equal (min == max)
+    
+    Returns:
+        Tuple of (std, skewness, kurtosis) arrays, following pandas'
+        definitions (NaN when there are too few values)
+    """
+    count = np.asarray(count, dtype=np.float64)
+    with np.errstate(invalid="ignore", divide="ignore", over="ignore"):
+        std = np.sqrt(m2 / (count - 1))
+        
+        # The moment sums of a constant column are rounding noise of the
+        # mean, at any scale; its skewness and kurtosis are 0, as in pandas
+        constant = np.asarray(constant, dtype=bool) | (m2 == 0)
+        
+        skewness = (count * (count - 1) ** 0.5 / (count - 2)) * (m3 / m2 ** 1.5)
+        skewness = np.where(constant, 0.0, skewness)
+        skewness = np.where(count < 3, np.nan, skewness)
+        
+        numerator = count * (count + 1) * (count - 1) * m4
+        denominator = (count - 2) * (count - 3) * m2 ** 2
+        adjustment = 3 * (count - 1) ** 2 / ((count - 2) * (count - 3))
+        kurtosis = np.where(constant, 0.0, numerator / denominator - adjustment)
+        kurtosis = np.where(count < 4, np.nan, kurtosis)
+    
+    return np.where(count < 2, np.nan, std), skewness, kurtosis
+
+
+def _sorted_quantile(ordered: np.ndarray, count: np.ndarray, q: float) -> np.ndarray:
+    """Linear-interpolated quantile of each column of a NaN-last sorted array."""
+    position = q * (count - 1)
+    lower = np.clip(np.floor(position).astype(np.int64), 0, None)
+    upper = np.clip(np.ceil(position).astype(np.int64), 0, None)
+    
+    rows = ordered.shape[0] - 1
+    low_values = np.take_along_axis(ordered, np.minimum(lower, rows)[None, :], axis=0)[0]
+    high_values = np.take_along_axis(ordered, np.minimum(upper, rows)[None, :], axis=0)[0]
+    
+    with np.errstate(invalid="ignore"):
+        result = low_values + (high_values - low_values) * (position - lower)
+    return np.where(count > 0, result, np.nan)
+
+
+def categorical_columns(df: pd.DataFrame) -> pd.Index:
+    """
+    Text and categorical columns of a DataFrame.
+    
+    Selects object, string (``str``, the pandas 3 default for text) and
+    category columns. ``select_dtypes(include=['object'])`` only keeps
+    selecting ``str`` columns for backward compatibility.
+    
+    Args:
+        df: Input DataFrame
+    
+    Returns:
+        Column labels, in column order
+    """
+    return pd.Index([
+        col for col, dtype in df.dtypes.items()
+        if pd.api.types.is_object_dtype(dtype)
+        or pd.api.types.is_string_dtype(dtype)
+        or isinstance(dtype, pd.CategoricalDtype)
+    ], dtype=object)
+
+
+def compute_statistics(
+    df: pd.DataFrame,
+    numeric_stats: Optional[pd.DataFrame] = None,
+    null_counts: Optional[pd.Series] = None,
+    workers: Optional[int] = 1,
+    sketch: Optional[Dict[str, float]] = None,
+    total_rows: Optional[int] = None,
+    fingerprints: Optional[np.ndarray] = None
+) -> Dict[str, Any]:
     """
     Compute comprehensive statistics for DataFrame.
     
     Args:
         df: Input DataFrame
+        numeric_stats: Precomputed output of ``compute_numeric_stats`` to reuse
+        null_counts: Precomputed ``df.isnull().sum()`` to reuse
+        workers: Threads used to profile column batches concurrently
+            (-1 for all cores)
+        sketch: Sketch error bounds from ``sketch_settings`` for approximate
+            quantiles, distinct counts and top values (None for exact). Top
+            values come from a Space-Saving sketch that reads each column in
+            bounded slices, so its memory does not grow with the column.
+        total_rows: Row count of the full data when ``df`` is a sample. Counts
+            and missing values are then exact (``null_counts`` must come from
+            the full data), categorical ``freq`` is scaled to the full data
+            and ``duplicate_rows`` is None.
+        fingerprints: Precomputed ``row_fingerprints(df)`` to reuse for the
+            duplicate row count
     
     Returns:
         Dictionary containing statistical measures
@@ -30,42 +250,77 @@ def compute_statistics(df: pd.DataFrame) -> Dict[str, Any]:
         "overall": {}
     }
     
+    sampled = total_rows is not None
+    n_rows = total_rows if sampled else len(df)
+    
     # Numeric statistics
     numeric_cols = df.select_dtypes(include=[np.number]).columns
     
-    for col in numeric_cols:
+    if numeric_stats is None:
+        numeric_stats = compute_numeric_stats(
+            df[numeric_cols],
+            workers=workers,
+            quantile_error=sketch["quantile_error"] if sketch else None,
+        )
+    
+    if null_counts is None:
+        null_counts = df.isnull().sum()
+    
+    for col, row in numeric_stats.loc[numeric_cols].to_dict("index").items():
         stats["numeric"][col] = {
-            "count": int(df[col].count()),
-            "mean": float(df[col].mean()),
-            "median": float(df[col].median()),
-            "std": float(df[col].std()),
-            "min": float(df[col].min()),
-            "max": float(df[col].max()),
-            "q25": float(df[col].quantile(0.25)),
-            "q75": float(df[col].quantile(0.75)),
-            "skewness": float(df[col].skew()),
-            "kurtosis": float(df[col].kurtosis()),
+            field: int(row[field]) if field == "count" else float(row[field])
+            for field in NUMERIC_STAT_FIELDS
         }
+        if sampled:
+            stats["numeric"][col]["count"] = int(n_rows - null_counts[col])
     
     # Categorical statistics
-    categorical_cols = df.select_dtypes(include=['object', 'category']).columns
-    
-    for col in categorical_cols:
-        value_counts = df[col].value_counts()
-        stats["categorical"][col] = {
-            "count": int(df[col].count()),
-            "unique": int(df[col].nunique()),
-            "top": str(value_counts.index[0]) if len(value_counts) > 0 else None,
-            "freq": int(value_counts.iloc[0]) if len(value_counts) > 0 else 0,
-        }
+    categorical_cols = categorical_columns(df)
+    
+    def categorical_stats(cols: list) -> Dict[str, Any]:
+        batch = {}
+        for col in cols:
+            count = int(n_rows - null_counts[col])
+            if sketch:
+                top = SpaceSaving.from_error(sketch["top_values_error"]).update(df[col]).top(1)
+                batch[col] = {
+                    "count": count,
+                    "unique": HyperLogLog.from_error(sketch["distinct_error"]).update(df[col]).count(),
+                    "top": str(top[0][0]) if top else None,
+                    "freq": top[0][1] if top else 0,
+                }
+            else:
+                value_counts = df[col].value_counts()
+                # Categoricals also list categories that no longer occur
+                value_counts = value_counts[value_counts > 0]
+                batch[col] = {
+                    "count": count,
+                    "unique": int(len(value_counts)),
+                    "top": str(value_counts.index[0]) if len(value_counts) > 0 else None,
+                    "freq": int(value_counts.iloc[0]) if len(value_counts) > 0 else 0,
+                }
+            if sampled:
+                sample_count = int(df[col].count())
+                if sample_count:
+                    batch[col]["freq"] = int(round(batch[col]["freq"] * count / sample_count))
+        return batch
+    
+    for batch in map_column_batches(categorical_stats, categorical_cols, workers=workers):
+        stats["categorical"].update(batch)
     
     # Overall statistics
+    total_missing = int(null_counts.sum())
+    
+    total_cells = n_rows * len(df.columns)
+    
     stats["overall"] = {
-        "total_rows": int(len(df)),
+        "total_rows": int(n_rows),
         "total_columns": int(len(df.columns)),
-        "total_missing": int(df.isnull().sum().sum()),
-        "missing_percentage": float(df.isnull().sum().sum() / (len(df) * len(df.columns)) * 100),
-        "duplicate_rows": int(df.duplicated().sum()),
+        "total_missing": total_missing,
+        "missing_percentage": float(total_missing / total_cells * 100) if total_cells else 0.0,
+        "duplicate_rows": None if sampled else count_duplicates(
+            row_fingerprints(df) if fingerprints is None else fingerprints
+        ),
     }
     
-    return stats
\ No newline at end of file
+    return stats
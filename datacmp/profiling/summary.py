@@ -3,21 +3,34 @@ Dataset summary generation.
 """
 
 import pandas as pd
-from typing import Dict, Any
-from tabulate import tabulate
+from typing import Dict, Any, Optional
 
+from .sketches import sketch_settings, sketch_nunique
+from .statistics import categorical_columns, compute_numeric_stats
 from ..utils.logger import get_logger
+from ..utils.parallel import map_column_batches
 
 logger = get_logger(__name__)
 
 
-def generate_summary(df: pd.DataFrame, config: Dict[str, Any]) -> str:
+def generate_summary(
+    df: pd.DataFrame,
+    config: Dict[str, Any],
+    numeric_stats: Optional[pd.DataFrame] = None,
+    null_counts: Optional[pd.Series] = None,
+    total_rows: Optional[int] = None
+) -> str:
     """
     Generate comprehensive dataset summary.
     
     Args:
         df: Input DataFrame
-        config: Profiling configuration
+        config: Profiling configuration (``workers`` sets the thread count,
+            ``approximate`` switches medians and unique counts to sketches)
+        numeric_stats: Precomputed output of ``compute_numeric_stats`` to reuse
+        null_counts: Precomputed ``df.isnull().sum()`` to reuse
+        total_rows: Row count of the full data when ``df`` is a sample; null
+            counts must then come from the full data
     
     Returns:
         Formatted string summary
@@ -27,8 +40,13 @@ def generate_summary(df: pd.DataFrame, config: Dict[str, Any]) -> str:
         >>> print(summary)
     """
     num_rows, num_cols = df.shape
+    sampled_rows = num_rows if total_rows is not None else None
+    if total_rows is not None:
+        num_rows = total_rows
     
     include_more_stats = config.get("include_more_stats", True)
+    workers = config.get("workers", 1)
+    sketch = sketch_settings(config)
     
     # Column type counts
     numeric, categorical, datetime, other = _count_column_types(df)
@@ -44,47 +62,79 @@ def generate_summary(df: pd.DataFrame, config: Dict[str, Any]) -> str:
         ["Memory Usage", f"{df.memory_usage(deep=True).sum() / 1024**2:.2f} MB"]
     ]
     
-    overview_table = tabulate(
-        overview_data,
-        headers=["Metric", "Value"],
-        tablefmt="rounded_outline"
-    )
+    if sampled_rows is not None:
+        overview_data.insert(1, ["Sampled Rows", sampled_rows])
+        overview_data[-1][0] = "Sample Memory Usage"
     
     # Column details
-    headers = ["Column", "Type", "Null", "Not Null", "Null %", "Unique"]
+    data = []
+    if null_counts is None:
+        null_counts = df.isnull().sum()
+    total_counts = num_rows - null_counts
     
-    if include_more_stats:
-        headers.extend(["Mean", "Median", "Std", "Skew", "Kurt"])
+    if include_more_stats and numeric_stats is None:
+        numeric_stats = compute_numeric_stats(
+            df,
+            workers=workers,
+            quantile_error=sketch["quantile_error"] if sketch else None,
+        )
     
-    data = []
-    null_counts = df.isnull().sum()
-    total_counts = df.count()
+    if sketch:
+        def count_unique(cols: list) -> pd.Series:
+            return sketch_nunique(df[cols], sketch["distinct_error"])
+    else:
+        def count_unique(cols: list) -> pd.Series:
+            return df[cols].nunique()
+    
+    unique_counts = pd.concat(
+        map_column_batches(count_unique, df.columns, workers=workers)
+    ) if num_cols > 0 else pd.Series(dtype="int64")
     
     for col in df.columns:
         dtype = df[col].dtype
         null = null_counts[col]
         not_null = total_counts[col]
         null_percent = f"{null / num_rows:.1%}" if num_rows > 0 else "0%"
-        unique = df[col].nunique()
-        
-        row = [col, dtype, null, not_null, null_percent, unique]
-        
-        if include_more_stats:
-            if pd.api.types.is_numeric_dtype(dtype):
-                row.extend([
-                    f"{df[col].mean():.2f}",
-                    f"{df[col].median():.2f}",
-                    f"{df[col].std():.2f}",
-                    f"{df[col].skew():.2f}",
-                    f"{df[col].kurtosis():.2f}"
-                ])
-            else:
-                row.extend(["-", "-", "-", "-", "-"])
+        unique = unique_counts[col]
         
-        data.append(row)
+        data.append([col, dtype, null, not_null, null_percent, unique])
+    
+    return format_summary(overview_data, data, numeric_stats if include_more_stats else None)
+
+
+def format_summary(
+    overview_data: list,
+    column_rows: list,
+    numeric_stats: Optional[pd.DataFrame] = None
+) -> str:
+    """
+    Render the overview and column detail tables of a summary.
+    
+    Args:
+        overview_data: [metric, value] rows
+        column_rows: One row per column: name, type, null, not null, null %, unique
+        numeric_stats: Output of ``compute_numeric_stats``; adds mean, median,
+            std, skewness and kurtosis columns when given
+    
+    Returns:
+        Formatted string summary
+    """
+    from tabulate import tabulate
+    
+    overview_table = tabulate(
+        overview_data,
+        headers=["Metric", "Value"],
+        tablefmt="rounded_outline"
+    )
+    
+    headers = ["Column", "Type", "Null", "Not Null", "Null %", "Unique"]
+    
+    if numeric_stats is not None:
+        headers.extend(["Mean", "Median", "Std", "Skew", "Kurt"])
+        column_rows = [row + _moment_cells(numeric_stats, row[0]) for row in column_rows]
     
     details_table = tabulate(
-        data,
+        column_rows,
         headers=headers,
         tablefmt="rounded_outline"
     )
@@ -92,11 +142,25 @@ def generate_summary(df: pd.DataFrame, config: Dict[str, Any]) -> str:
     return f"{overview_table}\n\n{details_table}"
 
 
+def _moment_cells(numeric_stats: pd.DataFrame, col) -> list:
+    """Formatted mean, median, std, skew and kurtosis of a column ('-' if not numeric)."""
+    if col not in numeric_stats.index:
+        return ["-", "-", "-", "-", "-"]
+    col_stats = numeric_stats.loc[col]
+    return [
+        f"{col_stats['mean']:.2f}",
+        f"{col_stats['median']:.2f}",
+        f"{col_stats['std']:.2f}",
+        f"{col_stats['skewness']:.2f}",
+        f"{col_stats['kurtosis']:.2f}"
+    ]
+
+
 def _count_column_types(df: pd.DataFrame) -> tuple:
     """Count columns by type."""
     numeric = df.select_dtypes(include=['number']).shape[1]
-    categorical = df.select_dtypes(include=['object', 'category']).shape[1]
+    categorical = len(categorical_columns(df))
     datetime = df.select_dtypes(include=['datetime']).shape[1]
     other = df.shape[1] - (numeric + categorical + datetime)
     
-    return numeric, categorical, datetime, other
\ No newline at end of file
+    return numeric, categorical, datetime, other
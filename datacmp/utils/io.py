@@ -0,0 +1,448 @@
+"""
+Tabular file input and output.
+
+CSV goes through pandas, with either the C parser or pyarrow's
+multithreaded one; Parquet, Feather and Arrow IPC files go through pyarrow,
+which reads only the requested columns and memory-maps the file instead of
+copying it into a read buffer.
+
+pyarrow is an optional dependency: ``pip install datacmp[parquet]``.
+"""
+
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+# File extension → table format
+TABLE_FORMATS = {
+    ".csv": "csv",
+    ".parquet": "parquet",
+    ".pq": "parquet",
+    ".feather": "feather",
+    ".arrow": "arrow",
+    ".ipc": "arrow",
+}
+
+# CSV parsers: pandas' C parser or pyarrow's multithreaded reader
+READ_ENGINES = ("c", "pyarrow")
+
+DEFAULT_PARQUET_COMPRESSION = "zstd"
+
+# Parquet row groups are sized to hold about this much data in memory
+DEFAULT_ROW_GROUP_BYTES = 128 * 1024**2
+
+# Rows used to estimate the in-memory size of a row
+_ROW_SIZE_SAMPLE = 10_000
+
+
+def require_pyarrow(feature: str):
+    """Import pyarrow, raising a helpful error if it is not installed."""
+    try:
+        import pyarrow as pa
+    except ImportError as e:
+        raise ImportError(
+            f"{feature} requires pyarrow. Install it with: pip install datacmp[parquet]"
+        ) from e
+    return pa
+
+
+def detect_format(path: Union[str, Path]) -> Optional[str]:
+    """
+    Table format of a file from its extension.
+
+    Compressed CSV files (``data.csv.gz``) are detected as CSV.
+
+    Args:
+        path: File path
+
+    Returns:
+        'csv', 'parquet', 'feather' or 'arrow', or None for other extensions
+    """
+    suffixes = [suffix.lower() for suffix in Path(path).suffixes]
+    if len(suffixes) >= 2 and suffixes[-2] == ".csv" and suffixes[-1] in (".gz", ".bz2", ".zip", ".xz", ".zst"):
+        return "csv"
+    return TABLE_FORMATS.get(suffixes[-1]) if suffixes else None
+
+
+def read_settings(config: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Read the ``io.read`` setting.
+
+    Args:
+        config: Full DataCmp configuration
+
+    Returns:
+        Dictionary with ``engine``, ``usecols`` (None for all columns),
+        ``dtype`` (column → dtype hints) and ``infer_schema_rows``
+    """
+    settings = (config.get("io") or {}).get("read") or {}
+    engine = settings.get("engine") or "c"
+    if engine not in READ_ENGINES:
+        raise ValueError(f"io.read.engine must be one of {READ_ENGINES}, got {engine!r}")
+    usecols = settings.get("usecols")
+    return {
+        "engine": engine,
+        "usecols": list(usecols) if usecols else None,
+        "dtype": dict(settings.get("dtype") or {}),
+        "infer_schema_rows": settings.get("infer_schema_rows"),
+    }
+
+
+def infer_csv_schema(
+    path: Union[str, Path],
+    rows: int,
+    columns: Optional[Sequence[str]] = None,
+    dtype: Optional[Dict[str, Any]] = None,
+    widen: bool = False
+) -> Dict[str, Any]:
+    """
+    Infer column dtypes of a CSV file from its first rows.
+
+    Columns whose sample is of mixed type (``object``) are left out so the
+    full read still infers them.
+
+    Args:
+        path: Path to CSV file
+        rows: Number of rows to sample
+        columns: Columns to read (default: all)
+        dtype: Dtype hints, which take precedence over the sample
+        widen: Widen inferred integer and boolean columns to dtypes that
+            hold missing values (float64, boolean), for chunked reads that
+            cannot fall back to full inference when a later chunk has one
+
+    Returns:
+        Dictionary mapping columns to dtypes
+
+    Example:
+        >>> schema = infer_csv_schema("big.csv", rows=10_000)
+    """
+    sample = pd.read_csv(path, nrows=rows, usecols=columns, dtype=dtype or None)
+    schema = {}
+    for col, col_dtype in sample.dtypes.items():
+        if col_dtype == object:
+            continue
+        if widen and pd.api.types.is_bool_dtype(col_dtype):
+            col_dtype = "boolean"
+        elif widen and pd.api.types.is_integer_dtype(col_dtype):
+            col_dtype = "float64"
+        schema[col] = str(col_dtype)
+    schema.update(dtype or {})
+    return schema
+
+
+def _read_csv(
+    path: Union[str, Path],
+    columns: Optional[list],
+    engine: str,
+    dtype: Optional[Dict[str, Any]],
+    infer_schema_rows: Optional[int]
+) -> pd.DataFrame:
+    """Load a CSV file, optionally with a schema locked from a sample."""
+    if engine not in READ_ENGINES:
+        raise ValueError(f"engine must be one of {READ_ENGINES}, got {engine!r}")
+    if engine == "pyarrow":
+        require_pyarrow("engine='pyarrow'")
+
+    read = _read_csv_pyarrow if engine == "pyarrow" else _read_csv_c
+
+    if infer_schema_rows:
+        schema = infer_csv_schema(path, infer_schema_rows, columns, dtype)
+        try:
+            return read(path, columns, schema)
+        except ValueError as e:
+            # e.g. an integer column with missing values after the sample
+            logger.warning(
+                f"Schema inferred from the first {infer_schema_rows} rows does not fit "
+                f"{path} ({e}); reading with full type inference"
+            )
+
+    return read(path, columns, dtype)
+
+
+def _read_csv_c(
+    path: Union[str, Path],
+    columns: Optional[list],
+    dtype: Optional[Dict[str, Any]]
+) -> pd.DataFrame:
+    return pd.read_csv(path, usecols=columns, dtype=dtype or None)
+
+
+def _read_csv_pyarrow(
+    path: Union[str, Path],
+    columns: Optional[list],
+    dtype: Optional[Dict[str, Any]]
+) -> pd.DataFrame:
+    """Parse a CSV file with pyarrow's multithreaded reader."""
+    pa = require_pyarrow("engine='pyarrow'")
+    import pyarrow.csv as pa_csv
+
+    convert_options, casts = _arrow_convert_options(pa, pa_csv, columns, dtype)
+    table = pa_csv.read_csv(path, convert_options=convert_options)
+    df = table.to_pandas()
+    return df.astype(casts) if casts else df
+
+
+def _arrow_convert_options(pa, pa_csv, columns: Optional[list], dtype: Optional[Dict[str, Any]]):
+    """pyarrow CSV convert options for dtype hints, and the casts to apply after conversion."""
+    # Types pyarrow parses directly; the rest (category, nullable
+    # extension types) are cast after conversion
+    column_types, casts = {}, {}
+    for col, col_dtype in (dtype or {}).items():
+        arrow_type = _arrow_type(pa, col_dtype)
+        if arrow_type is None:
+            casts[col] = col_dtype
+            if col_dtype == "category":
+                # Categories keep their text (e.g. leading zeros)
+                column_types[col] = pa.string()
+        else:
+            column_types[col] = arrow_type
+
+    # Empty fields are missing in text columns too, as with the C parser
+    convert_options = pa_csv.ConvertOptions(column_types=column_types, strings_can_be_null=True)
+    if columns is not None:
+        convert_options.include_columns = columns
+    return convert_options, casts
+
+
+def _arrow_type(pa, dtype: Any):
+    """Arrow type parsing a pandas dtype hint (None if it has no direct equivalent)."""
+    if dtype in ("str", "string", "object", str, object):
+        return pa.string()
+    try:
+        return pa.from_numpy_dtype(np.dtype(dtype))
+    except (TypeError, pa.ArrowNotImplementedError):
+        return None
+
+
+def _resolve_format(path: Union[str, Path], format: Optional[str]) -> str:
+    if format is None:
+        # Files without a known extension are read as CSV, as before
+        return detect_format(path) or "csv"
+    format = format.lower()
+    if format not in set(TABLE_FORMATS.values()):
+        raise ValueError(f"Unsupported table format: {format}")
+    return format
+
+
+def read_table(
+    path: Union[str, Path],
+    columns: Optional[Sequence[str]] = None,
+    format: Optional[str] = None,
+    engine: str = "c",
+    dtype: Optional[Dict[str, Any]] = None,
+    infer_schema_rows: Optional[int] = None
+) -> pd.DataFrame:
+    """
+    Load a CSV, Parquet, Feather or Arrow IPC file.
+
+    Only ``columns`` are read (for Parquet, the other column chunks are
+    never touched) and Arrow-based files are memory-mapped.
+
+    CSV files are parsed by ``engine``. With ``infer_schema_rows``, column
+    dtypes are inferred from the first rows and locked for the full read,
+    which then skips type inference; if the rest of the file does not fit
+    the schema, the file is re-read with full inference.
+
+    Args:
+        path: Input file path
+        columns: Columns to load, in this order (default: all)
+        format: 'csv', 'parquet', 'feather' or 'arrow'. Auto-detected
+            from the extension if None
+        engine: CSV parser: 'c' or 'pyarrow' (multithreaded)
+        dtype: CSV column → dtype hints
+        infer_schema_rows: Rows of the CSV file to infer the schema from
+
+    Returns:
+        pandas DataFrame
+
+    Example:
+        >>> df = read_table("events.parquet", columns=["user_id", "amount"])
+        >>> df = read_table("big.csv", engine="pyarrow", infer_schema_rows=10_000)
+    """
+    format = _resolve_format(path, format)
+    columns = list(columns) if columns is not None else None
+
+    if format == "csv":
+        df = _read_csv(path, columns, engine, dtype, infer_schema_rows)
+        # usecols keeps the file order; match the Arrow readers
+        return df[columns] if columns is not None else df
+
+    require_pyarrow(f"Reading {format} files")
+    if format == "parquet":
+        import pyarrow.parquet as pq
+        table = pq.read_table(path, columns=columns, memory_map=True)
+    else:
+        # Feather v2 is the Arrow IPC file format
+        import pyarrow.feather as feather
+        table = feather.read_table(path, columns=columns, memory_map=True)
+
+    return table.to_pandas()
+
+
+def iter_table_chunks(
+    path: Union[str, Path],
+    chunksize: int,
+    columns: Optional[Sequence[str]] = None,
+    format: Optional[str] = None,
+    engine: str = "c",
+    dtype: Optional[Dict[str, Any]] = None
+) -> Iterator[pd.DataFrame]:
+    """
+    Iterate over a CSV, Parquet, Feather or Arrow IPC file in chunks.
+
+    Parquet files are decoded batch by batch; Arrow files are memory-mapped
+    and sliced, so only the current chunk is converted to pandas. CSV files
+    are parsed by ``engine``; pyarrow's streaming reader parses blocks on
+    several threads and is re-batched to ``chunksize`` rows.
+
+    Each CSV chunk infers the types of the columns ``dtype`` does not cover
+    on its own, so a column can be read as int64 in one chunk and float64
+    in the next. Pass a complete schema (``infer_csv_schema(...,
+    widen=True)``) to read every chunk with the same dtypes.
+
+    Args:
+        path: Input file path
+        chunksize: Number of rows per chunk
+        columns: Columns to load (default: all)
+        format: Table format. Auto-detected from the extension if None
+        engine: CSV parser: 'c' or 'pyarrow'
+        dtype: CSV column → dtype, applied to every chunk
+
+    Yields:
+        DataFrame chunks
+
+    Raises:
+        ValueError: If a CSV chunk does not fit ``dtype``
+    """
+    format = _resolve_format(path, format)
+    columns = list(columns) if columns is not None else None
+
+    if format == "csv":
+        if engine not in READ_ENGINES:
+            raise ValueError(f"engine must be one of {READ_ENGINES}, got {engine!r}")
+        read = _iter_csv_pyarrow if engine == "pyarrow" else _iter_csv_c
+        try:
+            for chunk in read(path, chunksize, columns, dtype):
+                yield chunk[columns] if columns is not None else chunk
+        except ValueError as e:
+            if not dtype:
+                raise
+            # Unlike a full read, a chunked read cannot start over with
+            # full type inference
+            raise ValueError(
+                f"A chunk of {path} does not fit the column types {dtype} ({e}); "
+                "set io.read.dtype for the affected columns"
+            ) from e
+        return
+
+    pa = require_pyarrow(f"Reading {format} files")
+    if format == "parquet":
+        import pyarrow.parquet as pq
+        with pq.ParquetFile(path, memory_map=True) as parquet_file:
+            for batch in parquet_file.iter_batches(batch_size=chunksize, columns=columns):
+                yield pa.Table.from_batches([batch]).to_pandas()
+        return
+
+    import pyarrow.feather as feather
+    table = feather.read_table(path, columns=columns, memory_map=True)
+    for offset in range(0, table.num_rows, chunksize):
+        yield table.slice(offset, chunksize).to_pandas()
+
+
+def write_table(
+    df: pd.DataFrame,
+    path: Union[str, Path],
+    format: Optional[str] = None,
+    compression: Optional[str] = DEFAULT_PARQUET_COMPRESSION,
+    row_group_size: Optional[int] = None
+) -> None:
+    """
+    Write a DataFrame as CSV, Parquet, Feather or Arrow IPC.
+
+    Parquet output is compressed (zstd by default) and split into row
+    groups of about ``DEFAULT_ROW_GROUP_BYTES`` unless ``row_group_size``
+    is given. Feather files use pyarrow's default LZ4 compression; Arrow IPC
+    files are written uncompressed so they can be memory-mapped without
+    decoding.
+
+    Args:
+        df: DataFrame to write (the index is not written)
+        path: Output file path
+        format: 'csv', 'parquet', 'feather' or 'arrow'. Auto-detected
+            from the extension if None
+        compression: Parquet compression codec ('zstd', 'snappy', 'gzip',
+            'lz4', 'brotli' or None)
+        row_group_size: Rows per Parquet row group
+
+    Example:
+        >>> write_table(df, "cleaned.parquet", row_group_size=500_000)
+    """
+    format = _resolve_format(path, format)
+
+    if format == "csv":
+        df.to_csv(path, index=False)
+        return
+
+    pa = require_pyarrow(f"Writing {format} files")
+    table = pa.Table.from_pandas(df, preserve_index=False)
+
+    if format == "parquet":
+        import pyarrow.parquet as pq
+        if row_group_size is None:
+            row_group_size = _row_group_rows(df)
+        pq.write_table(table, path, compression=compression, row_group_size=row_group_size)
+    else:
+        import pyarrow.feather as feather
+        feather.write_feather(table, path, compression=None if format == "arrow" else "lz4")
+
+
+def _row_group_rows(df: pd.DataFrame) -> int:
+    """Rows per row group so that one group takes about DEFAULT_ROW_GROUP_BYTES."""
+    sample = df.head(_ROW_SIZE_SAMPLE)
+    if len(sample) == 0:
+        return 1
+    row_bytes = max(1.0, sample.memory_usage(deep=True, index=False).sum() / len(sample))
+    return max(1, int(DEFAULT_ROW_GROUP_BYTES // row_bytes))
+
+
+def _iter_csv_c(
+    path: Union[str, Path],
+    chunksize: int,
+    columns: Optional[list],
+    dtype: Optional[Dict[str, Any]]
+) -> Iterator[pd.DataFrame]:
+    with pd.read_csv(path, chunksize=chunksize, usecols=columns, dtype=dtype or None) as reader:
+        yield from reader
+
+
+def _iter_csv_pyarrow(
+    path: Union[str, Path],
+    chunksize: int,
+    columns: Optional[list],
+    dtype: Optional[Dict[str, Any]]
+) -> Iterator[pd.DataFrame]:
+    """Stream a CSV file through pyarrow's multithreaded reader in ``chunksize`` rows."""
+    pa = require_pyarrow("engine='pyarrow'")
+    import pyarrow.csv as pa_csv
+
+    convert_options, casts = _arrow_convert_options(pa, pa_csv, columns, dtype)
+    batches, rows = [], 0
+    with pa_csv.open_csv(path, convert_options=convert_options) as reader:
+        for batch in reader:
+            batches.append(batch)
+            rows += batch.num_rows
+            while rows >= chunksize:
+                table = pa.Table.from_batches(batches)
+                chunk = table.slice(0, chunksize).to_pandas()
+                yield chunk.astype(casts) if casts else chunk
+                rest = table.slice(chunksize)
+                batches, rows = rest.to_batches(), rest.num_rows
+    if rows:
+        chunk = pa.Table.from_batches(batches).to_pandas()
+        yield chunk.astype(casts) if casts else chunk
@@ -0,0 +1,72 @@
+"""
+Thread-pool helpers for column-parallel work.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional, Sequence, TypeVar
+
+T = TypeVar("T")
+
+
+def resolve_workers(workers: Optional[int]) -> int:
+    """
+    Turn a ``workers``/``n_jobs`` setting into a thread count.
+
+    Args:
+        workers: Number of threads; None or 1 for serial, -1 for all cores
+
+    Returns:
+        Number of threads to use (at least 1)
+    """
+    if workers is None:
+        return 1
+    if workers < 0:
+        return max(1, (os.cpu_count() or 1) + 1 + workers)
+    return max(1, workers)
+
+
+def map_column_batches(
+    func: Callable[[List], T],
+    columns: Sequence,
+    workers: Optional[int] = 1,
+    batch_size: Optional[int] = None
+) -> List[T]:
+    """
+    Apply ``func`` to batches of columns, optionally in a thread pool.
+
+    Columns are split into contiguous batches and results are returned in
+    batch order, so merging them gives the same column order as a serial
+    run. Most NumPy/pandas reductions release the GIL, so threads scale
+    well without copying data into worker processes.
+
+    Args:
+        func: Function taking a list of column names
+        columns: Column names to process
+        workers: Number of threads (None or 1 for serial, -1 for all cores)
+        batch_size: Columns per batch (default: an even split, 4 batches per worker)
+
+    Returns:
+        List of per-batch results, in column order
+
+    Example:
+        >>> parts = map_column_batches(lambda cols: df[cols].nunique(), df.columns, workers=8)
+        >>> unique_counts = pd.concat(parts)
+    """
+    columns = list(columns)
+    if not columns:
+        return []
+
+    workers = resolve_workers(workers)
+
+    if batch_size is None:
+        n_batches = min(len(columns), workers * 4) if workers > 1 else 1
+        batch_size = -(-len(columns) // n_batches)
+
+    batches = [columns[start:start + batch_size] for start in range(0, len(columns), batch_size)]
+
+    if workers <= 1 or len(batches) == 1:
+        return [func(batch) for batch in batches]
+
+    with ThreadPoolExecutor(max_workers=min(workers, len(batches))) as pool:
+        return list(pool.map(func, batches))
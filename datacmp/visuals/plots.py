@@ -1,28 +1,53 @@
 """
 Visualization generation utilities.
+
+Plots are drawn on explicit ``Figure`` objects with Agg canvases, never on
+pyplot's global current figure, so several plots (or several ``visualize()``
+calls) can render concurrently from different threads. pyplot is only
+imported to display plots interactively.
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Callable, Tuple
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from matplotlib.ticker import StrMethodFormatter
 import seaborn as sns
 
+from ..profiling.correlations import compute_correlations, cluster_order
+from ..profiling.histograms import Histogram, compute_histograms
 from ..utils.logger import get_logger
+from ..utils.parallel import resolve_workers
 
 logger = get_logger(__name__)
 
-# Set style
+# Set style once at import; rendering threads only read these settings
 sns.set_style("whitegrid")
-plt.rcParams['figure.figsize'] = (10, 6)
+
+# Row buckets in the missing-values heatmap; enough for the image height,
+# small enough that rendering time does not depend on the row count
+MISSING_HEATMAP_BINS = 500
+
+# Wider correlation matrices are truncated to their most correlated columns
+MAX_HEATMAP_COLUMNS = 40
+
+# Cells are annotated with their value only up to this many columns
+MAX_ANNOTATED_COLUMNS = 20
 
 
 def create_visualizations(
     df: pd.DataFrame,
     output_dir: Optional[Path] = None,
-    show_plots: bool = False
+    show_plots: bool = False,
+    null_counts: Optional[pd.Series] = None,
+    corr_matrix: Optional[pd.DataFrame] = None,
+    histograms: Optional[Dict[str, Histogram]] = None,
+    workers: Optional[int] = 1,
+    max_heatmap_columns: int = MAX_HEATMAP_COLUMNS
 ) -> Dict[str, Any]:
     """
     Create comprehensive visualizations for the dataset.
@@ -31,137 +56,253 @@ def create_visualizations(
         df: Input DataFrame
         output_dir: Directory to save plots
         show_plots: Whether to display plots
+        null_counts: Precomputed ``df.isnull().sum()`` to reuse
+        corr_matrix: Precomputed correlation matrix to reuse
+        histograms: Precomputed ``compute_histograms`` output to reuse
+        workers: Threads used to render plots concurrently (-1 for all
+            cores). Plots shown interactively are always rendered serially.
+        max_heatmap_columns: Columns shown in the correlation heatmap; wider
+            matrices keep the columns with the strongest correlations
     
     Returns:
         Dictionary of plot information
     
     Example:
-        >>> plots = create_visualizations(df, output_dir="./plots")
+        >>> plots = create_visualizations(df, output_dir="./plots", workers=3)
     """
-    plots = {}
-    
     if output_dir:
         output_dir = Path(output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
     
+    if null_counts is None:
+        null_counts = df.isnull().sum()
+    
+    tasks: Dict[str, Callable[[], Any]] = {}
+    
     # Missing values heatmap
-    if df.isnull().sum().sum() > 0:
-        plots['missing_heatmap'] = _plot_missing_heatmap(
-            df, output_dir, show_plots
+    if null_counts.sum() > 0:
+        tasks['missing_heatmap'] = lambda: _plot_missing_heatmap(
+            df, output_dir, show_plots, null_counts=null_counts
         )
     
     # Correlation heatmap
     numeric_df = df.select_dtypes(include=[np.number])
     if numeric_df.shape[1] >= 2:
-        plots['correlation_heatmap'] = _plot_correlation_heatmap(
-            numeric_df, output_dir, show_plots
-        )
+        if corr_matrix is None:
+            corr_matrix = compute_correlations(numeric_df)
+        if corr_matrix is not None:
+            tasks['correlation_heatmap'] = lambda: _plot_correlation_heatmap(
+                corr_matrix, output_dir, show_plots, max_columns=max_heatmap_columns
+            )
     
     # Distribution plots for numeric columns
     if numeric_df.shape[1] > 0:
-        plots['distributions'] = _plot_distributions(
-            numeric_df, output_dir, show_plots
-        )
+        if histograms is None:
+            histograms = compute_histograms(numeric_df, workers=workers)
+        if histograms:
+            tasks['distributions'] = lambda: _plot_distributions(
+                histograms, output_dir, show_plots
+            )
+    
+    workers = min(resolve_workers(workers), len(tasks))
+    
+    # pyplot's interactive display is not thread-safe
+    if show_plots or workers <= 1:
+        plots = {name: task() for name, task in tasks.items()}
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {name: pool.submit(task) for name, task in tasks.items()}
+            plots = {name: future.result() for name, future in futures.items()}
     
     logger.info(f"Created {len(plots)} visualizations")
     return plots
 
 
+def _new_figure(figsize: Tuple[float, float], show: bool) -> Figure:
+    """Create a figure; only interactive display goes through pyplot."""
+    if show:
+        import matplotlib.pyplot as plt
+        return plt.figure(figsize=figsize)
+    
+    fig = Figure(figsize=figsize)
+    FigureCanvasAgg(fig)
+    return fig
+
+
+def _finish_figure(fig: Figure, output_dir: Optional[Path], filename: str, show: bool) -> Optional[Path]:
+    """Save a figure to ``output_dir`` (if given) and display or release it."""
+    path = None
+    if output_dir:
+        path = output_dir / filename
+        fig.savefig(path, dpi=300, bbox_inches='tight')
+    
+    if show:
+        import matplotlib.pyplot as plt
+        plt.show()
+        plt.close(fig)
+    
+    return path
+
+
+def _missing_fraction_bins(
+    df: pd.DataFrame,
+    n_bins: int = MISSING_HEATMAP_BINS,
+    null_counts: Optional[pd.Series] = None
+) -> np.ndarray:
+    """
+    Fraction of missing values per (row bucket, column).
+    
+    Rows are split into ``n_bins`` contiguous buckets of near-equal size (one
+    row per bucket for small frames). The null mask is reduced one column at
+    a time, so memory stays at one boolean column.
+    
+    Returns:
+        Array of shape (buckets, columns) with values in [0, 1]
+    """
+    n_rows = len(df)
+    n_bins = max(1, min(n_bins, n_rows))
+    starts = np.linspace(0, n_rows, n_bins + 1).astype(np.int64)
+    sizes = np.diff(starts)
+    
+    fractions = np.zeros((n_bins, df.shape[1]))
+    for j in range(df.shape[1]):
+        # Columns without missing values stay zero
+        if null_counts is not None and null_counts.iloc[j] == 0:
+            continue
+        mask = df.iloc[:, j].isna().to_numpy()
+        fractions[:, j] = np.add.reduceat(mask, starts[:-1]) / sizes
+    
+    return fractions
+
+
 def _plot_missing_heatmap(
     df: pd.DataFrame,
     output_dir: Optional[Path],
-    show: bool
+    show: bool,
+    null_counts: Optional[pd.Series] = None
 ) -> str:
-    """Create missing values heatmap."""
-    plt.figure(figsize=(12, 8))
+    """Create missing values heatmap (fraction missing per row bucket)."""
+    fig = _new_figure((12, 8), show)
+    ax = fig.subplots()
     
-    missing_matrix = df.isnull()
+    fractions = _missing_fraction_bins(df, null_counts=null_counts)
     
-    sns.heatmap(
-        missing_matrix,
-        cbar=True,
+    # One image instead of one patch per cell: render time is bounded by the
+    # number of buckets, not rows
+    image = ax.imshow(
+        fractions,
+        aspect='auto',
+        interpolation='nearest',
         cmap='viridis',
-        yticklabels=False
+        vmin=0,
+        vmax=1,
+        extent=(-0.5, df.shape[1] - 0.5, len(df), 0)
     )
+    fig.colorbar(image, ax=ax, label='Fraction missing')
     
-    plt.title('Missing Values Heatmap', fontsize=16, fontweight='bold')
-    plt.xlabel('Columns')
-    plt.ylabel('Rows')
-    plt.tight_layout()
+    # Label at most ~60 columns so wide frames stay readable
+    step = max(1, -(-df.shape[1] // 60))
+    ax.set_xticks(range(0, df.shape[1], step))
+    ax.set_xticklabels([str(col) for col in df.columns[::step]], rotation=90)
+    ax.yaxis.set_major_formatter(StrMethodFormatter("{x:,.0f}"))
+    ax.grid(False)
     
-    if output_dir:
-        path = output_dir / "missing_heatmap.png"
-        plt.savefig(path, dpi=300, bbox_inches='tight')
-        logger.info(f"Saved missing heatmap to {path}")
+    ax.set_title('Missing Values Heatmap', fontsize=16, fontweight='bold')
+    ax.set_xlabel('Columns')
+    ax.set_ylabel('Rows')
+    fig.tight_layout()
     
-    if show:
-        plt.show()
-    else:
-        plt.close()
+    path = _finish_figure(fig, output_dir, "missing_heatmap.png", show)
+    if path:
+        logger.info(f"Saved missing heatmap to {path}")
     
     return "missing_heatmap.png"
 
 
+def _heatmap_matrix(corr_matrix: pd.DataFrame, max_columns: int) -> pd.DataFrame:
+    """
+    Columns to draw in the correlation heatmap.
+    
+    Matrices wider than ``max_columns`` keep the columns with the strongest
+    absolute correlation to any other column. Matrices too wide to annotate
+    are drawn in clustered order so correlated groups form visible blocks.
+    """
+    if corr_matrix.shape[1] > max_columns:
+        strength = np.abs(corr_matrix.to_numpy(dtype=np.float64))
+        np.fill_diagonal(strength, np.nan)
+        with np.errstate(invalid="ignore"):
+            strongest = np.nan_to_num(np.nanmax(strength, axis=0), nan=-1.0)
+        keep = np.sort(np.argsort(-strongest, kind="stable")[:max_columns])
+        corr_matrix = corr_matrix.iloc[keep, keep]
+    
+    if corr_matrix.shape[1] <= MAX_ANNOTATED_COLUMNS:
+        return corr_matrix
+    order = cluster_order(corr_matrix)
+    return corr_matrix.loc[order, order]
+
+
 def _plot_correlation_heatmap(
-    df: pd.DataFrame,
+    corr_matrix: pd.DataFrame,
     output_dir: Optional[Path],
-    show: bool
+    show: bool,
+    max_columns: int = MAX_HEATMAP_COLUMNS
 ) -> str:
-    """Create correlation heatmap."""
-    plt.figure(figsize=(12, 10))
+    """Create correlation heatmap from a precomputed correlation matrix."""
+    n_total = corr_matrix.shape[1]
+    corr_matrix = _heatmap_matrix(corr_matrix, max_columns)
+    annotate = corr_matrix.shape[1] <= MAX_ANNOTATED_COLUMNS
     
-    corr_matrix = df.corr()
+    fig = _new_figure((12, 10), show)
+    ax = fig.subplots()
     
     sns.heatmap(
         corr_matrix,
-        annot=True,
+        ax=ax,
+        annot=annotate,
         fmt='.2f',
         cmap='coolwarm',
         center=0,
         square=True,
-        linewidths=0.5,
+        linewidths=0.5 if annotate else 0,
+        xticklabels=True,
+        yticklabels=True,
         cbar_kws={"shrink": 0.8}
     )
     
-    plt.title('Correlation Heatmap', fontsize=16, fontweight='bold')
-    plt.tight_layout()
+    title = 'Correlation Heatmap'
+    if corr_matrix.shape[1] < n_total:
+        title += f' ({corr_matrix.shape[1]} of {n_total} columns, most correlated)'
+    ax.set_title(title, fontsize=16, fontweight='bold')
+    fig.tight_layout()
     
-    if output_dir:
-        path = output_dir / "correlation_heatmap.png"
-        plt.savefig(path, dpi=300, bbox_inches='tight')
+    path = _finish_figure(fig, output_dir, "correlation_heatmap.png", show)
+    if path:
         logger.info(f"Saved correlation heatmap to {path}")
     
-    if show:
-        plt.show()
-    else:
-        plt.close()
-    
     return "correlation_heatmap.png"
 
 
 def _plot_distributions(
-    df: pd.DataFrame,
+    histograms: Dict[str, Histogram],
     output_dir: Optional[Path],
     show: bool
 ) -> List[str]:
-    """Create distribution plots for numeric columns."""
+    """Create distribution plots from precomputed histograms."""
     plots = []
     
     # Limit to first 12 columns to avoid overwhelming plots
-    cols_to_plot = df.columns[:12]
+    cols_to_plot = list(histograms)[:12]
     
     n_cols = min(3, len(cols_to_plot))
     n_rows = (len(cols_to_plot) + n_cols - 1) // n_cols
     
-    fig, axes = plt.subplots(n_rows, n_cols, figsize=(15, 4 * n_rows))
-    
-    if n_rows == 1 and n_cols == 1:
-        axes = np.array([axes])
-    axes = axes.flatten() if n_rows > 1 or n_cols > 1 else [axes]
+    fig = _new_figure((15, 4 * n_rows), show)
+    axes = np.atleast_1d(fig.subplots(n_rows, n_cols)).flatten()
     
     for idx, col in enumerate(cols_to_plot):
         ax = axes[idx]
-        df[col].hist(bins=30, edgecolor='black', alpha=0.7, ax=ax)
+        hist = histograms[col]
+        ax.stairs(hist.counts, hist.edges, fill=True, edgecolor='black', alpha=0.7)
         ax.set_title(f'Distribution of {col}', fontweight='bold')
         ax.set_xlabel(col)
         ax.set_ylabel('Frequency')
@@ -170,17 +311,11 @@ def _plot_distributions(
     for idx in range(len(cols_to_plot), len(axes)):
         axes[idx].set_visible(False)
     
-    plt.tight_layout()
+    fig.tight_layout()
     
-    if output_dir:
-        path = output_dir / "distributions.png"
-        plt.savefig(path, dpi=300, bbox_inches='tight')
+    path = _finish_figure(fig, output_dir, "distributions.png", show)
+    if path:
         logger.info(f"Saved distributions to {path}")
         plots.append("distributions.png")
     
-    if show:
-        plt.show()
-    else:
-        plt.close()
-    
-    return plots
\ No newline at end of file
+    return plots
@@ -2,10 +2,13 @@
 Report generation utilities.
 """
 
+import json
 import logging
+import math
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple
 import pandas as pd
+import numpy as np
 from datetime import datetime
 
 from ..utils.logger import get_logger
@@ -15,7 +18,7 @@ logger = get_logger(__name__)
 
 def generate_html_report(
     df: pd.DataFrame,
-    original_df: pd.DataFrame,
+    original_shape: Tuple[int, int],
     profile_data: Dict[str, Any],
     cleaning_log: List[str],
     output_path: Path,
@@ -26,7 +29,7 @@ def generate_html_report(
     
     Args:
         df: Cleaned DataFrame
-        original_df: Original DataFrame
+        original_shape: Shape of the original DataFrame
         profile_data: Profiling information
         cleaning_log: List of cleaning operations
         output_path: Output file path
@@ -183,6 +186,27 @@ def generate_html_report(
             box-shadow: 0 4px 6px rgba(0,0,0,0.1);
         }}
         
+        .histogram-grid {{
+            display: grid;
+            grid-template-columns: repeat(auto-fill, minmax(260px, 1fr));
+            gap: 20px;
+            margin: 20px 0;
+        }}
+        
+        .histogram-grid svg {{
+            width: 100%;
+            height: 120px;
+            background: #f8f9fa;
+            border-radius: 8px;
+        }}
+        
+        .histogram-range {{
+            display: flex;
+            justify-content: space-between;
+            color: #666;
+            font-size: 0.8em;
+        }}
+        
         .footer {{
             background: #f8f9fa;
             padding: 20px;
@@ -215,7 +239,7 @@ def generate_html_report(
                 <div class="stats-grid">
                     <div class="stat-card">
                         <div class="stat-label">Original Rows</div>
-                        <div class="stat-value">{original_df.shape[0]:,}</div>
+                        <div class="stat-value">{original_shape[0]:,}</div>
                     </div>
                     <div class="stat-card">
                         <div class="stat-label">Final Rows</div>
@@ -229,6 +253,7 @@ def generate_html_report(
                         <div class="stat-label">Cleaning Steps</div>
                         <div class="stat-value">{len(cleaning_log)}</div>
                     </div>
+                    {_incremental_card_html(profile_data)}
                 </div>
             </div>
             
@@ -242,6 +267,12 @@ def generate_html_report(
                 {_generate_profile_html(profile_data)}
             </div>
             
+            {_generate_correlations_html(profile_data)}
+            
+            {_generate_sampling_html(profile_data)}
+            
+            {_generate_distributions_html(profile_data)}
+            
             {_generate_plots_html(profile_data) if include_plots else ''}
         </div>
         
@@ -282,6 +313,127 @@ def _generate_profile_html(profile_data: Dict[str, Any]) -> str:
     return html
 
 
+def _correlation_pairs(profile_data: Dict[str, Any]) -> Any:
+    """Strongest correlation pairs of the profiled rows (None if not computed)."""
+    if "sampling" in profile_data:
+        return profile_data["sampling"].get("correlation_pairs")
+    return profile_data.get("correlation_pairs")
+
+
+def _generate_correlations_html(profile_data: Dict[str, Any]) -> str:
+    """Generate HTML table of the strongest correlations."""
+    pairs = _correlation_pairs(profile_data)
+    if pairs is None or pairs.empty:
+        return ""
+    
+    html = '<div class="section"><h2 class="section-title">Strongest Correlations</h2>'
+    html += '<table><tr><th>Column</th><th>Column</th><th>Correlation</th></tr>'
+    for col_1, col_2, corr in pairs.itertuples(index=False):
+        html += f'<tr><td>{col_1}</td><td>{col_2}</td><td>{corr:.3f}</td></tr>'
+    html += '</table></div>'
+    
+    return html
+
+
+def _sampling_description(sampling: Dict[str, Any]) -> str:
+    """One-line description of how a sampled profile was drawn."""
+    description = (
+        f"Statistics computed on a random sample of {sampling['rows']:,} of "
+        f"{sampling['total_rows']:,} rows (seed {sampling['seed']}"
+    )
+    if sampling.get("stratify"):
+        description += f", stratified by '{sampling['stratify']}'"
+    return description + "). Row and missing-value counts use every row."
+
+
+def _incremental_card_html(profile_data: Dict[str, Any]) -> str:
+    """Stat card with the rows behind an incremental profile (empty otherwise)."""
+    incremental = profile_data.get("incremental")
+    if not incremental:
+        return ""
+    return f"""<div class="stat-card">
+                        <div class="stat-label">Profiled Rows ({incremental['batches']} batches)</div>
+                        <div class="stat-value">{incremental['rows']:,}</div>
+                    </div>"""
+
+
+def _incremental_line(profile_data: Dict[str, Any]) -> str:
+    """Text report line with the rows behind an incremental profile (empty otherwise)."""
+    incremental = profile_data.get("incremental")
+    if not incremental:
+        return ""
+    return f"Profiled Rows:  {incremental['rows']} ({incremental['batches']} batches, incremental)\n"
+
+
+def _interval_rows(sampling: Dict[str, Any]) -> List[Tuple[str, str, float, float, float]]:
+    """Flatten confidence intervals into (column, statistic, estimate, lower, upper) rows."""
+    return [
+        (col, stat, estimate, lower, upper)
+        for col, col_intervals in sampling.get("intervals", {}).items()
+        for stat, (estimate, lower, upper) in col_intervals.items()
+    ]
+
+
+def _generate_sampling_html(profile_data: Dict[str, Any]) -> str:
+    """Generate HTML for the sampling section (empty for exact profiles)."""
+    if "sampling" not in profile_data:
+        return ""
+    
+    sampling = profile_data["sampling"]
+    html = '<div class="section"><h2 class="section-title">Sampling</h2>'
+    html += f'<p>{_sampling_description(sampling)}</p>'
+    
+    rows = _interval_rows(sampling)
+    if rows:
+        html += f'<table><tr><th>Column</th><th>Statistic</th><th>Estimate</th><th>{sampling["confidence_level"]:.0%} CI</th></tr>'
+        for col, stat, estimate, lower, upper in rows:
+            html += f'<tr><td>{col}</td><td>{stat}</td><td>{estimate:.4g}</td><td>[{lower:.4g}, {upper:.4g}]</td></tr>'
+        html += '</table>'
+    
+    html += '</div>'
+    
+    return html
+
+
+def _profile_histograms(profile_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Histograms of the profiled rows (the sample's for sampled profiles)."""
+    if "sampling" in profile_data:
+        return profile_data["sampling"].get("histograms", {})
+    return profile_data.get("histograms", {})
+
+
+def _histogram_svg(hist: Any) -> str:
+    """Inline SVG bar chart of one histogram."""
+    peak = max(int(hist.counts.max()), 1) if len(hist.counts) else 1
+    width = 100 / max(len(hist.counts), 1)
+    bars = "".join(
+        f'<rect x="{i * width:.3f}" y="{100 - 100 * count / peak:.3f}" '
+        f'width="{width:.3f}" height="{100 * count / peak:.3f}" fill="#667eea">'
+        f'<title>[{hist.edges[i]:.4g}, {hist.edges[i + 1]:.4g}): {count:,}</title></rect>'
+        for i, count in enumerate(hist.counts.tolist())
+        if count
+    )
+    return f'<svg viewBox="0 0 100 100" preserveAspectRatio="none">{bars}</svg>'
+
+
+def _generate_distributions_html(profile_data: Dict[str, Any]) -> str:
+    """Generate HTML histograms for every numeric column."""
+    histograms = _profile_histograms(profile_data)
+    if not histograms:
+        return ""
+    
+    html = '<div class="section"><h2 class="section-title">Distributions</h2><div class="histogram-grid">'
+    for col, hist in histograms.items():
+        html += (
+            f'<div><h3>{col}</h3>{_histogram_svg(hist)}'
+            f'<div class="histogram-range"><span>{hist.edges[0]:.4g}</span>'
+            f'<span>{hist.total:,} values</span><span>{hist.edges[-1]:.4g}</span></div></div>'
+        )
+    html += '</div></div>'
+    
+    return html
+
+
 def _generate_plots_html(profile_data: Dict[str, Any]) -> str:
     """Generate HTML for plots section."""
     if "plots" not in profile_data or not profile_data["plots"]:
@@ -322,7 +474,7 @@ def _generate_plots_html(profile_data: Dict[str, Any]) -> str:
 
 def generate_txt_report(
     df: pd.DataFrame,
-    original_df: pd.DataFrame,
+    original_shape: Tuple[int, int],
     profile_data: Dict[str, Any],
     cleaning_log: List[str],
     output_path: Path
@@ -332,7 +484,7 @@ def generate_txt_report(
     
     Args:
         df: Cleaned DataFrame
-        original_df: Original DataFrame
+        original_shape: Shape of the original DataFrame
         profile_data: Profiling information
         cleaning_log: List of cleaning operations
         output_path: Output file path
@@ -348,10 +500,10 @@ Generated: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
 DATASET OVERVIEW
 {'='*80}
 
-Original Shape: {original_df.shape[0]} rows × {original_df.shape[1]} columns
+Original Shape: {original_shape[0]} rows × {original_shape[1]} columns
 Final Shape:    {df.shape[0]} rows × {df.shape[1]} columns
-Rows Removed:   {original_df.shape[0] - df.shape[0]}
-
+Rows Removed:   {original_shape[0] - df.shape[0]}
+{_incremental_line(profile_data)}
 {'='*80}
 CLEANING OPERATIONS
 {'='*80}
@@ -371,6 +523,26 @@ CLEANING OPERATIONS
     if "summary" in profile_data:
         report += profile_data["summary"]
     
+    pairs = _correlation_pairs(profile_data)
+    if pairs is not None and not pairs.empty:
+        report += f"\n\n{'='*80}\n"
+        report += "STRONGEST CORRELATIONS\n"
+        report += f"{'='*80}\n\n"
+        for col_1, col_2, corr in pairs.itertuples(index=False):
+            report += f"{col_1} ~ {col_2}: {corr:.3f}\n"
+    
+    if "sampling" in profile_data:
+        sampling = profile_data["sampling"]
+        report += f"\n\n{'='*80}\n"
+        report += "SAMPLING\n"
+        report += f"{'='*80}\n\n"
+        report += _sampling_description(sampling) + "\n\n"
+        for col, stat, estimate, lower, upper in _interval_rows(sampling):
+            report += (
+                f"{col}.{stat}: {estimate:.4g} "
+                f"({sampling['confidence_level']:.0%} CI {lower:.4g} to {upper:.4g})\n"
+            )
+    
     report += f"\n\n{'='*80}\n"
     report += "Generated by Datacmp v3.0\n"
     report += "Author: Moustafa Mohamed\n"
@@ -380,4 +552,70 @@ CLEANING OPERATIONS
     with open(output_path, 'w', encoding='utf-8') as f:
         f.write(report)
     
-    logger.info(f"Text report saved to {output_path}")
\ No newline at end of file
+    logger.info(f"Text report saved to {output_path}")
+
+
+def _json_safe(value: Any) -> Any:
+    """Convert profile data to JSON-serializable values (NaN and inf become null)."""
+    if isinstance(value, dict):
+        return {str(key): _json_safe(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_json_safe(item) for item in value]
+    if hasattr(value, "to_dict"):
+        return _json_safe(value.to_dict())
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    return value
+
+
+def generate_json_report(
+    df: pd.DataFrame,
+    original_shape: Tuple[int, int],
+    profile_data: Dict[str, Any],
+    cleaning_log: List[str],
+    output_path: Path
+) -> None:
+    """
+    Generate JSON report.
+    
+    Contains the dataset overview, cleaning log, column statistics, the
+    correlation matrix and strongest pairs, sampling details and the binned
+    histogram of every numeric column (``{"edges": [...], "counts": [...]}``).
+    
+    Args:
+        df: Cleaned DataFrame
+        original_shape: Shape of the original DataFrame
+        profile_data: Profiling information
+        cleaning_log: List of cleaning operations
+        output_path: Output file path
+    """
+    sampling = profile_data.get("sampling")
+    pairs = _correlation_pairs(profile_data)
+    report = {
+        "generated": datetime.now().isoformat(timespec="seconds"),
+        "overview": {
+            "original_rows": original_shape[0],
+            "original_columns": original_shape[1],
+            "final_rows": df.shape[0],
+            "final_columns": df.shape[1],
+        },
+        "cleaning_log": cleaning_log,
+        "statistics": profile_data.get("statistics"),
+        "correlations": sampling.get("correlations") if sampling else profile_data.get("correlations"),
+        "correlation_pairs": pairs.to_dict("records") if pairs is not None else None,
+        "histograms": _profile_histograms(profile_data),
+    }
+    if profile_data.get("incremental"):
+        report["incremental"] = profile_data["incremental"]
+    if sampling:
+        report["sampling"] = {
+            key: value for key, value in sampling.items()
+            if key not in ("correlations", "correlation_pairs", "histograms")
+        }
+    
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(_json_safe(report), f, indent=2)
+    
+    logger.info(f"JSON report saved to {output_path}")
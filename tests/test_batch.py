@@ -0,0 +1,61 @@
+"""Tests for multi-file batch mode."""
+
+import pandas as pd
+import pytest
+
+from datacmp.pipeline.batch import SUMMARY_FILE, expand_inputs, output_stem, run_batch
+
+
+@pytest.fixture
+def inputs(tmp_path):
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    for index in range(3):
+        (data_dir / f"part{index}.csv").write_text(f"A,B\n{index},x\n2,y\n,z\n2,y\n")
+    return data_dir
+
+
+def test_output_stem_strips_compression():
+    assert output_stem("data/events.csv.gz") == "events"
+    assert output_stem("events.parquet") == "events"
+
+
+def test_expand_inputs_sorts_and_deduplicates(inputs):
+    paths = expand_inputs([str(inputs / "*.csv"), str(inputs / "part0.csv")])
+    assert [path.name for path in paths] == ["part0.csv", "part1.csv", "part2.csv"]
+
+
+def test_batch_isolates_failures(tmp_path, inputs):
+    (inputs / "broken.csv").write_bytes(b"\x00\xff\x00")
+    out_dir = tmp_path / "out"
+
+    summary = run_batch([str(inputs / "*.csv")], out_dir, jobs=2, verbose=False)
+
+    status = dict(zip(summary["input"].map(lambda path: path.rsplit("/", 1)[-1]), summary["status"]))
+    assert status == {"broken.csv": "failed", "part0.csv": "ok", "part1.csv": "ok", "part2.csv": "ok"}
+    assert summary.loc[summary["status"] == "ok", "rows"].tolist() == [3, 3, 3]
+    assert (out_dir / "part1.csv").exists()
+    assert len(pd.read_csv(out_dir / SUMMARY_FILE)) == 4
+
+
+@pytest.mark.parametrize("options, message", [
+    ({"report_format": "html"}, "Reports are not available"),
+    ({"export_format": "parquet"}, "writes CSV only"),
+    ({"engine": "polars"}, "not available in streaming mode"),
+])
+def test_streaming_batch_rejects_unsupported_options(tmp_path, inputs, options, message):
+    with pytest.raises(ValueError, match=message):
+        run_batch([str(inputs / "*.csv")], tmp_path / "out", chunksize=2, verbose=False, **options)
+    assert not (tmp_path / "out").exists()
+
+
+def test_streaming_batch_requires_csv_export_for_other_formats(tmp_path, inputs):
+    pytest.importorskip("pyarrow")
+    pd.read_csv(inputs / "part0.csv").to_parquet(tmp_path / "extra.parquet")
+    paths = [str(inputs / "part1.csv"), str(tmp_path / "extra.parquet")]
+
+    with pytest.raises(ValueError, match="extra.parquet"):
+        run_batch(paths, tmp_path / "out", chunksize=2, verbose=False)
+
+    summary = run_batch(paths, tmp_path / "out", chunksize=2, export_format="csv", verbose=False)
+    assert summary["status"].tolist() == ["ok", "ok"]
@@ -0,0 +1,81 @@
+"""Tests for the persistent result cache."""
+
+import os
+
+import pandas as pd
+import pytest
+
+from datacmp.pipeline import runner
+from datacmp.pipeline.cache import ResultCache
+from datacmp.pipeline.runner import run_pipeline
+
+pytest.importorskip("pyarrow")
+
+
+@pytest.fixture
+def data_csv(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text("Name,Score\na,1\nb,\nc,3\na,1\nd,100\n")
+    return path
+
+
+def _entries(cache_dir):
+    return [entry for entry in cache_dir.iterdir() if entry.is_dir()]
+
+
+def test_cache_hit_skips_the_pipeline(tmp_path, data_csv, monkeypatch):
+    cache_dir = tmp_path / "cache"
+    first = run_pipeline(data_csv, verbose=False, cache_dir=cache_dir, export_report_path=tmp_path / "a.json")
+    assert len(_entries(cache_dir)) == 1
+
+    def fail(*args, **kwargs):
+        raise AssertionError("the pipeline ran on a cache hit")
+
+    monkeypatch.setattr(runner, "DataCmp", fail)
+    second = run_pipeline(
+        data_csv,
+        verbose=False,
+        cache_dir=cache_dir,
+        export_csv_path=tmp_path / "clean.csv",
+        export_report_path=tmp_path / "b.html"
+    )
+
+    pd.testing.assert_frame_equal(second.reset_index(drop=True), first.reset_index(drop=True))
+    pd.testing.assert_frame_equal(
+        pd.read_csv(tmp_path / "clean.csv"), first.reset_index(drop=True), check_dtype=False
+    )
+    assert (tmp_path / "b.html").stat().st_size > 0
+
+
+def test_key_changes_with_data_config_and_options(tmp_path, data_csv):
+    cache = ResultCache(tmp_path / "cache")
+    key = cache.key(data_csv, None, engine="pandas")
+
+    assert cache.key(data_csv, None, engine="pandas") == key
+    assert cache.key(data_csv, {"drop_duplicates": False}, engine="pandas") != key
+    assert cache.key(data_csv, None, engine="polars") != key
+
+    stat = data_csv.stat()
+    data_csv.write_text(data_csv.read_text() + "e,5\n")
+    os.utime(data_csv, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert cache.key(data_csv, None, engine="pandas") != key
+
+
+def test_store_failure_does_not_fail_the_run(tmp_path, data_csv, monkeypatch):
+    def broken_write_table(*args, **kwargs):
+        raise TypeError("cannot convert column")
+
+    monkeypatch.setattr("datacmp.pipeline.cache.write_table", broken_write_table)
+    cache_dir = tmp_path / "cache"
+    df = run_pipeline(data_csv, verbose=False, cache_dir=cache_dir)
+
+    assert len(df) == 4
+    assert _entries(cache_dir) == []
+
+
+def test_eviction_keeps_newest_entry(tmp_path, data_csv):
+    cache_dir = tmp_path / "cache"
+    run_pipeline(data_csv, verbose=False, cache_dir=cache_dir, cache_max_bytes=1)
+    run_pipeline(data_csv, config_path={"drop_duplicates": False}, verbose=False, cache_dir=cache_dir, cache_max_bytes=1)
+
+    assert len(_entries(cache_dir)) == 1
@@ -0,0 +1,83 @@
+"""Tests for row fingerprints and duplicate removal."""
+
+import numpy as np
+import pandas as pd
+
+from datacmp import DataCmp
+from datacmp.cleaning.duplicates import FingerprintSet, drop_duplicates, row_fingerprints
+
+
+def test_fingerprints_ignore_numeric_dtype():
+    ints = pd.DataFrame({"x": [1, 2], "y": ["a", "b"]})
+    floats = pd.DataFrame({"x": [1.0, 2.0], "y": ["a", "b"]})
+    nullable = pd.DataFrame({"x": pd.array([1, 2], dtype="Int64"), "y": ["a", "b"]})
+
+    expected = row_fingerprints(ints)
+    np.testing.assert_array_equal(row_fingerprints(floats), expected)
+    np.testing.assert_array_equal(row_fingerprints(nullable), expected)
+
+
+def test_fingerprints_ignore_string_dtype_and_missing_representation():
+    text = pd.DataFrame({"y": pd.Series(["a", None], dtype="str")})
+    objects = pd.DataFrame({"y": pd.Series(["a", None], dtype=object)})
+    categories = pd.DataFrame({"y": pd.Series(["a", None], dtype="category")})
+    # An all-missing text column is read as float64 by the CSV parser
+    all_missing = pd.DataFrame({"y": [np.nan, np.nan]})
+
+    expected = row_fingerprints(text)
+    np.testing.assert_array_equal(row_fingerprints(objects), expected)
+    np.testing.assert_array_equal(row_fingerprints(categories), expected)
+    assert row_fingerprints(all_missing)[1] == expected[1]
+
+
+def test_fingerprints_distinguish_rows():
+    df = pd.DataFrame({"x": [1, 2, 1], "y": [2, 1, 2]})
+    fingerprints = row_fingerprints(df)
+    assert fingerprints[0] != fingerprints[1]
+    assert fingerprints[0] == fingerprints[2]
+
+
+def test_fingerprint_set_finds_duplicates_across_dtypes():
+    seen = FingerprintSet()
+    first = pd.DataFrame({"x": [1, 2], "y": ["a", "b"]})
+    second = pd.DataFrame({"x": [np.nan, 1.0], "y": ["c", "a"]})
+
+    assert seen.add(row_fingerprints(first)).tolist() == [True, True]
+    assert seen.add(row_fingerprints(second)).tolist() == [True, False]
+
+
+def test_drop_duplicates_subset():
+    df = pd.DataFrame({"id": [1, 1, 2], "value": [10, 20, 30]})
+    result, log = drop_duplicates(df, subset=["id"])
+    assert result["value"].tolist() == [10, 30]
+    assert log == ["Removed 1 duplicate rows (by id)"]
+
+
+def test_large_integer_keys_are_not_merged():
+    df = pd.DataFrame({"id": [2**62, 2**62 + 1, 2**62 + 2], "v": [1, 1, 1]})
+    result, log = drop_duplicates(df)
+
+    assert len(result) == 3
+    assert log == []
+    assert len(DataCmp(df).clean().df) == 3
+    unsigned = pd.DataFrame({"id": np.array([2**63 + 1, 2**63 + 2], dtype=np.uint64)})
+    assert len(drop_duplicates(unsigned)[0]) == 2
+
+
+def test_integral_floats_match_integers_exactly():
+    ints = pd.DataFrame({"x": [2**60, -3, 0]})
+    floats = pd.DataFrame({"x": [2.0**60, -3.0, -0.0]})
+    np.testing.assert_array_equal(row_fingerprints(floats), row_fingerprints(ints))
+
+    unsigned = pd.DataFrame({"x": np.array([2**63 + 2**11], dtype=np.uint64)})
+    np.testing.assert_array_equal(
+        row_fingerprints(pd.DataFrame({"x": [2.0**63 + 2**11]})), row_fingerprints(unsigned)
+    )
+
+
+def test_numbers_with_shared_bit_patterns_differ():
+    # 1.5 vs the int64 of its bits, and -1 vs the uint64 of its bits
+    bits = pd.DataFrame({"x": np.array([1.5]).view(np.int64)})
+    assert row_fingerprints(pd.DataFrame({"x": [1.5]}))[0] != row_fingerprints(bits)[0]
+    wrapped = pd.DataFrame({"x": np.array([2**64 - 1], dtype=np.uint64)})
+    assert row_fingerprints(pd.DataFrame({"x": [-1]}))[0] != row_fingerprints(wrapped)[0]
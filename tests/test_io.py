@@ -0,0 +1,84 @@
+"""Tests for table input and output."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from datacmp.utils.io import infer_csv_schema, iter_table_chunks, read_table, write_table
+
+
+@pytest.fixture
+def drift_csv(tmp_path):
+    # The integer column has a missing value in the second chunk only
+    path = tmp_path / "drift.csv"
+    path.write_text("x,y\n1,a\n2,b\n,c\n1,a\n1,e\n")
+    return path
+
+
+@pytest.fixture
+def big_csv(tmp_path):
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        "id": np.arange(60_000),
+        "value": rng.normal(size=60_000),
+        "text": rng.choice(["alpha", "beta", "gamma"], 60_000),
+    })
+    path = tmp_path / "big.csv"
+    df.to_csv(path, index=False)
+    return path
+
+
+@pytest.mark.parametrize("engine", ["c", "pyarrow"])
+def test_chunks_match_full_read(big_csv, engine):
+    if engine == "pyarrow":
+        pytest.importorskip("pyarrow")
+    chunks = list(iter_table_chunks(big_csv, 7_000, engine=engine))
+
+    assert [len(chunk) for chunk in chunks] == [7_000] * 8 + [4_000]
+    combined = pd.concat(chunks, ignore_index=True)
+    pd.testing.assert_frame_equal(combined, read_table(big_csv), check_dtype=False)
+
+
+@pytest.mark.parametrize("engine", ["c", "pyarrow"])
+def test_widened_schema_locks_chunk_dtypes(drift_csv, engine):
+    if engine == "pyarrow":
+        pytest.importorskip("pyarrow")
+    schema = infer_csv_schema(drift_csv, rows=2, widen=True)
+    assert schema["x"] == "float64"
+
+    dtypes = {str(chunk["x"].dtype) for chunk in iter_table_chunks(drift_csv, 2, engine=engine, dtype=schema)}
+    assert dtypes == {"float64"}
+
+
+def test_chunk_not_fitting_schema_is_an_error(drift_csv):
+    with pytest.raises(ValueError, match="does not fit the column types"):
+        list(iter_table_chunks(drift_csv, 2, dtype={"x": "int64"}))
+
+
+def test_pyarrow_engine_reads_empty_text_as_missing(tmp_path):
+    pytest.importorskip("pyarrow")
+    path = tmp_path / "empty.csv"
+    path.write_text("a,b\nx,1\n,2\nz,\n")
+
+    expected = read_table(path)
+    pd.testing.assert_frame_equal(read_table(path, engine="pyarrow"), expected, check_dtype=False)
+    assert read_table(path, engine="pyarrow")["a"].isna().tolist() == [False, True, False]
+
+
+def test_infer_schema_rows_falls_back_to_full_inference(drift_csv):
+    df = read_table(drift_csv, infer_schema_rows=2)
+    assert df["x"].dtype == np.float64
+    assert df["x"].isna().sum() == 1
+
+
+@pytest.mark.parametrize("format", ["parquet", "feather", "arrow"])
+def test_arrow_formats_round_trip(tmp_path, format):
+    pytest.importorskip("pyarrow")
+    df = pd.DataFrame({"a": [1, 2, 3], "b": ["x", None, "z"], "c": [0.5, np.nan, 1.5]})
+    path = tmp_path / f"data.{format}"
+    write_table(df, path)
+
+    pd.testing.assert_frame_equal(read_table(path), df, check_dtype=False)
+    pd.testing.assert_frame_equal(read_table(path, columns=["c", "a"]), df[["c", "a"]], check_dtype=False)
+    chunks = list(iter_table_chunks(path, 2))
+    assert [len(chunk) for chunk in chunks] == [2, 1]
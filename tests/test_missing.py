@@ -0,0 +1,62 @@
+"""Tests for missing value handling."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from datacmp.cleaning.missing import apply_fill_values, compute_fill_values, handle_missing_values
+
+
+@pytest.fixture
+def df():
+    return pd.DataFrame({
+        "num": [1.0, 2.0, np.nan, 4.0, 10.0, 2.0],
+        "cat": ["a", None, "b", "b", "a", "b"],
+        "sparse": [np.nan, np.nan, np.nan, 1.0, np.nan, 2.0],
+        "full": [1, 2, 3, 4, 5, 6],
+    })
+
+
+@pytest.mark.parametrize("strategy, expected", [("median", 2.0), ("mean", 3.8), ("mode", 2.0)])
+def test_numeric_fill_values(df, strategy, expected):
+    config = {"fill_strategy": {"numeric": strategy}}
+    drop_cols, fill_values, _ = compute_fill_values(df, config)
+
+    assert drop_cols == ["sparse"]
+    assert fill_values["num"] == pytest.approx(expected)
+    assert fill_values["cat"] == "b"
+    assert "full" not in fill_values
+
+
+def test_categorical_constant_fill(df):
+    _, fill_values, _ = compute_fill_values(df, {"fill_strategy": {"categorical": "constant"}})
+    assert fill_values["cat"] == "Unknown"
+
+
+def test_threshold_drop(df):
+    drop_cols, fill_values, _ = compute_fill_values(df, {"threshold_drop": 0.9})
+    assert drop_cols == []
+    assert fill_values["sparse"] == 1.5
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_handle_missing_values(df, workers):
+    cleaned, log = handle_missing_values(df, {}, workers=workers)
+
+    assert cleaned.columns.tolist() == ["num", "cat", "full"]
+    assert not cleaned.isna().any().any()
+    assert cleaned["num"].tolist() == [1.0, 2.0, 2.0, 4.0, 10.0, 2.0]
+    assert log == [
+        "Filled numeric column 'num' with median (2.00)",
+        "Filled categorical column 'cat' with 'b'",
+        "Dropped column 'sparse' (66.7% missing)",
+    ]
+
+
+def test_apply_fill_values_adds_categories():
+    df = pd.DataFrame({"cat": pd.Categorical(["a", None, "a"]), "num": [1.0, np.nan, 3.0]})
+    cleaned = apply_fill_values(df, ["absent"], {"cat": "Unknown", "num": 0.0, "other": 1})
+
+    assert cleaned["cat"].tolist() == ["a", "Unknown", "a"]
+    assert cleaned["num"].tolist() == [1.0, 0.0, 3.0]
+    assert df["cat"].isna().sum() == 1
@@ -0,0 +1,99 @@
+"""Tests for outlier detection and handling."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from datacmp import DataCmp
+from datacmp.cleaning.outliers import apply_outlier_bounds, compute_outlier_bounds, handle_outliers
+
+
+@pytest.fixture
+def values():
+    rng = np.random.default_rng(0)
+    series = pd.Series(rng.normal(50, 5, 500))
+    series.iloc[[3, 77, 401]] = [500.0, -300.0, 120.0]
+    return series
+
+
+@pytest.mark.parametrize("method", ["iqr", "zscore", "mad"])
+def test_bounds_match_definitions(values, method):
+    df = pd.DataFrame({"v": values, "label": "x"})
+    bounds = compute_outlier_bounds(df, {"method": method})
+
+    if method == "iqr":
+        q1, q3 = values.quantile([0.25, 0.75])
+        expected = (q1 - 1.5 * (q3 - q1), q3 + 1.5 * (q3 - q1))
+    elif method == "zscore":
+        expected = (values.mean() - 3 * values.std(), values.mean() + 3 * values.std())
+    else:
+        median = values.median()
+        spread = 3.5 * 1.4826 * (values - median).abs().median()
+        expected = (median - spread, median + spread)
+
+    assert bounds.index.tolist() == ["v"]
+    assert tuple(bounds.loc["v"]) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("method", ["iqr", "zscore", "mad"])
+def test_cap_and_remove(values, method):
+    df = pd.DataFrame({"v": values})
+    config = {"method": method}
+    bounds = compute_outlier_bounds(df, config)
+    lower, upper = bounds.loc["v"]
+    outliers = (values < lower) | (values > upper)
+
+    capped, log = handle_outliers(df, {**config, "action": "cap"})
+    assert len(capped) == len(df)
+    assert capped["v"].between(lower, upper).all()
+    pd.testing.assert_series_equal(capped["v"][~outliers], values[~outliers], check_names=False)
+    assert log == [f"Handled {outliers.sum()} outliers in 'v' (action: cap)"]
+
+    removed, _ = handle_outliers(df, {**config, "action": "remove"})
+    pd.testing.assert_series_equal(removed["v"], values[~outliers], check_names=False)
+
+
+def test_missing_values_are_not_outliers():
+    df = pd.DataFrame({"v": [1.0, 2.0, np.nan, 3.0, 100.0]})
+    bounds = pd.DataFrame({"lower": [0.0], "upper": [10.0]}, index=["v"])
+
+    capped, counts = apply_outlier_bounds(df, bounds, "cap")
+    assert counts["v"] == 1
+    assert capped["v"].isna().sum() == 1
+    assert len(apply_outlier_bounds(df, bounds, "remove")[0]) == 4
+
+
+def test_capping_keeps_narrow_dtypes():
+    df = pd.DataFrame({
+        "i8": pd.Series([1, 2, 3, 100], dtype="int8"),
+        "f32": pd.Series([1.0, 2.0, 3.0, 100.0], dtype="float32"),
+        "nullable": pd.Series([1, None, 3, 100], dtype="Int16"),
+        "i64": pd.Series([1, 2, 3, 100], dtype="int64"),
+    })
+    bounds = pd.DataFrame({"lower": 0.5, "upper": 10.7}, index=df.columns)
+
+    capped, counts = apply_outlier_bounds(df, bounds, "cap")
+
+    assert counts.tolist() == [1, 1, 1, 1]
+    assert capped.dtypes.astype(str).tolist() == ["int8", "float32", "Int16", "float64"]
+    # Integer columns are capped to the bounds rounded inward
+    assert capped["i8"].tolist() == [1, 2, 3, 10]
+    assert capped["nullable"].tolist() == [1, pd.NA, 3, 10]
+    assert capped["f32"].iloc[-1] == np.float32(10.7)
+    assert capped["i64"].iloc[-1] == 10.7
+
+
+def test_clean_keeps_optimized_dtypes():
+    rng = np.random.default_rng(1)
+    df = pd.DataFrame({
+        "qty": rng.integers(0, 100, 1_000),
+        "price": rng.normal(10, 1, 1_000).astype(np.float32).astype(float),
+    })
+    df.loc[0, "qty"] = 100_000
+    config = {"cleaning": {"outlier_handling": {"enabled": True, "method": "iqr", "action": "cap"}}}
+
+    cleaned = DataCmp(df, config=config).clean().df
+
+    assert cleaned["qty"].dtype == np.int32
+    assert cleaned["price"].dtype == np.float32
+    assert cleaned["qty"].max() < 100_000
@@ -0,0 +1,103 @@
+"""Tests for partitioned (map/merge) cleaning."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from datacmp import DataCmp
+from datacmp.pipeline.partitioned import run_partitioned
+from datacmp.profiling.state import ColumnSummary
+
+pytest.importorskip("pyarrow")
+
+
+def _config(method="zscore", numeric="mean"):
+    return {
+        "cleaning": {
+            "fill_strategy": {"numeric": numeric, "categorical": "mode"},
+            "outlier_handling": {"enabled": True, "method": method, "action": "cap"},
+        },
+    }
+
+
+def _write_partitions(tmp_path, frames):
+    paths = []
+    for index, frame in enumerate(frames):
+        path = tmp_path / f"part-{index}.parquet"
+        frame.to_parquet(path, index=False)
+        paths.append(str(path))
+    return paths
+
+
+@pytest.fixture
+def partitions(tmp_path):
+    rng = np.random.default_rng(0)
+    frames = []
+    for index in range(4):
+        frame = pd.DataFrame({
+            "Amount": rng.normal(100, 20, 500).round(1),
+            "Qty": rng.integers(1, 20, 500),
+            "City": rng.choice(["a", "b", "c"], 500),
+        })
+        frame.loc[frame.index[::17], "City"] = None
+        if index % 2:
+            # Missing values turn the integer column into float64 here
+            frame["Qty"] = frame["Qty"].astype(float)
+            frame.loc[frame.index[::13], "Qty"] = np.nan
+        frames.append(frame)
+    # Rows repeated across partitions of different dtypes
+    frames[1] = pd.concat([frames[1], frames[0].head(25).astype({"Qty": float})], ignore_index=True)
+    frames[3] = pd.concat([frames[3], frames[2].head(10).astype({"Qty": float})], ignore_index=True)
+    return _write_partitions(tmp_path, frames), frames
+
+
+def test_partitioned_matches_in_memory_clean(tmp_path, partitions):
+    paths, frames = partitions
+    config = _config()
+
+    result = run_partitioned(paths, tmp_path / "out", config_path=config, jobs=1, verbose=False)
+    cleaned = pd.concat([pd.read_parquet(path) for path in result["outputs"]], ignore_index=True)
+
+    expected = DataCmp(pd.concat(frames, ignore_index=True), config=config).clean(dtypes=False).df
+    expected = expected.reset_index(drop=True)
+
+    data = pd.concat(frames, ignore_index=True)
+    assert result["rows_in"] == len(data)
+    assert len(cleaned) == len(expected) == len(data.drop_duplicates())
+    pd.testing.assert_frame_equal(cleaned, expected, check_dtype=False, rtol=1e-9)
+
+
+def test_partitioned_median_within_sketch_error(tmp_path, partitions):
+    paths, frames = partitions
+    config = _config(method="iqr", numeric="median")
+
+    result = run_partitioned(paths, tmp_path / "out", config_path=config, jobs=2, verbose=False)
+    plan = result["cleaning_plan"]
+
+    data = pd.concat(frames, ignore_index=True)
+    removed = len(data) - len(data.drop_duplicates())
+    data = data.drop_duplicates()
+    qty = data["Qty"].dropna()
+    fill = plan.fill_values["qty"]
+    # Rank error of the KLL sketch is at most quantile_error (1%)
+    assert abs((qty < fill).mean() - 0.5) <= 0.01 + (qty == fill).mean()
+    assert plan.duplicates
+    assert f"Removed {removed} duplicate rows" in result["cleaning_log"]
+
+
+def test_partitioned_rejects_mad(tmp_path, partitions):
+    paths, _ = partitions
+    with pytest.raises(ValueError, match="not available for partitioned data"):
+        run_partitioned(paths, tmp_path / "out", config_path=_config(method="mad"), jobs=1, verbose=False)
+
+
+def test_column_summary_update_repeated_matches_concatenation():
+    values = pd.Series([1.0, 4.0, np.nan, 9.0])
+    summary = ColumnSummary("numeric", "float64").update(values)
+    summary.update_repeated(2.5, 3)
+
+    expected = pd.Series([1.0, 4.0, 9.0, 2.5, 2.5, 2.5])
+    assert summary.count == 6
+    assert summary.mean == pytest.approx(expected.mean())
+    assert summary.m2 / (summary.count - 1) == pytest.approx(expected.var())
+    assert summary.nulls == 1
@@ -0,0 +1,65 @@
+"""Tests for fitted cleaning plans."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from datacmp import DataCmp
+from datacmp.cleaning.plan import CleaningPlan
+
+
+@pytest.fixture
+def train():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        "Order Total": rng.normal(100, 10, 200).round(2),
+        "Region Name": rng.choice(["north", "south"], 200),
+        "Mostly Empty": np.nan,
+        "Shipped": pd.date_range("2024-01-01", periods=200, freq="D"),
+    })
+    df.loc[[5, 50], "Order Total"] = [1_000.0, np.nan]
+    df.loc[[7, 70], "Region Name"] = None
+    df.loc[[9], "Shipped"] = pd.NaT
+    df.loc[3, "Mostly Empty"] = 1.0
+    return pd.concat([df, df.head(5)], ignore_index=True)
+
+
+def _config(action="cap"):
+    return {"cleaning": {"outlier_handling": {"enabled": True, "method": "iqr", "action": action}}}
+
+
+@pytest.mark.parametrize("action", ["cap", "remove"])
+def test_transform_matches_clean(train, action):
+    cmp = DataCmp(train, config=_config(action)).fit(dtypes=False)
+    transformed, _ = cmp.cleaning_plan.transform(train)
+
+    pd.testing.assert_frame_equal(transformed, cmp.df)
+
+
+@pytest.mark.parametrize("suffix", [".yaml", ".json"])
+def test_save_load_round_trip(tmp_path, train, suffix):
+    plan = DataCmp(train, config=_config()).fit(dtypes=False).cleaning_plan
+    path = tmp_path / f"plan{suffix}"
+    plan.save(path)
+    loaded = CleaningPlan.load(path)
+
+    assert loaded.to_dict() == plan.to_dict()
+    assert loaded.rename["Order Total"] == "order_total"
+    assert loaded.drop_columns == ["mostly_empty"]
+    assert loaded.duplicates
+
+    expected = DataCmp(train, config=_config()).clean(dtypes=False).df
+    result = DataCmp(train, config=_config()).transform(path).df
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_load_rejects_newer_version(tmp_path):
+    path = tmp_path / "plan.json"
+    path.write_text('{"version": 999}')
+    with pytest.raises(ValueError, match="newer"):
+        CleaningPlan.load(path)
+
+
+def test_invalid_outlier_action():
+    with pytest.raises(ValueError, match="outlier_action"):
+        CleaningPlan(outlier_action="drop")
@@ -0,0 +1,57 @@
+"""Tests for the polars engine against the pandas engine."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from datacmp import DataCmp
+
+pytest.importorskip("polars")
+
+
+@pytest.fixture
+def data_csv(tmp_path):
+    rng = np.random.default_rng(3)
+    n = 2_000
+    df = pd.DataFrame({
+        "Unit Price": rng.lognormal(2, 1, n).round(2),
+        "Qty": rng.integers(1, 40, n).astype(float),
+        "Store Name": rng.choice(["a", "b", "c", "d"], n),
+        "Sparse": np.where(rng.random(n) < 0.8, np.nan, 1.0),
+    })
+    df.loc[df.index[::13], "Qty"] = np.nan
+    df.loc[df.index[::17], "Store Name"] = None
+    df = pd.concat([df, df.iloc[::10]], ignore_index=True)
+    path = tmp_path / "data.csv"
+    df.to_csv(path, index=False)
+    return path
+
+
+@pytest.mark.parametrize("method", ["iqr", "zscore", "mad"])
+@pytest.mark.parametrize("action", ["cap", "remove"])
+def test_clean_matches_pandas(data_csv, method, action):
+    config = {
+        "cleaning": {
+            "fill_strategy": {"numeric": "median", "categorical": "mode"},
+            "outlier_handling": {"enabled": True, "method": method, "action": action},
+        },
+    }
+    expected = DataCmp(data_csv, config=config).clean(dtypes=False)
+    result = DataCmp(data_csv, config=config, engine="polars").clean()
+
+    pd.testing.assert_frame_equal(
+        result.df.reset_index(drop=True),
+        expected.df.reset_index(drop=True),
+        check_dtype=False,
+        rtol=1e-9,
+    )
+    assert result.cleaning_log == expected.cleaning_log
+
+
+def test_numeric_stats_match_pandas(data_csv):
+    expected = DataCmp(data_csv)._numeric_stats()
+    result = DataCmp(data_csv, engine="polars")._numeric_stats()
+
+    pd.testing.assert_frame_equal(
+        result.astype(float), expected[result.columns].astype(float), rtol=1e-9
+    )
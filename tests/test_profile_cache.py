@@ -0,0 +1,39 @@
+"""Tests for the in-memory profile cache."""
+
+import pandas as pd
+
+from datacmp import DataCmp
+from datacmp.core.cache import ProfileCache, frame_fingerprint
+
+
+def test_get_or_compute_hits_until_rebound():
+    df = pd.DataFrame({"a": [1, 2, 3]})
+    calls = []
+    cache = ProfileCache().bind((1, frame_fingerprint(df)))
+
+    def compute():
+        calls.append(1)
+        return len(calls)
+
+    assert cache.get_or_compute("stats", compute) == 1
+    assert cache.bind((1, frame_fingerprint(df))).get_or_compute("stats", compute) == 1
+    assert cache.bind((2, frame_fingerprint(df))).get_or_compute("stats", compute) == 2
+    assert len(calls) == 2
+
+
+def test_datacmp_invalidates_on_new_dataframe():
+    cmp = DataCmp(pd.DataFrame({"a": [1.0, 2.0, None, 100.0], "b": ["x", "y", "y", None]}))
+    stats = cmp._numeric_stats()
+
+    assert cmp._numeric_stats() is stats
+    cmp.clean()
+    assert cmp._numeric_stats() is not stats
+    assert cmp._numeric_stats().loc["a", "count"] == 4
+
+
+def test_clear_cache_after_in_place_edit():
+    cmp = DataCmp(pd.DataFrame({"a": [1.0, 2.0, 3.0]}))
+    assert cmp._numeric_stats().loc["a", "max"] == 3.0
+
+    cmp.df.loc[0, "a"] = 10.0
+    assert cmp.clear_cache()._numeric_stats().loc["a", "max"] == 10.0
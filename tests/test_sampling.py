@@ -0,0 +1,30 @@
+"""Tests for sampled profiles."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from datacmp.profiling.sampling import confidence_intervals
+from datacmp.profiling.statistics import compute_numeric_stats
+
+
+@pytest.mark.filterwarnings("error")
+def test_confidence_intervals_cover_text_columns():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        "value": rng.normal(size=10_000),
+        "city": rng.choice(["a", "b", "c"], 10_000, p=[0.5, 0.3, 0.2]),
+        "kind": pd.Series(rng.choice(["x", "y"], 10_000), dtype="category"),
+    })
+    sample = df.sample(1_000, random_state=0)
+
+    intervals = confidence_intervals(
+        sample, compute_numeric_stats(sample[["value"]]), df.isnull().sum(), len(df)
+    )
+
+    assert set(intervals) == {"value", "city", "kind"}
+    share, lower, upper = intervals["city"]["top_share"]
+    assert lower < 0.5 < upper
+    assert lower <= share <= upper
+    estimate, lower, upper = intervals["value"]["mean"]
+    assert lower < df["value"].mean() < upper
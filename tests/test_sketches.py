@@ -0,0 +1,105 @@
+"""Tests for the approximate profiling sketches."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from datacmp.profiling.sketches import HyperLogLog, KLLSketch, SpaceSaving
+
+
+@pytest.fixture
+def values():
+    return np.random.default_rng(0).lognormal(size=200_000)
+
+
+def _rank_errors(values, estimates, qs):
+    ordered = np.sort(values)
+    ranks = np.searchsorted(ordered, estimates, side="left") / len(values)
+    return np.abs(ranks - np.asarray(qs))
+
+
+@pytest.mark.parametrize("error", [0.01, 0.005])
+def test_kll_rank_error(values, error):
+    qs = [0.01, 0.25, 0.5, 0.75, 0.99]
+    sketch = KLLSketch.from_error(error)
+    for start in range(0, len(values), 10_000):
+        sketch.update(values[start:start + 10_000])
+
+    assert sketch.n == len(values)
+    assert sketch.min == values.min() and sketch.max == values.max()
+    assert _rank_errors(values, sketch.quantiles(qs), qs).max() <= error
+
+
+def test_kll_merge_rank_error(values):
+    qs = [0.1, 0.5, 0.9]
+    parts = [
+        KLLSketch.from_error(0.01, seed=seed).update(part)
+        for seed, part in enumerate(np.array_split(values, 8))
+    ]
+    merged = parts[0]
+    for part in parts[1:]:
+        merged.merge(part)
+
+    assert merged.n == len(values)
+    # Each merge adds a compaction pass: allow some slack over the nominal error
+    assert _rank_errors(values, merged.quantiles(qs), qs).max() <= 0.015
+
+
+def test_kll_update_repeated_matches_update():
+    repeated = KLLSketch(k=50).update_repeated(3.0, 1_000)
+    assert repeated.n == 1_000
+    assert repeated.quantile(0.5) == 3.0
+
+
+@pytest.mark.parametrize("distinct", [100, 50_000])
+def test_hyperloglog_relative_error(distinct):
+    rng = np.random.default_rng(distinct)
+    values = rng.integers(0, distinct, distinct * 3)
+    expected = len(np.unique(values))
+
+    halves = np.array_split(values, 2)
+    hll = HyperLogLog.from_error(0.01).update(halves[0])
+    hll.merge(HyperLogLog.from_error(0.01).update(halves[1]))
+
+    # Four standard errors
+    assert abs(hll.count() - expected) <= 0.04 * expected
+
+
+def test_space_saving_error_bound():
+    rng = np.random.default_rng(0)
+    values = pd.Series(rng.zipf(1.5, 100_000) % 5_000)
+    sketch = SpaceSaving(capacity=200)
+    for start in range(0, len(values), 7_000):
+        sketch.update(values[start:start + 7_000])
+
+    exact = values.value_counts()
+    assert sketch.n == len(values)
+    for value, count, error in sketch.top(20):
+        assert exact[value] <= count <= exact[value] + error
+        assert error <= len(values) / 200
+    # Every value above n / capacity is tracked
+    assert set(exact.index[exact > len(values) / 200]) <= set(sketch.counts.index)
+
+
+def test_space_saving_update_is_bounded(monkeypatch):
+    rng = np.random.default_rng(1)
+    values = pd.Series(rng.zipf(1.3, 50_000).astype(str))
+    sizes = []
+    value_counts = pd.Series.value_counts
+
+    def tracked(self, *args, **kwargs):
+        sizes.append(len(self))
+        return value_counts(self, *args, **kwargs)
+
+    monkeypatch.setattr(pd.Series, "value_counts", tracked)
+    # The whole column at once, as in-memory profiling passes it
+    sketch = SpaceSaving(capacity=50).update(values)
+    monkeypatch.undo()
+
+    exact = values.value_counts()
+    assert max(sizes) <= 32 * 50
+    assert len(sketch.counts) == 50 and sketch.n == len(values)
+    for value, count, error in sketch.top(10):
+        assert exact[value] <= count <= exact[value] + error
+        assert error <= len(values) / 50
+    assert [value for value, _, _ in sketch.top(3)] == exact.index[:3].tolist()
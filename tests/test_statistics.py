@@ -0,0 +1,107 @@
+"""Tests for the fused numeric statistics against pandas."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from datacmp.profiling.state import ProfileState
+from datacmp.profiling.statistics import (
+    categorical_columns, compute_numeric_stats, compute_statistics, moment_stats
+)
+from datacmp.profiling.summary import _count_column_types
+
+
+@pytest.fixture
+def numeric_df():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        "normal": rng.normal(size=1_000),
+        "skewed": rng.lognormal(size=1_000),
+        "tiny": rng.normal(1e-6, 1e-9, 1_000),
+        "large": rng.normal(1e9, 3.0, 1_000),
+        "constant": np.full(1_000, 0.1),
+        "integers": rng.integers(0, 100, 1_000),
+    })
+    df.loc[::7, "normal"] = np.nan
+    return df
+
+
+def _pandas_stats(df):
+    return pd.DataFrame({
+        "count": df.count(),
+        "mean": df.mean(),
+        "median": df.median(),
+        "std": df.std(),
+        "min": df.min(),
+        "max": df.max(),
+        "q25": df.quantile(0.25),
+        "q75": df.quantile(0.75),
+        "skewness": df.skew(),
+        "kurtosis": df.kurt(),
+    })
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_numeric_stats_match_pandas(numeric_df, workers):
+    stats = compute_numeric_stats(numeric_df, workers=workers)
+    expected = _pandas_stats(numeric_df)
+    pd.testing.assert_frame_equal(
+        stats.astype(float), expected[stats.columns].astype(float), rtol=1e-7, atol=1e-12
+    )
+
+
+def test_std_is_not_clamped_at_small_scales(numeric_df):
+    stats = compute_numeric_stats(numeric_df[["tiny"]])
+    assert stats.loc["tiny", "std"] == pytest.approx(numeric_df["tiny"].std(), rel=1e-9)
+    assert stats.loc["tiny", "skewness"] == pytest.approx(numeric_df["tiny"].skew(), rel=1e-6)
+
+
+def test_constant_column_has_zero_shape_statistics():
+    # Rounding noise left in the moment sums of a constant column
+    std, skewness, kurtosis = moment_stats(
+        np.array([5.0]), np.array([1e-33]), np.array([1e-50]), np.array([1e-66]), np.array([True])
+    )
+    assert skewness[0] == 0.0
+    assert kurtosis[0] == 0.0
+    assert std[0] == pytest.approx(np.sqrt(1e-33 / 4))
+
+
+def test_too_few_values_give_nan():
+    std, skewness, kurtosis = moment_stats(
+        np.array([1.0, 2.0, 3.0]), np.array([0.0, 2.0, 2.0]), np.zeros(3), np.ones(3), np.zeros(3, dtype=bool)
+    )
+    assert np.isnan(std[0]) and not np.isnan(std[1])
+    assert np.isnan(skewness[1]) and not np.isnan(skewness[2])
+    assert np.isnan(kurtosis).all()
+
+
+def test_merged_profile_state_matches_pandas(numeric_df):
+    state = ProfileState()
+    for start in range(0, len(numeric_df), 300):
+        state.update(numeric_df.iloc[start:start + 300])
+    stats = state.numeric_stats()
+    # Merging moments loses a few digits on the large-mean column
+    expected = _pandas_stats(numeric_df)
+
+    for field in ("count", "mean", "std", "min", "max", "skewness", "kurtosis"):
+        np.testing.assert_allclose(
+            stats[field].astype(float), expected.loc[stats.index, field].astype(float),
+            rtol=1e-5, atol=1e-12, err_msg=field
+        )
+
+
+@pytest.mark.filterwarnings("error")
+def test_text_columns_of_every_string_dtype_are_categorical():
+    df = pd.DataFrame({
+        "default": pd.Series(["a", "b", None]),
+        "objects": pd.Series(["a", 1, None], dtype=object),
+        "strings": pd.Series(["a", "b", None], dtype="string"),
+        "categories": pd.Series(["a", "b", None], dtype="category"),
+        "numbers": [1.0, 2.0, 3.0],
+        "when": pd.to_datetime(["2024-01-01", "2024-01-02", None]),
+    })
+
+    expected = ["default", "objects", "strings", "categories"]
+    assert categorical_columns(df).tolist() == expected
+    assert sorted(compute_statistics(df)["categorical"]) == sorted(expected)
+    assert _count_column_types(df) == (1, 4, 1, 0)
@@ -0,0 +1,120 @@
+"""Tests for streaming (chunked) cleaning against the in-memory pipeline."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from datacmp import DataCmp
+from datacmp.pipeline.streaming import fit_streaming
+
+
+def _config(**outlier_handling):
+    return {
+        "cleaning": {
+            "fill_strategy": {"numeric": "median", "categorical": "mode"},
+            "outlier_handling": {"enabled": True, "method": "iqr", "action": "cap", **outlier_handling},
+        },
+    }
+
+
+def _in_memory(path, config, output):
+    DataCmp(path, config=config).clean(dtypes=False).export(output)
+    return pd.read_csv(output)
+
+
+def _streamed(path, config, output, chunksize):
+    DataCmp(path, config=config, chunksize=chunksize).clean().export(output)
+    return pd.read_csv(output)
+
+
+@pytest.fixture
+def drift_csv(tmp_path):
+    # x is int64 in the first and last chunk and float64 in the second,
+    # which repeats the first row
+    path = tmp_path / "drift.csv"
+    path.write_text("x,y\n1,a\n2,b\n,c\n1,a\n1,e\n")
+    return path
+
+
+@pytest.fixture
+def large_csv(tmp_path):
+    rng = np.random.default_rng(42)
+    n = 3_000
+    df = pd.DataFrame({
+        "Order ID": rng.integers(0, 2_000, n),
+        "Quantity": rng.integers(1, 50, n).astype(float),
+        "Price": rng.lognormal(3, 1, n).round(2),
+        "Region": rng.choice(["north", "south", "east", "west"], n),
+        "Note": rng.choice(["x", "y"], n),
+    })
+    # Missing values in some chunks only: Quantity is read as int64 elsewhere
+    df.loc[1_200:1_400:7, "Quantity"] = np.nan
+    df.loc[df.index[::11], "Region"] = np.nan
+    df.loc[df.index % 5 != 0, "Note"] = np.nan
+    # Rows repeated across chunks
+    df = pd.concat([df, df.iloc[::9]], ignore_index=True)
+    path = tmp_path / "large.csv"
+    df.to_csv(path, index=False, float_format="%.10g")
+    return path
+
+
+def test_streaming_dedup_survives_dtype_drift(tmp_path, drift_csv):
+    config = _config()
+    expected = _in_memory(drift_csv, config, tmp_path / "memory.csv")
+    result = _streamed(drift_csv, config, tmp_path / "stream.csv", chunksize=2)
+
+    assert len(result) == 4
+    pd.testing.assert_frame_equal(result, expected)
+    assert (tmp_path / "stream.csv").read_text() == (tmp_path / "memory.csv").read_text()
+
+
+@pytest.mark.parametrize("chunksize", [250, 1_000, 10_000])
+@pytest.mark.parametrize("method", ["iqr", "zscore", "mad"])
+def test_streaming_matches_in_memory(tmp_path, large_csv, chunksize, method):
+    # Fewer rows than performance.stream_sample_size: quantiles are exact
+    config = _config(method=method)
+    expected = _in_memory(large_csv, config, tmp_path / "memory.csv")
+    result = _streamed(large_csv, config, tmp_path / "stream.csv", chunksize=chunksize)
+
+    pd.testing.assert_frame_equal(result, expected, rtol=1e-9)
+
+
+@pytest.mark.parametrize("read", [{"engine": "pyarrow"}, {"infer_schema_rows": 100}])
+def test_streaming_read_options(tmp_path, large_csv, read):
+    if read.get("engine") == "pyarrow":
+        pytest.importorskip("pyarrow")
+    config = {**_config(), "io": {"read": read}}
+    expected = _in_memory(large_csv, _config(), tmp_path / "memory.csv")
+    result = _streamed(large_csv, config, tmp_path / "stream.csv", chunksize=500)
+
+    # A locked schema widens integer columns to float64
+    pd.testing.assert_frame_equal(result, expected, rtol=1e-9, check_dtype=False)
+
+
+def test_fit_streaming_resolves_drifting_dtypes(drift_csv):
+    params, _ = fit_streaming(drift_csv, _config(), chunksize=2)
+    assert params["dtype"] == {"x": "float64"}
+    assert params["rows_in"] == 5
+
+
+def test_text_values_counted_only_for_mode_fills(large_csv, monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("text values were counted")
+
+    monkeypatch.setattr(pd.Series, "value_counts", fail)
+    config = _config()
+    config["cleaning"]["fill_strategy"]["categorical"] = "constant"
+    params, _ = fit_streaming(large_csv, config, chunksize=500)
+    assert params["fill_values"]["region"] == "Unknown"
+
+    params, _ = fit_streaming(large_csv, _config(), chunksize=500, missing=False)
+    assert params["fill_values"] == {}
+
+
+def test_approximate_mode_fill_uses_top_values_sketch(large_csv):
+    expected, _ = fit_streaming(large_csv, _config(), chunksize=500)
+
+    config = {**_config(), "profiling": {"approximate": True}}
+    result, _ = fit_streaming(large_csv, config, chunksize=500)
+
+    assert result["fill_values"]["region"] == expected["fill_values"]["region"]